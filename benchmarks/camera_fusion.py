@@ -0,0 +1,119 @@
+"""Merging SSL-Vision cameras: cost per camera frame and error of the merged positions, for 4 and 8 camera feeds.
+
+Robots and the ball move in circles over a 9x6 m field split in a grid of overlapping cameras, each capturing at
+60 Hz with its own phase and noise. The errors are measured against the true positions at the time each merged
+frame is aligned to, for the camera fusion and for the old merge where the last camera to see an object wins.
+
+Usage: python -m benchmarks.camera_fusion [--duration SECONDS]
+"""
+import argparse
+import math
+import random
+import time
+
+from neonfc_ssl.input_layer.camera_fusion import CameraFusion, CameraFrame
+from neonfc_ssl.input_layer.input_data import Ball, Robot, Entities
+
+FIELD = (9.0, 6.0)  # m
+OVERLAP = 0.3  # m, each camera sees this far into its neighbours
+RATE = 60  # Hz, per camera
+NOISE = 0.005  # m
+ROBOTS_PER_TEAM = 11
+GRIDS = {4: (2, 2), 8: (4, 2)}
+
+
+def truth(t: float) -> tuple[tuple[float, float], dict[tuple[str, int], tuple[float, float, float]]]:
+    """Ball and robot (team, id) positions at time t"""
+    ball = (3.5 * math.cos(0.8 * t), 2.5 * math.sin(1.1 * t))
+    robots = {}
+    for team, sign in (('blue', -1), ('yellow', 1)):
+        for i in range(ROBOTS_PER_TEAM):
+            phase = 2 * math.pi * i / ROBOTS_PER_TEAM
+            cx, cy = sign * (0.5 + 3.5 * (i % 3) / 2), 2.4 * math.sin(phase)
+            x, y = cx + 0.4 * math.cos(1.5 * t + phase), cy + 0.4 * math.sin(1.5 * t + phase)
+            robots[team, i] = (x, y, 1.5 * t + phase)
+    return ball, robots
+
+
+def camera_frames(cameras: int, duration: float, seed: int = 0):
+    """Yields the frames of every camera in capture order"""
+    rng = random.Random(seed)
+    columns, rows = GRIDS[cameras]
+    width, height = FIELD[0] / columns, FIELD[1] / rows
+    views = []
+    for c in range(cameras):
+        x0, y0 = -FIELD[0] / 2 + (c % columns) * width, -FIELD[1] / 2 + (c // columns) * height
+        views.append((x0 - OVERLAP, y0 - OVERLAP, x0 + width + OVERLAP, y0 + height + OVERLAP))
+    phases = [rng.uniform(0, 1 / RATE) for _ in range(cameras)]
+
+    captures = sorted((k / RATE + phases[c], c) for c in range(cameras) for k in range(int(duration * RATE)))
+    for t, c in captures:
+        x0, y0, x1, y1 = views[c]
+        (bx, by), robots = truth(t)
+        frame = CameraFrame(c, t)
+        if x0 <= bx <= x1 and y0 <= by <= y1:
+            frame.balls.append(Ball(x=bx + rng.gauss(0, NOISE), y=by + rng.gauss(0, NOISE),
+                                    confidence=rng.uniform(0.7, 1), camera_id=c))
+        for (team, i), (x, y, theta) in robots.items():
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                getattr(frame, f"robots_{team}")[i] = Robot(
+                    id=i, team=team, x=x + rng.gauss(0, NOISE), y=y + rng.gauss(0, NOISE),
+                    theta=theta + rng.gauss(0, 0.01), timestamp=t, confidence=rng.uniform(0.7, 1), camera_id=c,
+                )
+        yield frame
+
+
+def last_camera_wins(frames):
+    """The merge the vision receiver used to do, yielding one frame per camera frame"""
+    merged = Entities(None, {}, {})
+    for frame in frames:
+        if frame.balls:
+            merged.ball = frame.balls[0]
+        merged.robots_blue.update(frame.robots_blue)
+        merged.robots_yellow.update(frame.robots_yellow)
+        yield frame.t_capture, merged
+
+
+def fused(frames, fusion: CameraFusion):
+    for frame in frames:
+        if (entities := fusion.add(frame)) is not None:
+            yield fusion.t_capture, entities
+
+
+def errors(merged) -> tuple[int, float, float]:
+    """Frames, mean robot error and mean ball error, in meters"""
+    count, robot_error, robot_count, ball_error = 0, 0.0, 0, 0.0
+    for t, entities in merged:
+        (bx, by), robots = truth(t)
+        for team in ('blue', 'yellow'):
+            for i, robot in getattr(entities, f"robots_{team}").items():
+                x, y, _ = robots[team, i]
+                robot_error += math.hypot(robot.x - x, robot.y - y)
+                robot_count += 1
+        if entities.ball is not None:
+            ball_error += math.hypot(entities.ball.x - bx, entities.ball.y - by)
+        count += 1
+    return count, robot_error / max(robot_count, 1), ball_error / max(count, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of play per scenario")
+    args = parser.parse_args()
+
+    print(f"{'cameras':<9}{'merge':<18}{'frames/s':>10}{'µs/camera frame':>17}{'robot err':>11}{'ball err':>10}")
+    for cameras in GRIDS:
+        frames = list(camera_frames(cameras, args.duration))
+        for name, merge in (('last camera wins', last_camera_wins), ('fusion', lambda f: fused(f, CameraFusion()))):
+            start = time.perf_counter()
+            for _ in merge(frames):
+                pass
+            cost = (time.perf_counter() - start) / len(frames)
+
+            count, robot_error, ball_error = errors(merge(frames))
+            print(f"{cameras:<9}{name:<18}{count / args.duration:>10.1f}{cost * 1e6:>17.1f}"
+                  f"{robot_error * 1000:>9.1f}mm{ball_error * 1000:>8.1f}mm")
+
+
+if __name__ == "__main__":
+    main()
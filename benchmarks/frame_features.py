@@ -0,0 +1,65 @@
+"""Time per frame for every strategy asking for the opponent closest to the ball and the friendly robot first to
+reach it, each strategy computing them on its own vs shared through the frame features, and how often the
+features were reused.
+
+Usage: python -m benchmarks.frame_features [--frames N] [--consumers N]
+"""
+import argparse
+import time
+import numpy as np
+
+from neonfc_ssl.tracking_layer import data as tracking_data
+from neonfc_ssl.tracking_layer.frame_features import FEATURE_STATS
+
+
+def frame(rng) -> tracking_data.MatchData:
+    def team(color):
+        return [tracking_data.TrackedRobot(id=i, color=color, x=x, y=y, theta=0, vx=0, vy=0, vtheta=0, missing=False)
+                for i, (x, y) in enumerate(rng.uniform((0, 0), (9, 6), (11, 2)))]
+
+    x, y = rng.uniform((0, 0), (9, 6))
+    return tracking_data.MatchData(
+        ball=tracking_data.TrackedBall(x=x, y=y, vx=0, vy=0),
+        possession=tracking_data.Possession(None, None, 'blue', 0, np.zeros(2)),
+        game_state=tracking_data.GameState(state=tracking_data.States.RUN),
+        field=tracking_data.Geometry(9, 6, 1, 1, 2),
+        robots=team('blue'),
+        opposites=team('yellow'),
+        is_yellow=False
+    )
+
+
+def each_strategy(data):
+    ball = data.ball
+    sq_dist_to_ball = lambda r: (r.x - ball.x) ** 2 + (r.y - ball.y) ** 2
+    closest_op = min(data.opposites.active, key=sq_dist_to_ball, default=None)
+    first = min(data.robots.active, key=lambda r: r.time_to_ball(ball), default=None)
+    return closest_op, first
+
+
+def shared(data):
+    times = data.features.times_to_ball('robots')
+    return data.features.closest_to_ball('opposites'), data.robots[int(np.argmin(times))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--consumers", type=int, default=6, help="strategies asking for it every frame")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    frames = [frame(rng) for _ in range(args.frames)]
+
+    for name, closest in (('each strategy', each_strategy), ('frame features', shared)):
+        FEATURE_STATS.reset()
+        start = time.perf_counter()
+        for data in frames:
+            for _ in range(args.consumers):
+                closest(data)
+        print(f"{name:<16}{(time.perf_counter() - start) / args.frames * 1e6:>8.1f} µs/frame")
+    print(FEATURE_STATS)
+
+
+if __name__ == "__main__":
+    main()
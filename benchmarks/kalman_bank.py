@@ -0,0 +1,53 @@
+"""Time per frame to filter 32 robots and the ball, one KalmanFilter object each vs the stacked filter bank.
+
+Usage: python -m benchmarks.kalman_bank [--frames N]
+"""
+import argparse
+import time
+import numpy as np
+
+from neonfc_ssl.algorithms.kalman_filter import KalmanFilter
+from neonfc_ssl.tracking_layer.filter_bank import KalmanBank
+
+OBJECTS = 33
+DT = 1 / 60
+
+
+def per_object_filters():
+    filters = []
+    for _ in range(OBJECTS):
+        kf = KalmanFilter(6, 1, 3)  # x, y, theta and their speeds
+        a = np.identity(6)
+        a[:3, 3:] = DT * np.identity(3)
+        kf.change_matrices(A=a, B=np.zeros((6, 1)), C=np.hstack((np.identity(3), np.zeros((3, 3)))))
+        filters.append(kf)
+
+    ctrl = np.zeros((1, 1))
+    return lambda z, observed: [kf(ctrl, z[i].reshape(3, 1)) if observed[i] else kf.predict(ctrl)
+                                for i, kf in enumerate(filters)]
+
+
+def filter_bank():
+    bank = KalmanBank(OBJECTS)
+    return lambda z, observed: bank.step(z, observed, DT)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    measurements = rng.uniform(-4, 4, (args.frames, OBJECTS, 3))
+    observed = rng.random((args.frames, OBJECTS)) < 0.9
+
+    for name, make in (('KalmanFilter x33', per_object_filters), ('KalmanBank', filter_bank)):
+        step = make()
+        start = time.perf_counter()
+        for z, seen in zip(measurements, observed):
+            step(z, seen)
+        print(f"{name:<18}{(time.perf_counter() - start) / args.frames * 1e6:>8.1f} µs/frame")
+
+
+if __name__ == "__main__":
+    main()
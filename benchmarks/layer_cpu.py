@@ -0,0 +1,102 @@
+"""CPU usage of a layer process, idle and fed at the vision rate, with the blocking and the busy-poll run loops.
+
+Usage: python -m benchmarks.layer_cpu [--duration SECONDS] [--rate HZ]
+"""
+import argparse
+import resource
+import time
+from multiprocessing import Pipe, Queue
+from threading import Thread
+
+from neonfc_ssl.core import Layer
+
+
+class EchoLayer(Layer):
+    def __init__(self, config, log_q):
+        super().__init__("EchoLayer", config, log_q)
+
+    def _start(self):
+        pass
+
+    def _step(self, data):
+        return data
+
+
+class BusyPollEchoLayer(EchoLayer):
+    """Reproduces the run loop before it blocked on its inputs, polling them without ever sleeping"""
+
+    def run(self):
+        self._start()
+        while True:
+            self._Layer__process_events()
+            self._Layer__fetch_new_data()
+
+            if self._Layer__new_data:
+                self._Layer__do_execution()
+
+            elif time.time() - self._Layer__last_finished_process >= self.IDLE_LIMIT \
+                    and self._Layer__last_data is not None:
+                self._Layer__do_execution()
+
+
+def _discard(conn):
+    try:
+        while True:
+            conn.recv_bytes()
+    except (EOFError, OSError):
+        pass
+
+
+def _discard_logs(log_q):
+    while True:
+        log_q.get()
+
+
+def _children_cpu() -> float:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def measure(layer_cls: type[EchoLayer], duration: float, rate: float) -> float:
+    """Run a layer for ``duration`` seconds feeding it ``rate`` frames per second, returns its CPU use in %"""
+    log_q = Queue()
+    layer = layer_cls({}, log_q)
+    tail, head = Pipe(duplex=False)
+    layer.bind_input_pipe(tail)
+
+    # keep the output pipe and the log queue flowing so the layer never blocks on a full buffer
+    Thread(target=_discard, args=(layer.output_pipe,), daemon=True).start()
+    Thread(target=_discard_logs, args=(log_q,), daemon=True).start()
+
+    cpu_before = _children_cpu()
+    layer.start()
+
+    end = time.monotonic() + duration
+    while (now := time.monotonic()) < end:
+        if rate > 0:
+            head.send({'t': now})
+            time.sleep(1 / rate)
+        else:
+            time.sleep(end - now)
+
+    layer.terminate()
+    layer.join()
+
+    return 100 * (_children_cpu() - cpu_before) / duration
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per scenario")
+    parser.add_argument("--rate", type=float, default=60.0, help="input frames per second when fed")
+    args = parser.parse_args()
+
+    print(f"{'loop':<12}{'idle':>10}{f'{args.rate:g} Hz':>10}")
+    for name, layer_cls in (('busy-poll', BusyPollEchoLayer), ('blocking', EchoLayer)):
+        idle = measure(layer_cls, args.duration, 0)
+        fed = measure(layer_cls, args.duration, args.rate)
+        print(f"{name:<12}{idle:>9.1f}%{fed:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Time per frame to find the intercept time of every active robot of both teams, one TrackedRobot.time_to_ball
+call each vs the batched TeamArrays.times_to_ball, with the ball still and rolling.
+
+Usage: python -m benchmarks.time_to_ball [--frames N] [--robots N]
+"""
+import argparse
+import time
+import numpy as np
+
+from neonfc_ssl.tracking_layer.tracking_data import TrackedRobot, TrackedBall, RobotList
+
+
+def frames(rng, n: int, robots: int, speed: float):
+    def team(color):
+        return RobotList([TrackedRobot(id=i, color=color, x=x, y=y, theta=0, vx=0, vy=0, vtheta=0, missing=False)
+                          for i, (x, y) in enumerate(rng.uniform((0, 0), (9, 6), (robots, 2)))])
+
+    out = []
+    for _ in range(n):
+        (x, y), (vx, vy) = rng.uniform((0, 0), (9, 6)), rng.normal(0, speed, 2)
+        out.append((TrackedBall(x=x, y=y, vx=vx, vy=vy), team('blue'), team('yellow')))
+    return out
+
+
+def per_robot(ball, robots, opposites):
+    return [r.time_to_ball(ball) for r in robots.actives], [r.time_to_ball(ball) for r in opposites.actives]
+
+
+def batched(ball, robots, opposites):
+    return robots.arrays.times_to_ball(ball), opposites.arrays.times_to_ball(ball)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=1000)
+    parser.add_argument("--robots", type=int, default=11, help="per team")
+    args = parser.parse_args()
+
+    for label, speed in (('still ball', 0.0), ('rolling ball', 2.0)):
+        data = frames(np.random.default_rng(0), args.frames, args.robots, speed)
+        for name, solve in (('time_to_ball', per_robot), ('times_to_ball', batched)):
+            start = time.perf_counter()
+            for frame in data:
+                solve(*frame)
+            print(f"{label:<14}{name:<15}{(time.perf_counter() - start) / args.frames * 1e6:>8.1f} µs/frame")
+
+
+if __name__ == "__main__":
+    main()
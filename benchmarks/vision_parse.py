@@ -0,0 +1,112 @@
+"""Packets per second the vision and referee receivers can parse, with the old JSON round trip and reading the
+protobuf fields directly.
+
+The JSON numbers only count ParseFromString plus json.loads(MessageToJson(...)), which the receivers used to do
+before walking the dicts, so they are an upper bound of the old throughput.
+
+Usage: python -m benchmarks.vision_parse [--duration SECONDS]
+"""
+import argparse
+import json
+import logging
+import time
+
+from google.protobuf.json_format import MessageToJson
+
+from neonfc_ssl.input_layer.sockets import GrSimVision, AutoRefVision
+from neonfc_ssl.input_layer.sockets.ssl_game_controller import SSLGameControllerReferee
+from neonfc_ssl.protocols.grSim.ssl_vision_wrapper_pb2 import SSL_WrapperPacket
+from neonfc_ssl.protocols.gc.ssl_vision_wrapper_tracked_pb2 import TrackerWrapperPacket
+from neonfc_ssl.protocols.gc.ssl_gc_referee_message_pb2 import Referee
+from neonfc_ssl.protocols.gc.ssl_gc_common_pb2 import Team
+
+CONFIG = {'side': 'left', 'multicast_ip': '224.5.23.2', 'vision_port': 10006, 'autoref_port': 10010,
+          'game_controller_ip': '224.5.23.1', 'game_controller_port': 10003}
+ROBOTS_PER_TEAM = 11
+
+
+def grsim_packet() -> bytes:
+    packet = SSL_WrapperPacket()
+    frame = packet.detection
+    frame.frame_number, frame.t_capture, frame.t_sent, frame.camera_id = 1, 1.0, 1.001, 0
+    frame.balls.add(confidence=1, x=100, y=-200, z=0, pixel_x=0, pixel_y=0)
+    for robots in (frame.robots_blue, frame.robots_yellow):
+        for i in range(ROBOTS_PER_TEAM):
+            robots.add(confidence=1, robot_id=i, x=100 * i, y=-50 * i, orientation=0.1 * i, pixel_x=0, pixel_y=0)
+    return packet.SerializeToString()
+
+
+def autoref_packet() -> bytes:
+    packet = TrackerWrapperPacket(uuid="benchmark")
+    frame = packet.tracked_frame
+    frame.frame_number, frame.timestamp = 1, 1.0
+    ball = frame.balls.add()
+    ball.pos.x, ball.pos.y, ball.pos.z = 0.1, -0.2, 0
+    ball.vel.x, ball.vel.y, ball.vel.z = 1.0, 0.5, 0
+    for team in (Team.BLUE, Team.YELLOW):
+        for i in range(ROBOTS_PER_TEAM):
+            robot = frame.robots.add(orientation=0.1 * i, vel_angular=0)
+            robot.robot_id.id, robot.robot_id.team = i, team
+            robot.pos.x, robot.pos.y = 0.1 * i, -0.05 * i
+            robot.vel.x, robot.vel.y = 0.2, 0
+    return packet.SerializeToString()
+
+
+def referee_packet() -> bytes:
+    packet = Referee(packet_timestamp=1, stage=Referee.NORMAL_FIRST_HALF, command=Referee.DIRECT_FREE_BLUE,
+                     command_counter=3, command_timestamp=1)
+    for team in (packet.yellow, packet.blue):
+        team.name, team.score, team.red_cards, team.yellow_cards = "team", 0, 0, 0
+        team.timeouts, team.timeout_time, team.goalkeeper = 4, 300, 0
+    packet.designated_position.x, packet.designated_position.y = 1000, -500
+    return packet.SerializeToString()
+
+
+def rate(parse, data: bytes, duration: float) -> float:
+    count, end = 0, time.monotonic() + duration
+    while time.monotonic() < end:
+        for _ in range(100):
+            parse(data)
+        count += 100
+    return count / duration
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds per scenario")
+    args = parser.parse_args()
+
+    logger = logging.getLogger("benchmark")
+    grsim, autoref = GrSimVision(CONFIG, logger), AutoRefVision(CONFIG, logger)
+    referee = SSLGameControllerReferee(CONFIG, logger)
+    for vision in (grsim, autoref):
+        vision.receiver.is_late = lambda *_: False  # the same packet is parsed over and over, it isn't late
+
+    def parsed(packet_cls):
+        def parse(data):
+            packet = packet_cls()
+            packet.ParseFromString(data)
+            return packet
+        return parse
+
+    def json_round_trip(packet_cls):
+        return lambda data: json.loads(MessageToJson(parsed(packet_cls)(data)))
+
+    scenarios = (
+        ('grSim vision', grsim_packet(), SSL_WrapperPacket,
+         lambda d: grsim.update_detection(parsed(SSL_WrapperPacket)(d))),
+        ('AutoRef vision', autoref_packet(), TrackerWrapperPacket,
+         lambda d: autoref.update_detection(parsed(TrackerWrapperPacket)(d))),
+        # after the first one the packets repeat the same command, as the game controller does, and aren't parsed
+        ('referee', referee_packet(), Referee, lambda d: referee.update_referee(d) or referee.get_data()),
+    )
+
+    print(f"{'receiver':<16}{'json':>12}{'direct':>12}")
+    for name, data, packet_cls, direct in scenarios:
+        before = rate(json_round_trip(packet_cls), data, args.duration)
+        after = rate(direct, data, args.duration)
+        print(f"{name:<16}{before:>10.0f}/s{after:>10.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
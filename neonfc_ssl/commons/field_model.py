@@ -0,0 +1,81 @@
+from functools import lru_cache
+from typing import NamedTuple, TYPE_CHECKING
+if TYPE_CHECKING:
+    from neonfc_ssl.input_layer.input_data import Geometry
+
+# what the path planning keeps away from besides the areas, in meters
+GOAL_POST_THICKNESS = 0.02
+GOAL_DEPTH = 0.18
+GOAL_OBSTACLE_WIDTH = 1
+ROBOT_RADIUS = 0.09
+OUTSIDE = 12  # how far the field limits obstacles extend outwards
+
+
+class Rect(NamedTuple):
+    """Axis aligned rectangle, from its lower left corner (unpacks as point_in_rect expects)"""
+    x: float
+    y: float
+    width: float
+    height: float
+
+    @property
+    def x_max(self) -> float:
+        return self.x + self.width
+
+    @property
+    def y_max(self) -> float:
+        return self.y + self.height
+
+    @property
+    def obstacle(self) -> tuple[tuple[float, float], float, float]:
+        """As the arguments of a path planning static obstacle"""
+        return (self.x, self.y), self.width, self.height
+
+    def contains(self, x: float, y: float) -> bool:
+        """Whether the point is inside or on the border"""
+        return self.x <= x <= self.x_max and self.y <= y <= self.y_max
+
+
+class FieldModel:
+    """Field shapes derived from a Geometry, in the tracking frame (friendly goal at x = 0, field from y = 0 up).
+
+    Get it with ``field_model(geometry)``, which only builds a new one when the geometry changes.
+    """
+
+    def __init__(self, geometry: 'Geometry'):
+        self.geometry = geometry
+        self.version = geometry.version
+
+        length, width = geometry.field_length, geometry.field_width
+        self.half_length = length / 2
+        self.half_width = width / 2
+        self.center = (self.half_length, self.half_width)
+
+        self.goal_y_min = (width - geometry.goal_width) / 2
+        self.goal_y_max = (width + geometry.goal_width) / 2
+        self.friendly_goal_posts = ((0, self.goal_y_min), (0, self.goal_y_max))
+        self.opponent_goal_posts = ((length, self.goal_y_min), (length, self.goal_y_max))
+
+        area_y = (width - geometry.penalty_width) / 2
+        self.friendly_area = Rect(0, area_y, geometry.penalty_depth, geometry.penalty_width)
+        self.opponent_area = Rect(length - geometry.penalty_depth, area_y, geometry.penalty_depth,
+                                  geometry.penalty_width)
+
+        r, out = ROBOT_RADIUS, OUTSIDE
+        # static obstacles of the path planning, other than the friendly area which only some skills avoid
+        self.obstacles = (
+            # friendly goal posts
+            Rect(-r - GOAL_DEPTH - GOAL_POST_THICKNESS, self.half_width - r - GOAL_OBSTACLE_WIDTH / 2,
+                 2 * r + GOAL_POST_THICKNESS + GOAL_DEPTH, 2 * r + GOAL_OBSTACLE_WIDTH).obstacle,
+            self.opponent_area.obstacle,
+            # field limits: lower, right, upper and left
+            Rect(-out, -out, length + 2 * out, out + r).obstacle,
+            Rect(length - r, 0, out, geometry.penalty_width).obstacle,
+            Rect(-out, width - r, length + 2 * out, out).obstacle,
+            Rect(-out, 0, out + r, width).obstacle,
+        )
+
+
+@lru_cache(maxsize=4)
+def field_model(geometry: 'Geometry') -> FieldModel:
+    return FieldModel(geometry)
@@ -0,0 +1,185 @@
+import math
+from collections import deque
+from typing import Optional
+
+INVALID_SIZE_ERROR = "Window size must be positive, got {}"
+INVALID_DURATION_ERROR = "Window duration must be positive, got {}"
+INVALID_ALPHA_ERROR = "Smoothing factor must be in (0, 1], got {}"
+
+
+class _Sum:
+    """Running sum of a window of samples, removing a sample is as cheap as adding one.
+
+    Non finite samples are counted apart so one inf or nan only spoils the mean while it is in the window, as
+    summing the window again would. The finite sum is recomputed every ``refresh`` removals, so rounding errors
+    don't pile up.
+    """
+
+    def __init__(self, refresh: int):
+        self.refresh = refresh
+        self.total = 0.0
+        self._nan = self._pos_inf = self._neg_inf = 0
+        self._removed = 0
+
+    def add(self, x: float, sign: int = 1):
+        if math.isfinite(x):
+            self.total += sign * x
+        elif math.isnan(x):
+            self._nan += sign
+        elif x > 0:
+            self._pos_inf += sign
+        else:
+            self._neg_inf += sign
+
+    def remove(self, x: float, window):
+        """Takes out ``x``, already gone from the remaining ``window``"""
+        self.add(x, -1)
+        self._removed += 1
+        if self._removed >= self.refresh:
+            self._removed = 0
+            self.total = math.fsum(v for v in window if math.isfinite(v))
+
+    def mean(self, n: int) -> float:
+        if not n or self._nan or (self._pos_inf and self._neg_inf):
+            return math.nan
+        if self._pos_inf:
+            return math.inf
+        if self._neg_inf:
+            return -math.inf
+        return self.total / n
+
+
+class _Extrema:
+    """Windowed min and max with monotonic queues of (key, value), keys only grow (sample count or time)"""
+
+    def __init__(self):
+        self._min = deque()
+        self._max = deque()
+
+    def add(self, key, x: float):
+        if math.isnan(x):  # not comparable, left out
+            return
+        while self._min and self._min[-1][1] >= x:
+            self._min.pop()
+        self._min.append((key, x))
+        while self._max and self._max[-1][1] <= x:
+            self._max.pop()
+        self._max.append((key, x))
+
+    def evict(self, oldest_key):
+        """Drops the samples with a key before ``oldest_key``"""
+        for q in (self._min, self._max):
+            while q and q[0][0] < oldest_key:
+                q.popleft()
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._min[0][1] if self._min else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._max[0][1] if self._max else None
+
+
+class RollingWindow:
+    """Mean, min and max of the last ``size`` samples, each ``add`` in O(1) (amortized)"""
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError(INVALID_SIZE_ERROR.format(size))
+        self.size = size
+        self._window = deque()
+        self._sum = _Sum(refresh=size)
+        self._extrema = _Extrema()
+        self._count = 0  # samples ever added, the key of the extrema
+
+    def add(self, x: float):
+        self._window.append(x)
+        self._sum.add(x)
+        if len(self._window) > self.size:
+            self._sum.remove(self._window.popleft(), self._window)
+
+        self._extrema.add(self._count, x)
+        self._count += 1
+        self._extrema.evict(self._count - self.size)
+
+    def __len__(self):
+        return len(self._window)
+
+    @property
+    def mean(self) -> float:
+        """nan while empty"""
+        return self._sum.mean(len(self._window))
+
+    @property
+    def min(self) -> Optional[float]:
+        """None while empty, nan samples are left out"""
+        return self._extrema.min
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._extrema.max
+
+
+class TimeWindow:
+    """Mean, min and max of the samples of the last ``duration`` seconds, each ``add`` in O(1) (amortized).
+
+    Sample times must not go backwards. A sample is in the window while it is at most ``duration`` older than the
+    latest one.
+    """
+
+    def __init__(self, duration: float):
+        if duration <= 0:
+            raise ValueError(INVALID_DURATION_ERROR.format(duration))
+        self.duration = duration
+        self._times = deque()
+        self._values = deque()
+        self._sum = _Sum(refresh=1024)
+        self._extrema = _Extrema()
+
+    def add(self, t: float, x: float):
+        self._times.append(t)
+        self._values.append(x)
+        self._sum.add(x)
+        self._extrema.add(t, x)
+
+        oldest = t - self.duration
+        while self._times[0] < oldest:
+            self._times.popleft()
+            self._sum.remove(self._values.popleft(), self._values)
+        self._extrema.evict(oldest)
+
+    def __len__(self):
+        return len(self._values)
+
+    @property
+    def mean(self) -> float:
+        """nan while empty"""
+        return self._sum.mean(len(self._values))
+
+    @property
+    def min(self) -> Optional[float]:
+        """None while empty, nan samples are left out"""
+        return self._extrema.min
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._extrema.max
+
+
+class ExponentialMean:
+    """Exponentially weighted mean, each sample weights ``alpha`` and the previous mean ``1 - alpha``"""
+
+    def __init__(self, alpha: float):
+        if not 0 < alpha <= 1:
+            raise ValueError(INVALID_ALPHA_ERROR.format(alpha))
+        self.alpha = alpha
+        self.mean = math.nan  # until the first sample
+
+    @classmethod
+    def from_span(cls, samples: float) -> 'ExponentialMean':
+        """Weighted like a rolling mean of about ``samples`` samples"""
+        return cls(2 / (samples + 1))
+
+    def add(self, x: float):
+        self.mean = x if math.isnan(self.mean) else self.mean + self.alpha * (x - self.mean)
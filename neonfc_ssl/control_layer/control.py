@@ -3,8 +3,10 @@ import numpy as np
 from math import sqrt, cos, sin
 from neonfc_ssl.core import Layer
 from neonfc_ssl.commons.math import reduce_ang
+from neonfc_ssl.commons.field_model import field_model
 from neonfc_ssl.path_planning.drunk_walk import DrunkWalk
 from .control_data import ControlData, RobotCommand
+from .control_codec import ControlDataCodec
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -13,6 +15,9 @@ if TYPE_CHECKING:
 
 
 class Control(Layer):
+    OUTPUT_CODEC = ControlDataCodec
+    TRACE_STAGE = 'control'
+
     def __init__(self, config, log_q) -> None:
         super().__init__("ControlLayer", config, log_q)
 
@@ -52,81 +57,33 @@ class Control(Layer):
 
     def run_single_robot(self, data: 'MatchData', command: 'RobotRubric') -> RobotCommand:
         robot = data.robots[command.id]
-        field = data.field
 
         path_planning = DrunkWalk()
         path_planning.start((robot.x, robot.y), command.target_pose[:2])
 
-        post_thickness = 0.02
-        goal_depht = 0.18
-        goal_height = 1
-        r = 0.09
-        L = 12
-        m = 0
+        field = field_model(data.field)
 
         # -- Friendly Goalkeeper Area -- #
         if command.avoid_area:
-            path_planning.add_static_obstacle(
-                (0, field.field_width / 2 - field.penalty_width / 2),
-                field.penalty_depth,
-                field.penalty_width
-            )
-        # -- Friendly Goal Posts -- #
-        path_planning.add_static_obstacle(
-            (-r - goal_depht - post_thickness, field.field_width / 2 - r - goal_height / 2),
-            2 * r + post_thickness + goal_depht,
-            2 * r + goal_height
-        )
-        # -- Opponent Goalkeeper Area -- #
-        path_planning.add_static_obstacle(
-            (field.field_length - field.penalty_depth,
-             field.field_width / 2 - field.penalty_width / 2),
-            field.penalty_depth,
-            field.penalty_width
-        )
-        # # -- Opponent Goal Posts -- #
-        # path_planning.add_static_obstacle(
-        #     (-1, -1),
-        #     self._field.fieldLength + 2,
-        #     0.7
-        # )
-        # -- Lower Field Limit -- #
-        path_planning.add_static_obstacle(
-            (-L - m, -L - m),
-            field.field_length + 2 * (m + L),
-            L + r
-        )
-        # -- Right Field Limit -- #
-        path_planning.add_static_obstacle(
-            (field.field_length + m - r, -m),
-            L,
-            field.penalty_width + 2 * m
-        )
-        # -- Upper Field Limit -- #
-        path_planning.add_static_obstacle(
-            (-L - m, field.field_width + m - r),
-            field.field_length + 2 * (m + L),
-            L
-        )
-        # -- Left Field Limit -- #
-        path_planning.add_static_obstacle(
-            (-L - m, -m),
-            L + r,
-            field.field_width + 2 * m
-        )
-
-        # -- Opponent Robots -- #
-        for opp in command.avoid_opponents:
-            opp = data.opposites[opp]
-            path_planning.add_dynamic_obstacle(opp, 0.2, np.array((opp.vx, opp.vy)))
-
-        # -- Friendly Robots -- #
-        for rob in command.avoid_allies:
-            if rob == command.id:
-                continue
-
-            rob = data.robots[rob]
-            path_planning.add_dynamic_obstacle(rob, 0.2, np.array((rob.vx, rob.vy)))
+            path_planning.add_static_obstacle(*field.friendly_area.obstacle)
+        # -- Goal posts, opponent goalkeeper area and field limits -- #
+        for obstacle in field.obstacles:
+            path_planning.add_static_obstacle(*obstacle)
+
+        # degraded mode plans around the static obstacles only, robots are the bulk of the planning cost
+        if not self.degraded:
+            # -- Opponent Robots -- #
+            for opp in command.avoid_opponents:
+                opp = data.opposites[opp]
+                path_planning.add_dynamic_obstacle(opp, 0.2, np.array((opp.vx, opp.vy)))
+
+            # -- Friendly Robots -- #
+            for rob in command.avoid_allies:
+                if rob == command.id:
+                    continue
+
+                rob = data.robots[rob]
+                path_planning.add_dynamic_obstacle(rob, 0.2, np.array((rob.vx, rob.vy)))
 
         next_point = path_planning.find_path()
 
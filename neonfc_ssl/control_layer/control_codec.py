@@ -0,0 +1,45 @@
+import struct
+from neonfc_ssl.core.transport.frame_codec import FrameCodec, MAX_ROBOTS_PER_TEAM, check_robot_count
+from neonfc_ssl.core.trace import encode_trace, decode_trace, TRACE_SIZE
+from .control_data import ControlData, RobotCommand
+
+# number of commands
+_HEADER = struct.Struct('<B')
+# id, is_yellow, vel_tangent, vel_normal, vel_angular, kick_x, kick_z, spinner
+_COMMAND = struct.Struct('<B?5d?')
+
+
+class ControlDataCodec(FrameCodec):
+    size = _HEADER.size + MAX_ROBOTS_PER_TEAM * _COMMAND.size + TRACE_SIZE
+
+    @classmethod
+    def encode_into(cls, data: ControlData, buf: memoryview, offset: int = 0) -> int:
+        start = offset
+        check_robot_count(cls, len(data.commands))
+
+        _HEADER.pack_into(buf, offset, len(data.commands))
+        offset += _HEADER.size
+
+        for cmd in data.commands:
+            _COMMAND.pack_into(
+                buf, offset, cmd.id, cmd.is_yellow,
+                cmd.vel_tangent, cmd.vel_normal, cmd.vel_angular,
+                cmd.kick_x, cmd.kick_z, cmd.spinner
+            )
+            offset += _COMMAND.size
+
+        offset += encode_trace(data.trace, buf, offset)
+
+        return offset - start
+
+    @classmethod
+    def decode(cls, buf: bytes | memoryview, offset: int = 0) -> ControlData:
+        n_commands, = _HEADER.unpack_from(buf, offset)
+        offset += _HEADER.size
+
+        commands = []
+        for _ in range(n_commands):
+            commands.append(RobotCommand(*_COMMAND.unpack_from(buf, offset)))
+            offset += _COMMAND.size
+
+        return ControlData(commands=commands, trace=decode_trace(buf, offset))
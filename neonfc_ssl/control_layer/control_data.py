@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    from neonfc_ssl.core.trace import FrameTrace
 
 
 @dataclass
@@ -19,3 +22,4 @@ class RobotCommand:
 @dataclass
 class ControlData:
     commands: list[RobotCommand]
+    trace: Optional['FrameTrace'] = None
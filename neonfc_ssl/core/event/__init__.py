@@ -2,4 +2,5 @@ from .event_definitions import EventType, EventError, Event
 from .event_socket import EventSocket
 from .event_parser import EventParser
 from .event_engine import EventEngine
+from .event_queue import EventQueue
 from .event_handler import EventHandler, event_callback
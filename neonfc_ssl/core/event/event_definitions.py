@@ -5,6 +5,7 @@ from datetime import datetime
 
 class EventType(enum.Enum):
     MASTER_STATE = "MasterState"
+    NEW_MATCH = "NewMatch"
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,46 @@
+import os
+from multiprocessing import Pipe, SimpleQueue
+from typing import Any
+
+
+class EventQueue:
+    """Queue of events for a layer process, with a doorbell the layer can sleep on.
+
+    Offers the ``put``, ``get`` and ``empty`` of a multiprocessing queue. An event is written to the queue before the
+    doorbell rings, so once ``fileno`` becomes readable (e.g. through ``multiprocessing.connection.wait``) the event
+    can already be read. Like the shared memory ring doorbell, it never carries the event itself.
+    """
+
+    def __init__(self):
+        self._queue = SimpleQueue()
+        self._bell_rx, self._bell_tx = Pipe(duplex=False)
+        # a full doorbell already guarantees the layer will wake up, so putting an event must never block on it
+        os.set_blocking(self._bell_tx.fileno(), False)
+
+    def put(self, event: Any):
+        self._queue.put(event)
+        try:
+            self._bell_tx.send_bytes(b'')
+        except BlockingIOError:
+            pass
+
+    def get(self) -> Any:
+        return self._queue.get()
+
+    def empty(self) -> bool:
+        return self._queue.empty()
+
+    def fileno(self) -> int:
+        """File descriptor that becomes readable when an event is put"""
+        return self._bell_rx.fileno()
+
+    def clear(self):
+        """Silence the doorbell, done before reading the queued events so a later put rings it again"""
+        fd = self.fileno()
+        while self._bell_rx.poll():
+            os.read(fd, 4096)
+
+    def close(self):
+        self._queue.close()
+        self._bell_rx.close()
+        self._bell_tx.close()
@@ -0,0 +1,2 @@
+from .gamelog_index import IndexEntry, INDEX_SUFFIX, NO_FRAME
+from .gamelog_reader import GamelogReader
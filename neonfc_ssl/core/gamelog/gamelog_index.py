@@ -0,0 +1,51 @@
+import struct
+from typing import NamedTuple
+
+# Game log v2. The data file is still a stream of LogEntry messages prefixed with their 4-byte big-endian length, so
+# v1 readers keep working, and a sidecar index next to it holds one fixed size entry per record. Compressed logs start
+# with COMPRESSED_MAGIC and hold zlib blocks instead, each prefixed with its compressed length and holding a batch of
+# length-prefixed records.
+COMPRESSED_MAGIC = b"NFCLOGZ\x01"
+INDEX_SUFFIX = ".idx"
+INDEX_MAGIC = b"NFCIDX"
+INDEX_VERSION = 2
+INDEX_HEADER = struct.Struct('<6sH')
+# offset of the record (its length prefix) in the data file, or of its block and of the record in the decompressed
+# block for compressed logs, payload length, timestamp, frame, source, level, flags
+INDEX_ENTRY = struct.Struct('<QIIdqBBBx')
+LENGTH_PREFIX = 4
+
+NO_FRAME = -1
+
+# record flags
+TRACKING_DELTA = 1  # the record holds a tracking_delta instead of the full tracking
+KEYFRAME = 2  # ... and it's a keyframe
+
+
+class IndexEntry(NamedTuple):
+    """Where a record is in the data file and what it is.
+
+    Layer records reach the game log in batches, so they aren't strictly ordered by time or frame. ``timestamp`` and
+    ``frame`` are the latest ones logged up to this record, which never decrease and can be searched in O(log n).
+    """
+    offset: int
+    position: int
+    length: int
+    timestamp: float
+    frame: int
+    source: int
+    level: int
+    flags: int
+
+
+def index_header() -> bytes:
+    return INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION)
+
+
+def record_frame(record) -> int:
+    """Vision frame a log record refers to, taken from the trace of the logged data"""
+    if (frame := getattr(record, 'frame_id', None)) is not None:
+        return frame
+
+    trace = getattr(record.msg, 'trace', None)
+    return NO_FRAME if trace is None else trace.frame_id
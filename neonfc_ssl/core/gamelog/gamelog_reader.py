@@ -0,0 +1,217 @@
+import mmap
+import os
+import zlib
+from bisect import bisect_left
+from typing import Iterator, Optional
+
+from neonfc_ssl.protocols.internal import NeonFCProtobuf
+from .gamelog_index import (INDEX_SUFFIX, INDEX_MAGIC, INDEX_VERSION, INDEX_HEADER, INDEX_ENTRY, LENGTH_PREFIX,
+                            COMPRESSED_MAGIC, NO_FRAME, TRACKING_DELTA, KEYFRAME, IndexEntry, index_header)
+from .tracking_delta import TrackingDeltaDecoder
+
+INVALID_INDEX_ERROR = "{} isn't a game log v{} index"
+TRUNCATED_LOG_ERROR = "{} ends with a truncated record at byte {}"
+MISSING_KEYFRAME_ERROR = "No tracking keyframe before record {}"
+
+
+class GamelogReader:
+    """Random access to a game log.
+
+    The data file is memory mapped and records are located through the sidecar index written by
+    ``BinaryFileHandler``, so any record, frame or time can be reached in O(log n) without reading what comes
+    before it. Logs without an index (v1) are scanned once to build it in memory, ``save_index`` writes it next to
+    the log so the next open is instant.
+
+    Compressed blocks and tracking deltas are undone transparently, records always come back with the full
+    ``tracking`` frame. Reaching a delta decodes from the keyframe before it, reading in order only decodes each
+    frame once.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self.compressed = self._data[:len(COMPRESSED_MAGIC)] == COMPRESSED_MAGIC
+
+        self._block_offset, self._block = None, b''  # last decompressed block
+        self._decoders = {}  # source -> (position of the last decoded delta, decoder)
+
+        self._index_file = None
+        if os.path.exists(path + INDEX_SUFFIX):
+            self._index = self._map_index(path + INDEX_SUFFIX)
+        else:
+            self._index = index_header() + self._build_index()
+
+        self._len = (len(self._index) - INDEX_HEADER.size) // INDEX_ENTRY.size
+        # the index is written after the data, anything past the data is from a crash mid write
+        while self._len and self._end(self._len - 1) > len(self._data):
+            self._len -= 1
+
+    def _map_index(self, path):
+        self._index_file = open(path, 'rb')
+        index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ) \
+            if os.fstat(self._index_file.fileno()).st_size else b''
+
+        if len(index) < INDEX_HEADER.size or INDEX_HEADER.unpack_from(index) != (INDEX_MAGIC, INDEX_VERSION):
+            raise ValueError(INVALID_INDEX_ERROR.format(path, INDEX_VERSION))
+
+        return index
+
+    def _scan(self) -> Iterator[tuple[int, int, bytes]]:
+        """Offset, position and payload of every record, following the data file"""
+        if not self.compressed:
+            for position, payload in self._records(self._data, 0):
+                yield position, 0, payload
+            return
+
+        offset = len(COMPRESSED_MAGIC)
+        while offset < len(self._data):
+            block = self._read_block(offset)
+            for position, payload in self._records(block, offset):
+                yield offset, position, payload
+            offset += LENGTH_PREFIX + self._block_length(offset)
+
+    def _records(self, data, offset) -> Iterator[tuple[int, bytes]]:
+        position = 0
+        while position < len(data):
+            start = position + LENGTH_PREFIX
+            length = int.from_bytes(data[position:start], 'big')
+            if start + length > len(data):
+                raise ValueError(TRUNCATED_LOG_ERROR.format(self.path, offset + position))
+
+            yield position, data[start:start + length]
+            position = start + length
+
+    def _build_index(self) -> bytearray:
+        index, timestamp = bytearray(), 0.0
+        for offset, position, payload in self._scan():
+            entry = NeonFCProtobuf.LogEntry.FromString(payload)
+            # the formatter stores the local time as if it were UTC, ToDatetime gives it back as the local time
+            timestamp = max(timestamp, entry.timestamp.ToDatetime().timestamp())
+            flags = 0
+            if entry.HasField('tracking_delta'):
+                flags = TRACKING_DELTA | (KEYFRAME if entry.tracking_delta.keyframe else 0)
+            index += INDEX_ENTRY.pack(offset, position, len(payload), timestamp, NO_FRAME, entry.source, entry.level,
+                                      flags)
+
+        return index
+
+    def _block_length(self, offset: int) -> int:
+        return int.from_bytes(self._data[offset:offset + LENGTH_PREFIX], 'big')
+
+    def _read_block(self, offset: int) -> bytes:
+        if offset != self._block_offset:
+            start = offset + LENGTH_PREFIX
+            length = self._block_length(offset)
+            if start + length > len(self._data):
+                raise ValueError(TRUNCATED_LOG_ERROR.format(self.path, offset))
+
+            self._block_offset, self._block = offset, zlib.decompress(self._data[start:start + length])
+
+        return self._block
+
+    def _end(self, i: int) -> int:
+        entry = self.entry(i)
+        if not self.compressed:
+            return entry.offset + LENGTH_PREFIX + entry.length
+
+        if entry.offset + LENGTH_PREFIX > len(self._data):
+            return entry.offset + LENGTH_PREFIX
+        return entry.offset + LENGTH_PREFIX + self._block_length(entry.offset)
+
+    def __len__(self):
+        return self._len
+
+    def entry(self, i: int) -> IndexEntry:
+        if not -self._len <= i < self._len:
+            raise IndexError(i)
+
+        position = INDEX_HEADER.size + (i % self._len) * INDEX_ENTRY.size
+        return IndexEntry(*INDEX_ENTRY.unpack_from(self._index, position))
+
+    def raw(self, i: int) -> bytes:
+        """Serialized LogEntry of the i-th record, as stored (tracking frames may be deltas)"""
+        entry = self.entry(i)
+        if self.compressed:
+            data, start = self._read_block(entry.offset), entry.position + LENGTH_PREFIX
+        else:
+            data, start = self._data, entry.offset + LENGTH_PREFIX
+        return data[start:start + entry.length]
+
+    def __getitem__(self, i: int) -> NeonFCProtobuf.LogEntry:
+        if i < 0:
+            i += self._len
+        log_entry = NeonFCProtobuf.LogEntry.FromString(self.raw(i))
+        if log_entry.HasField('tracking_delta'):
+            log_entry.tracking.CopyFrom(self._decode_tracking(i, log_entry.tracking_delta))
+            log_entry.ClearField('tracking_delta')
+
+        return log_entry
+
+    def _decode_tracking(self, i: int, delta):
+        source = self.entry(i).source
+        last, decoder = self._decoders.get(source, (None, None))
+        if last is not None and last >= i:  # the decoder is already past this frame
+            last = None
+
+        # go back to the keyframe, or to the last decoded delta if it comes later
+        start = i
+        while not (start == last or self._is_delta(start, source, KEYFRAME)):
+            start -= 1
+            if start < 0:
+                raise ValueError(MISSING_KEYFRAME_ERROR.format(i))
+        if start != last:
+            decoder = TrackingDeltaDecoder()
+        else:
+            start += 1
+
+        for j in range(start, i):
+            if self._is_delta(j, source):
+                decoder.decode(NeonFCProtobuf.LogEntry.FromString(self.raw(j)).tracking_delta)
+
+        self._decoders[source] = (i, decoder)
+        return decoder.decode(delta)
+
+    def _is_delta(self, i: int, source: int, flags: int = TRACKING_DELTA) -> bool:
+        entry = self.entry(i)
+        return entry.source == source and entry.flags & flags == flags
+
+    def __iter__(self) -> Iterator[NeonFCProtobuf.LogEntry]:
+        return self.read()
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> Iterator[NeonFCProtobuf.LogEntry]:
+        for i in range(start, self._len if stop is None else min(stop, self._len)):
+            yield self[i]
+
+    def find_frame(self, frame: int) -> int:
+        """Position of the first record logged once the pipeline reached ``frame``, ``len(self)`` if it never did"""
+        return bisect_left(range(self._len), frame, key=lambda i: self.entry(i).frame)
+
+    def find_time(self, timestamp: float) -> int:
+        """Position of the first record logged at or after ``timestamp`` (seconds since the epoch)"""
+        return bisect_left(range(self._len), timestamp, key=lambda i: self.entry(i).timestamp)
+
+    def save_index(self):
+        """Writes the index built for a log without one next to it"""
+        if self._index_file is not None:
+            return
+
+        with open(self.path + INDEX_SUFFIX, 'wb') as f:
+            f.write(self._index[:INDEX_HEADER.size + self._len * INDEX_ENTRY.size])
+
+    def close(self):
+        self._block = b''
+        for buffer in (self._data, self._index):
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+        self._file.close()
+        if self._index_file is not None:
+            self._index_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
@@ -0,0 +1,167 @@
+import math
+
+from neonfc_ssl.protocols.internal import TrackingProtobuf
+
+QUANTUM = 1e-3  # m, m/s, rad or rad/s per quantized unit
+# quantized values are clamped so the difference of two of them still fits in a sint32 without reaching NON_FINITE
+QUANTIZED_LIMIT = 2 ** 30 - 1
+# stands for a nan or infinite value, decoded as nan
+NON_FINITE = -2 ** 31
+
+MISSING_KEYFRAME_ERROR = "Tracking delta received before any keyframe"
+
+# fields sent whole, and only when they change
+_FIELDS = ('geometry', 'game_state', 'possession')
+_ROBOT_LISTS = ('robots', 'opposites')
+
+
+def _quantize_value(v: float) -> int:
+    if not math.isfinite(v):
+        return NON_FINITE
+    return max(-QUANTIZED_LIMIT, min(QUANTIZED_LIMIT, round(v / QUANTUM)))
+
+
+def _quantize(pos, vel) -> tuple[int, ...]:
+    return tuple(_quantize_value(v) for v in (pos.x, pos.y, pos.z, vel.x, vel.y, vel.z))
+
+
+def _dequantize(values) -> list[float]:
+    return [math.nan if v == NON_FINITE else v * QUANTUM for v in values]
+
+
+def _fill(msg, values):
+    msg.pos.x, msg.pos.y, msg.pos.z, msg.vel.x, msg.vel.y, msg.vel.z = values
+
+
+class TrackingDeltaEncoder:
+    """Encodes consecutive Tracking frames as TrackingDelta.
+
+    Every ``keyframe_interval`` frames a keyframe holds the whole quantized frame, the frames in between only carry
+    the robots, ball and fields that changed, as differences from the previous frame. A keyframe is also forced
+    when something disappears from the frame (e.g. the ball), which a delta can't express, and after a frame with
+    a nan or infinite value, sent as NON_FINITE, that the next delta can't be taken from.
+    """
+
+    def __init__(self, keyframe_interval: int = 60):
+        self.keyframe_interval = keyframe_interval
+        self.reset()
+
+    def reset(self):
+        """Start over, the next frame is a keyframe"""
+        self._frames = 0
+        self._ball = None
+        self._robots = {name: {} for name in _ROBOT_LISTS}
+        self._fields = {}
+        self._non_finite = False
+
+    def _needs_keyframe(self, tracking) -> bool:
+        if self._frames % self.keyframe_interval == 0 or self._non_finite:
+            return True
+
+        if (self._ball is not None and not tracking.HasField('ball')) \
+                or any(name in self._fields and not tracking.HasField(name) for name in _FIELDS):
+            return True
+
+        return any(
+            [(r.color, r.id) for r in getattr(tracking, name)] != list(self._robots[name]) for name in _ROBOT_LISTS
+        )
+
+    def encode(self, tracking: TrackingProtobuf.Tracking) -> TrackingProtobuf.TrackingDelta:
+        keyframe = self._needs_keyframe(tracking)
+        if keyframe:
+            self.reset()
+        self._frames += 1
+
+        delta = TrackingProtobuf.TrackingDelta(keyframe=keyframe)
+        if keyframe or tracking.team_color != self._fields.get('team_color'):
+            delta.team_color = self._fields['team_color'] = tracking.team_color
+
+        for name in _FIELDS:
+            if tracking.HasField(name) and getattr(tracking, name) != self._fields.get(name):
+                getattr(delta, name).CopyFrom(getattr(tracking, name))
+                self._fields[name] = getattr(tracking, name)
+
+        if tracking.HasField('ball'):
+            state = self._quantize(tracking.ball.pos, tracking.ball.vel)
+            if state != self._ball:
+                _fill(delta.ball, self._difference(state, self._ball))
+                self._ball = state
+
+        for name in _ROBOT_LISTS:
+            previous = self._robots[name]
+            for robot in getattr(tracking, name):
+                key = (robot.color, robot.id)
+                state = self._quantize(robot.pos, robot.vel)
+                if state != previous.get(key):
+                    _fill(getattr(delta, name).add(id=robot.id, color=robot.color),
+                          self._difference(state, previous.get(key)))
+                    previous[key] = state
+
+        return delta
+
+    def _quantize(self, pos, vel) -> tuple[int, ...]:
+        state = _quantize(pos, vel)
+        if NON_FINITE in state:
+            self._non_finite = True
+        return state
+
+    @staticmethod
+    def _difference(state, previous):
+        if previous is None:
+            return state
+        return tuple(NON_FINITE if a == NON_FINITE else a - b for a, b in zip(state, previous))
+
+
+class TrackingDeltaDecoder:
+    """Rebuilds the (quantized) Tracking frames from the TrackingDelta sequence, starting at a keyframe"""
+
+    def __init__(self):
+        self._ready = False
+
+    def decode(self, delta: TrackingProtobuf.TrackingDelta) -> TrackingProtobuf.Tracking:
+        if delta.keyframe:
+            self._ready = True
+            self._ball = None
+            self._robots = {name: {} for name in _ROBOT_LISTS}
+            self._fields = {}
+        elif not self._ready:
+            raise ValueError(MISSING_KEYFRAME_ERROR)
+
+        if delta.HasField('team_color'):
+            self._fields['team_color'] = delta.team_color
+        for name in _FIELDS:
+            if delta.HasField(name):
+                self._fields[name] = getattr(delta, name)
+
+        if delta.HasField('ball'):
+            self._ball = self._apply(delta.ball, self._ball)
+
+        for name in _ROBOT_LISTS:
+            robots = self._robots[name]
+            for robot in getattr(delta, name):
+                key = (robot.color, robot.id)
+                robots[key] = self._apply(robot, robots.get(key))
+
+        return self._frame()
+
+    @staticmethod
+    def _apply(msg, previous):
+        values = (msg.pos.x, msg.pos.y, msg.pos.z, msg.vel.x, msg.vel.y, msg.vel.z)
+        if previous is None:
+            return values
+        return tuple(NON_FINITE if b == NON_FINITE else a + b for a, b in zip(previous, values))
+
+    def _frame(self) -> TrackingProtobuf.Tracking:
+        tracking = TrackingProtobuf.Tracking(team_color=self._fields.get('team_color', 0))
+        for name in _FIELDS:
+            if name in self._fields:
+                getattr(tracking, name).CopyFrom(self._fields[name])
+
+        if self._ball is not None:
+            _fill(tracking.ball, _dequantize(self._ball))
+
+        for name in _ROBOT_LISTS:
+            for (color, robot_id), state in self._robots[name].items():
+                _fill(getattr(tracking, name).add(id=robot_id, color=color), _dequantize(state))
+
+        return tracking
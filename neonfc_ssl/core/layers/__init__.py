@@ -1,2 +1,5 @@
 from .layer import Layer
+from .layer_stats import LayerStats
 from .debug_layer import DebugLayer
+from .inline_pipeline import InlinePipeline
+from .layer_metrics import MetricsSampler, PipelineMetrics, LayerMetrics
@@ -0,0 +1,39 @@
+from typing import Any
+
+from .layer import Layer
+
+
+class InlinePipeline:
+    """Runs a chain of layers one after the other in the calling process.
+
+    Each step output is handed to the next layer as is, without pipes or pickling, and the layer logs go straight
+    to the game handlers. Layers must be created without a log queue. The first layer paces the pipeline (the
+    input layer blocks until new vision data), so there is no idle re-execution on old data as in the
+    multiprocess mode.
+    """
+
+    def __init__(self, layers: list[Layer]):
+        self.layers = layers
+
+    def start(self):
+        for layer in self.layers:
+            layer.start_inline()
+
+    def stop(self):
+        for layer in self.layers:
+            layer.stop_inline()
+
+    def step(self, data: Any = None) -> Any:
+        """Run ``data`` through every layer, stops early if a layer doesn't produce an output"""
+        for layer in self.layers:
+            data = layer.step_inline(data)
+            if data is None:
+                return None
+        return data
+
+    def run(self):
+        while True:
+            self.step()
+
+    def __repr__(self):
+        return "<InlinePipeline {}>".format(" -> ".join(layer.name for layer in self.layers))
@@ -1,25 +1,53 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 from multiprocessing import Process, Pipe, Queue
-from multiprocessing.connection import Connection
+from multiprocessing.connection import Connection, wait
 from abc import ABC, abstractmethod
 from time import time
 import logging
+import signal
 
-from neonfc_ssl.core.logger import LayerHandler
-from neonfc_ssl.core.event import EventHandler
+from neonfc_ssl.core.logger import LayerHandler, InlineHandler, GAME_LOGGER, min_handler_level
+from neonfc_ssl.core.event import EventHandler, EventQueue
+from neonfc_ssl.core.transport import ShmPipe, ShmReader, PipeReader
+from .layer_stats import LayerStats
+from .placement import apply_placement, describe_placement, PLACEMENT_ERROR_LOG, PLACEMENT_LOG
+
+if TYPE_CHECKING:
+    from neonfc_ssl.core.transport import FrameCodec
 
 
 LAYER_START_ERROR_LOG = "Exception during layer {} start"
 BEGIN_START_LOG = "Starting layer {}"
 END_START_LOG = "Layer {} started"
+LAYER_STOP_ERROR_LOG = "Exception during layer {} stop"
+STOP_LOG = "Layer {} stopped"
 LAYER_IDLE_LIMIT_LOG = "Layer {} idle time limit exceeded, forcing start on old data {}"
-LAYER_STEP_TIME_LIMIT_LOG = "Layer {} under-performing, {} Hz"
+LAYER_STEP_OVERRUN_LOG = "Layer {} step took {:.1f} ms, over its {:.1f} ms budget"
+LAYER_DEGRADED_LOG = "Layer {} degraded after overrunning its step budget"
+LAYER_RECOVERED_LOG = "Layer {} back to full mode after {} steps within budget"
+UNKNOWN_TRANSPORT_ERROR = "Unknown transport '{}' for layer {}, expected one of {}"
+UNKNOWN_INPUT_MODE_ERROR = "Unknown input mode '{}' for layer {}, expected one of {}"
+MISSING_CODEC_ERROR = "Layer {} can't use the '{}' transport, it doesn't define an OUTPUT_CODEC"
+UNKNOWN_OVERRUN_POLICY_ERROR = "Unknown overrun policy '{}' for layer {}, expected one of {}"
+
+TRANSPORTS = ('pipe', 'shm')
+# drain: every queued frame is read and only the last one is kept
+# conflated: only the newest frame is deserialized, older ones are skipped
+INPUT_MODES = ('drain', 'conflated')
+# what a layer does with the frame following a step that went over its step budget
+# warn: nothing besides counting and logging the overrun
+# skip: the next frame is dropped without producing an output
+# reuse: the next frame is answered with the last output, without stepping
+# degrade: the layer steps in degraded mode (see Layer.degraded) until it stays within budget for a while
+OVERRUN_POLICIES = ('warn', 'skip', 'reuse', 'degrade')
 
 
 class Layer(Process):
     IDLE_LIMIT = 1 / 60  # s (60 Hz)
+    OUTPUT_CODEC: Optional[type['FrameCodec']] = None  # fixed-layout encoding of the _step output
+    TRACE_STAGE: Optional[str] = None  # FrameTrace stage stamped once _step is done with a frame
 
-    def __init__(self, name: str, config: dict, log_q: Queue):
+    def __init__(self, name: str, config: dict, log_q: Optional[Queue]):
         super().__init__(daemon=True)
         self.name = name
         self.config = config
@@ -28,11 +56,13 @@ class Layer(Process):
         self.logger = self.__setup_logger(
             log_q
         )  # send logs to the main process and eventually to the interface
-        self.__events_q = Queue()  # receive events from the main process possibly originating from the interface
-        self.__input: Connection = None  # last layer pipe tail in the pipeline
-        self.__output_tail, self.__output_head = Pipe(
-            duplex=False
-        )  # output pipe in the pipeline (to the next layer)
+        self.__events_q = EventQueue()  # receive events from the main process possibly originating from the interface
+        self.__input: PipeReader | 'ShmReader' = None  # last layer pipe tail in the pipeline
+        self.__input_mode = self.config.get('input_mode', 'drain')
+        if self.__input_mode not in INPUT_MODES:
+            raise ValueError(UNKNOWN_INPUT_MODE_ERROR.format(self.__input_mode, self.name, INPUT_MODES))
+        # output pipe in the pipeline (to the next layer), either a multiprocessing pipe or a shared memory ring
+        self.__output_tail, self.__output_head = self.__create_output_pipe()
         self.__event_handler = EventHandler(self.logger)
         self.__event_handler.register_from_instance(self)
 
@@ -46,6 +76,19 @@ class Layer(Process):
         self._previous_layer = ""
 
         self.__last_data = None
+        self.__drained_frames = 0
+        self.__stats = LayerStats()  # frame counters shared with the main process
+
+        # step deadline variables
+        self.__step_budget = self.config.get('step_budget', self.IDLE_LIMIT)  # s
+        self.__overrun_policy = self.config.get('overrun_policy', 'warn')
+        if self.__overrun_policy not in OVERRUN_POLICIES:
+            raise ValueError(UNKNOWN_OVERRUN_POLICY_ERROR.format(self.__overrun_policy, self.name, OVERRUN_POLICIES))
+        self.__degrade_recovery = self.config.get('degrade_recovery', 30)  # steps within budget to leave degraded mode
+        self.__overrun = False
+        self.__degraded = False
+        self.__steps_within_budget = 0
+        self.__last_output = None
 
     @property
     def subscriptions(self):
@@ -55,27 +98,77 @@ class Layer(Process):
     def events_q(self):
         return self.__events_q
 
-    def __setup_logger(self, log_q: Queue) -> logging.Logger:
+    @property
+    def stats(self) -> LayerStats:
+        return self.__stats
+
+    @property
+    def degraded(self) -> bool:
+        """Whether _step should switch to a cheaper mode, only ever set under the 'degrade' overrun policy"""
+        return self.__degraded
+
+    def __setup_logger(self, log_q: Optional[Queue]) -> logging.Logger:
         lgg = logging.getLogger(self.name)
-        lgg.setLevel(logging.NOTSET)
+        # records no game handler accepts are dropped before being built, let alone serialized
+        lgg.setLevel(min_handler_level(logging.getLogger(GAME_LOGGER)))
         lgg.propagate = False  # to avoid double logging
-        lgg.addHandler(LayerHandler(log_q))
+        # without a queue the layer runs inline, in the same process as the game handlers
+        if log_q is not None:
+            lgg.addHandler(LayerHandler(log_q, self.config.get('log_batch_period', 0.02)))
+        else:
+            lgg.addHandler(InlineHandler(logging.getLogger(GAME_LOGGER)))
 
         return lgg
 
-    def bind_input_pipe(self, pipe):
-        self.__input = pipe
+    def __create_output_pipe(self):
+        transport = self.config.get('transport', 'pipe')
+
+        if transport == 'pipe':
+            return Pipe(duplex=False)
+
+        if transport == 'shm':
+            if self.OUTPUT_CODEC is None:
+                raise ValueError(MISSING_CODEC_ERROR.format(self.name, transport))
+            return ShmPipe(self.OUTPUT_CODEC, self.config.get('shm_slots', 4))
+
+        raise ValueError(UNKNOWN_TRANSPORT_ERROR.format(transport, self.name, TRANSPORTS))
+
+    def close(self):
+        """Release the output pipe, called by the process that created the layer once the pipeline is stopped.
+
+        A shared memory ring is unlinked too, otherwise its block outlives the game in /dev/shm.
+        """
+        if isinstance(self.__output_tail, ShmReader):
+            self.__output_tail.unlink()
+        self.__output_tail.close()
+        self.__output_head.close()
+        self.__events_q.close()
+
+    def bind_input_pipe(self, pipe: 'Connection | ShmReader'):
+        self.__input = PipeReader(pipe) if isinstance(pipe, Connection) else pipe
 
     def __fetch_new_data(self):
         if self.__input is None:  # when the layers uses input from outside sources
             self.__new_data = True
             return
 
-        while self.__input.poll():
-            self.__new_data = True
+        if not self.__input.poll():
+            return
+
+        if self.__input_mode == 'conflated':
+            self.__last_data = self.__input.recv_latest()
+
+        else:
             self.__last_data = self.__input.recv()
+            while self.__input.poll():
+                self.__last_data = self.__input.recv()
+                self.__drained_frames += 1
 
-    def run(self):
+        self.__new_data = True
+        self.__stats['skipped'] = self.__input.skipped + self.__drained_frames
+        self.__stats['dropped'] = self.__input.dropped
+
+    def __start(self):
         self.logger.info(BEGIN_START_LOG.format(self.name))
         try:
             self._start()
@@ -84,32 +177,140 @@ class Layer(Process):
             raise e
         self.__started = True
         self.logger.info(END_START_LOG.format(self.name))
-        while True:
-            self.__process_events()
 
-            self.__fetch_new_data()
+    def __stop(self):
+        try:
+            self._stop()
+        except Exception:
+            self.logger.exception(LAYER_STOP_ERROR_LOG.format(self.__class__.__name__))
+        self.logger.info(STOP_LOG.format(self.name))
 
-            if self.__new_data:
-                self.__do_execution()
+    @staticmethod
+    def __on_terminate(signum, frame):
+        # Process.terminate sends SIGTERM, exiting through SystemExit lets the layer run its _stop
+        raise SystemExit(0)
 
-            elif (dt := time() - self.__last_finished_process) >= self.IDLE_LIMIT and self.__last_data is not None:
-                self.logger.info(LAYER_IDLE_LIMIT_LOG.format(self.__class__.__name__, 1/dt))
-                self.__do_execution()
+    def start_inline(self):
+        """Start the layer in the calling process instead of a new one, see InlinePipeline.
+
+        The CPU placement settings are not applied, they would be shared by every inline layer.
+        """
+        self.__start()
+
+    def stop_inline(self):
+        """Stop a layer started with start_inline"""
+        self.__stop()
+
+    def step_inline(self, data: Any = None) -> Any:
+        """Execute one step on ``data`` in the calling process and return its output instead of sending it"""
+        self.__process_events()
+        self.__last_data = data
+        self.__stats.add('frames')
+        return self.__execute()
+
+    def __apply_placement(self):
+        for key, value, error in apply_placement(self.config):
+            self.logger.warning(PLACEMENT_ERROR_LOG.format(key, value, self.name, error))
+        self.logger.info(PLACEMENT_LOG.format(self.name, *describe_placement()))
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self.__on_terminate)
+        self.__apply_placement()
+        self.__start()
+        try:
+            while True:
+                self.__wait_for_work()
+
+                self.__process_events()
+
+                self.__fetch_new_data()
+
+                if self.__new_data:
+                    self.__stats.add('frames')
+                    self.__do_execution()
+
+                elif (dt := time() - self.__last_finished_process) >= self.IDLE_LIMIT and self.__last_data is not None:
+                    self.logger.info(LAYER_IDLE_LIMIT_LOG.format(self.__class__.__name__, 1/dt))
+                    self.__do_execution()
+        finally:
+            self.__stop()
+
+    def __wait_for_work(self):
+        """Sleep until new input, an event or the idle deadline, whichever comes first"""
+        if self.__input is None:  # layers fed by outside sources pace themselves inside _step
+            return
+
+        if self.__last_data is None:
+            timeout = None  # nothing to re-execute on, only input or events can wake the layer
+        else:
+            timeout = max(0.0, self.IDLE_LIMIT - (time() - self.__last_finished_process))
+
+        # the events doorbell is rung as soon as the main process puts an event
+        wait([self.__input, self.__events_q], timeout)
 
     def __process_events(self):
+        self.__events_q.clear()
         while not self.__events_q.empty():
-            event = self.__events_q.get(timeout=0.01)
-            self.__event_handler(event)
+            self.__event_handler(self.__events_q.get())
 
     def __do_execution(self):
+        self.__send(self.__execute())
+
+    def __execute(self) -> Any:
         self.__running = True
+        self.__new_data = False
+
+        if self.__overrun and self.__overrun_policy in ('skip', 'reuse'):
+            # shed this frame so the layer catches up with its input
+            self.__overrun = False
+            self.__stats.add('shed')
+            self.__last_finished_process = time()
+            return self.__last_output if self.__overrun_policy == 'reuse' else None
+
         step_execution_begin_time = time()
-        self.__send(self._step(self.__last_data))
+        out = self._step(self.__last_data)
+        self.__trace(out)
         step_execution_end_time = time()
-        self.__new_data = False
-        if (dt := step_execution_end_time - step_execution_begin_time) >= 1/self.IDLE_LIMIT:
-            self.logger.warning(LAYER_STEP_TIME_LIMIT_LOG.format(self.__class__.__name__, 1/dt))
+        self.__check_budget(step_execution_end_time - step_execution_begin_time)
         self.__last_finished_process = step_execution_end_time
+        self.__last_output = out
+        return out
+
+    def __check_budget(self, dt: float):
+        if dt <= self.__step_budget:
+            self.__overrun = False
+            if self.__degraded:
+                self.__steps_within_budget += 1
+                if self.__steps_within_budget >= self.__degrade_recovery:
+                    self.__degraded = False
+                    self.logger.info(LAYER_RECOVERED_LOG.format(self.__class__.__name__, self.__steps_within_budget))
+            return
+
+        self.__stats.add('overruns')
+        if not self.__overrun:  # only the first overrun of a streak is logged
+            self.logger.warning(
+                LAYER_STEP_OVERRUN_LOG.format(self.__class__.__name__, 1e3 * dt, 1e3 * self.__step_budget)
+            )
+        self.__overrun = True
+
+        if self.__overrun_policy == 'degrade':
+            if not self.__degraded:
+                self.logger.warning(LAYER_DEGRADED_LOG.format(self.__class__.__name__))
+            self.__degraded = True
+            self.__steps_within_budget = 0
+
+    def __trace(self, out):
+        """Stamp the frame trace and carry it from the input data to the step output"""
+        if self.TRACE_STAGE is None:
+            return
+
+        trace = getattr(out, 'trace', None) or getattr(self.__last_data, 'trace', None)
+        if trace is None:
+            return
+
+        trace.mark(self.TRACE_STAGE)
+        if out is not None:
+            out.trace = trace
 
     def __send(self, data):
         if data is not None:
@@ -123,6 +324,10 @@ class Layer(Process):
     def _start(self):
         pass
 
+    def _stop(self):
+        """Release what _start acquired, called once when the layer stops"""
+        pass
+
     @property
     def previous_layer(self):
         return self._previous_layer
@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from time import monotonic
+from neonfc_ssl.protocols.internal import NeonFCProtobuf
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .layer import Layer
+
+
+@dataclass
+class LayerMetrics:
+    name: str
+    position: int
+    refresh_rate: float  # Hz, over the last sampling period
+    frames: int
+    skipped: int
+    dropped: int
+    overruns: int
+    shed: int
+
+    def to_proto(self):
+        return NeonFCProtobuf.LayerInfo(
+            name=self.name,
+            pipeline_position=self.position,
+            status=NeonFCProtobuf.LayerStatus.Value('RUNNING' if self.refresh_rate > 0 else 'IDLE'),
+            refresh_rate=self.refresh_rate,
+            frames=self.frames,
+            skipped=self.skipped,
+            dropped=self.dropped,
+            overruns=self.overruns,
+            shed=self.shed,
+        )
+
+    def __str__(self):
+        return (f"{self.name} {self.refresh_rate:.1f} Hz (skipped={self.skipped} dropped={self.dropped} "
+                f"overruns={self.overruns} shed={self.shed})")
+
+
+@dataclass
+class PipelineMetrics:
+    layers: list[LayerMetrics]
+
+    def to_proto(self):
+        return NeonFCProtobuf.Game(layer_info=[layer.to_proto() for layer in self.layers])
+
+    def __str__(self):
+        return "pipeline: " + ", ".join(str(layer) for layer in self.layers)
+
+
+class MetricsSampler:
+    """Reads the shared LayerStats of every layer and turns them into PipelineMetrics, rates are measured between
+    two consecutive samples"""
+
+    def __init__(self, layers: list['Layer']):
+        self.layers = layers
+        self._last_frames = [0] * len(layers)
+        self._last_sample = monotonic()
+
+    def sample(self) -> PipelineMetrics:
+        now = monotonic()
+        dt = max(now - self._last_sample, 1e-9)
+        self._last_sample = now
+
+        metrics = []
+        for i, layer in enumerate(self.layers):
+            stats = layer.stats.snapshot()
+            metrics.append(LayerMetrics(
+                name=layer.name,
+                position=i,
+                refresh_rate=(stats['frames'] - self._last_frames[i]) / dt,
+                **stats
+            ))
+            self._last_frames[i] = stats['frames']
+
+        return PipelineMetrics(metrics)
@@ -0,0 +1,35 @@
+from multiprocessing.sharedctypes import RawArray
+
+
+class LayerStats:
+    """Frame counters of a layer, kept in shared memory so the main process can read them while the layer runs.
+
+    Only the layer process writes to the counters, the main process should treat them as read only.
+    """
+
+    FIELDS = (
+        'frames',   # steps executed on new input data
+        'skipped',  # input frames discarded because a newer one was already available
+        'dropped',  # input frames lost by the transport before being read
+        'overruns',  # steps that took longer than the layer step budget
+        'shed',  # frames not stepped because of the overrun policy (skipped or answered with the last output)
+    )
+
+    def __init__(self):
+        self._index = {name: i for i, name in enumerate(self.FIELDS)}
+        self._values = RawArray('Q', len(self.FIELDS))
+
+    def __getitem__(self, name: str) -> int:
+        return self._values[self._index[name]]
+
+    def __setitem__(self, name: str, value: int):
+        self._values[self._index[name]] = value
+
+    def add(self, name: str, n: int = 1):
+        self._values[self._index[name]] += n
+
+    def snapshot(self) -> dict[str, int]:
+        return {name: self._values[i] for name, i in self._index.items()}
+
+    def __repr__(self):
+        return "<LayerStats {}>".format(" ".join(f"{k}={v}" for k, v in self.snapshot().items()))
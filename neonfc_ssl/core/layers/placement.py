@@ -0,0 +1,57 @@
+import os
+
+PLACEMENT_ERROR_LOG = "Could not apply {} = {} to layer {}: {}"
+PLACEMENT_LOG = "Layer {} placement: cpus={} nice={} policy={}"
+
+
+def apply_placement(config: dict) -> list[tuple[str, object, Exception]]:
+    """Apply the CPU placement of the calling process from a layer config.
+
+    - ``cpu_affinity``: list of CPUs the process may run on
+    - ``nice``: niceness of the process (negative values need privileges)
+    - ``sched_fifo``: real-time SCHED_FIFO priority (1-99, needs privileges), takes precedence over nice
+
+    Settings that can't be applied (missing privileges, unsupported OS) don't stop the others and are returned as
+    (key, value, error) tuples.
+    """
+    failures = []
+
+    if (cpus := config.get('cpu_affinity')) is not None:
+        try:
+            os.sched_setaffinity(0, cpus)
+        except (OSError, ValueError, AttributeError) as e:
+            failures.append(('cpu_affinity', cpus, e))
+
+    if (nice := config.get('nice')) is not None:
+        try:
+            os.setpriority(os.PRIO_PROCESS, 0, nice)
+        except (OSError, AttributeError) as e:
+            failures.append(('nice', nice, e))
+
+    if (priority := config.get('sched_fifo')) is not None:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        except (OSError, AttributeError) as e:
+            failures.append(('sched_fifo', priority, e))
+
+    return failures
+
+
+def describe_placement() -> tuple[str, str, str]:
+    """CPUs, niceness and scheduling policy actually in effect for the calling process"""
+    try:
+        cpus = ",".join(str(cpu) for cpu in sorted(os.sched_getaffinity(0)))
+    except AttributeError:
+        cpus = "any"
+
+    nice = str(os.getpriority(os.PRIO_PROCESS, 0))
+
+    try:
+        if os.sched_getscheduler(0) == os.SCHED_FIFO:
+            policy = f"SCHED_FIFO({os.sched_getparam(0).sched_priority})"
+        else:
+            policy = "SCHED_OTHER"
+    except AttributeError:
+        policy = "default"
+
+    return cpus, nice, policy
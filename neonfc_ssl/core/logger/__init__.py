@@ -3,7 +3,12 @@ from .protobuf_formatter import ProtobufFormatter
 from .binary_file_handler import BinaryFileHandler
 from .binary_udp_sender import BinaryUDPSender
 from .layer_handler import LayerHandler
+from .inline_handler import InlineHandler
 from .ansi_color_formatter import AnsiColorFormatter
+from .filters import SamplingFilter, min_handler_level
+
+# Logger that owns the game handlers (stdout, interface and game log), layer records end up here
+GAME_LOGGER = "game"
 
 
 def setup_logging(nfc_config):
@@ -22,6 +27,16 @@ def setup_logging(nfc_config):
                 "()": "neonfc_ssl.core.logger.ProtobufFormatter",
             }
         },
+        "filters": {
+            "interface_sampling": {
+                "()": "neonfc_ssl.core.logger.SamplingFilter",
+                # the interface only draws the field, it doesn't need every frame
+                "rates": {
+                    TRACKING: nfc_config.get("interface_rate", 15),
+                    DECISION: nfc_config.get("interface_rate", 15),
+                },
+            },
+        },
         "handlers": {
             "stdout": {
                 "class": "logging.StreamHandler",
@@ -41,11 +56,16 @@ def setup_logging(nfc_config):
                 "formatter": "protobuf",
                 "path": "logs",
                 "filename": "neon_fc.gamelog",
+                "flush_interval": nfc_config.get("gamelog_flush_interval", 0.1),
+                "max_bytes": nfc_config.get("gamelog_max_bytes"),
+                "keyframe_interval": nfc_config.get("gamelog_keyframe_interval", 60),
+                "compress": nfc_config.get("gamelog_compress", True),
             },
             "interface_sender":{
                 "class": "neonfc_ssl.core.logger.BinaryUDPSender",
                 "level": "NOTSET",
                 "formatter": "protobuf",
+                "filters": ["interface_sampling"],
                 "host": nfc_config["host"],
                 "port": nfc_config["output_port"],
             },
@@ -54,7 +74,7 @@ def setup_logging(nfc_config):
             "": {
                 "level": "NOTSET",
             },
-            "game": {
+            GAME_LOGGER: {
                 "level": "NOTSET",
                 "handlers": [
                     "stdout",
@@ -1,22 +1,200 @@
 import logging
+import threading
+import zlib
 from datetime import datetime
-from os.path import join
+from os.path import join, exists
+from .custom_levels import TRACKING
+from neonfc_ssl.core.gamelog.gamelog_index import (INDEX_SUFFIX, INDEX_ENTRY, LENGTH_PREFIX, NO_FRAME, COMPRESSED_MAGIC,
+                                                   TRACKING_DELTA, KEYFRAME, index_header, record_frame)
+from neonfc_ssl.core.gamelog.tracking_delta import TrackingDeltaEncoder
+from neonfc_ssl.protocols.internal import NeonFCProtobuf
+
+_SOURCES = dict(NeonFCProtobuf.Sources.items())
+_ROTATE = None  # marker queued along the records where a new file must start
 
 
 class BinaryFileHandler(logging.Handler):
-    def __init__(self, path, filename):
+    """Appends length-prefixed binary records to a game log file from a background writer thread.
+
+    ``emit`` only queues the record in a bounded in-memory buffer. The writer thread writes the pending records in
+    a single call every ``flush_interval`` seconds, or sooner once ``flush_bytes`` are pending. When the buffer
+    already holds ``max_buffer`` bytes new records are dropped and counted in ``dropped`` instead of blocking the
+    logging path. A new file is started once the current one reaches ``max_bytes`` (if set) or when ``rotate`` is
+    called, e.g. at the start of a match.
+
+    Every file gets a sidecar index (game log v2, see ``neonfc_ssl.core.gamelog``) with the offset, timestamp, frame
+    and source of each record, written right after the records themselves so it never points past the data.
+
+    With ``keyframe_interval`` set, tracking frames are stored as quantized deltas with a keyframe every that many
+    frames (see ``TrackingDeltaEncoder``), and with ``compress`` every batch is written as a zlib block. Both are
+    undone by ``GamelogReader``.
+    """
+
+    def __init__(self, path, filename, flush_interval=0.1, flush_bytes=1 << 20, max_buffer=16 << 20, max_bytes=None,
+                 keyframe_interval=None, compress=False, compress_level=1):
         super().__init__()
-        self.file=open(join(path, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{filename}"), 'ab')  # append in binary mode
+        self.path = path
+        self.filename = filename
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self.max_buffer = max_buffer
+        self.max_bytes = max_bytes
+        self.keyframe_interval = keyframe_interval
+        self.compress = compress
+        self.compress_level = compress_level
+
+        self.dropped = 0  # records lost because the buffer was full
+        self._open()
+
+        self._pending: list[tuple[bytes, tuple] | None] = []  # record payloads and index data
+        self._pending_bytes = 0
+        self._queued = 0  # records queued since the handler was created
+        self._written = 0  # records written since the handler was created
+        self._flush_requested = False
+        self._closing = False
+        self._cond = threading.Condition()
+        self._writer = threading.Thread(target=self._write_loop, name="gamelog-writer", daemon=True)
+        self._writer.start()
+
+    def _open(self):
+        self._index_time, self._index_frame = 0.0, NO_FRAME
+        self._encoders = {}  # every file starts with tracking keyframes
+
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        name = join(self.path, f"{stamp}-{self.filename}")
+        part = 1
+        while exists(name):  # rotated within the same second
+            name = join(self.path, f"{stamp}-{part}-{self.filename}")
+            part += 1
+        self.file = open(name, 'ab')  # append in binary mode
+        if self.compress:
+            self.file.write(COMPRESSED_MAGIC)
+        self._header_size = self.file.tell()
+        self.index_file = open(name + INDEX_SUFFIX, 'ab')
+        if self.index_file.tell() == 0:
+            self.index_file.write(index_header())
 
     def emit(self, record):
         try:
             msg = self.format(record)
-            length = len(msg).to_bytes(4, byteorder='big')  # prefix with 4-byte length
-            self.file.write(length + msg)
-            self.file.flush()
+            meta = (record.created, record_frame(record), _SOURCES.get(record.name.upper(), 0), record.levelno)
+
+            with self._cond:
+                if self._pending_bytes + LENGTH_PREFIX + len(msg) > self.max_buffer:
+                    self.dropped += 1
+                    return
+
+                self._pending.append((msg, meta))
+                self._pending_bytes += LENGTH_PREFIX + len(msg)
+                self._queued += 1
+                if self._pending_bytes >= self.flush_bytes:
+                    self._cond.notify()
         except Exception:
             self.handleError(record)
 
+    def rotate(self):
+        """Start a new file, records queued before the call still go to the current one"""
+        with self._cond:
+            self._pending.append(_ROTATE)
+            self._flush_requested = True
+            self._cond.notify()
+
+    def flush(self):
+        """Block until every record queued so far is written"""
+        with self._cond:
+            target = self._queued
+            self._flush_requested = True
+            self._cond.notify()
+            self._cond.wait_for(lambda: self._written >= target, timeout=max(1.0, 10 * self.flush_interval))
+
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closing or self._flush_requested or self._pending_bytes >= self.flush_bytes,
+                    timeout=self.flush_interval
+                )
+                self._flush_requested = False
+                pending, self._pending, self._pending_bytes = self._pending, [], 0
+                queued = self._queued
+                closing = self._closing
+
+            while pending:
+                if pending[0] is _ROTATE:
+                    self._rotate_file()
+                    pending.pop(0)
+                    continue
+
+                end = pending.index(_ROTATE) if _ROTATE in pending else len(pending)
+                self._write(pending[:end])
+                del pending[:end]
+
+            with self._cond:
+                self._written = queued
+                self._cond.notify_all()  # wake up flush() callers
+
+            if closing:
+                return
+
+    def _write(self, records: list[tuple[bytes, tuple]]):
+        chunks, index = [], bytearray()
+        offset, position = self.file.tell(), 0
+        for msg, (timestamp, frame, source, level) in records:
+            msg, flags = self._encode(msg, source, level)
+            self._index_time = max(self._index_time, timestamp)
+            self._index_frame = max(self._index_frame, frame)
+            # compressed records are located by their block and their position in it
+            located = (offset, position) if self.compress else (offset + position, 0)
+            index += INDEX_ENTRY.pack(*located, len(msg), self._index_time, self._index_frame, source, level, flags)
+
+            chunks += [len(msg).to_bytes(LENGTH_PREFIX, byteorder='big'), msg]  # prefix with 4-byte length
+            position += LENGTH_PREFIX + len(msg)
+
+        data = b''.join(chunks)
+        if self.compress:
+            block = zlib.compress(data, self.compress_level)
+            data = len(block).to_bytes(LENGTH_PREFIX, byteorder='big') + block
+
+        try:
+            self.file.write(data)
+            self.file.flush()
+            self.index_file.write(index)
+            self.index_file.flush()
+        except OSError:
+            self._encoders = {}  # the decoder can't follow anymore, start again from keyframes
+            with self._cond:
+                self.dropped += len(records)
+
+        if self.max_bytes is not None and self.file.tell() >= self.max_bytes:
+            self._rotate_file()
+
+    def _encode(self, msg: bytes, source: int, level: int) -> tuple[bytes, int]:
+        if self.keyframe_interval is None or level != TRACKING:
+            return msg, 0
+
+        entry = NeonFCProtobuf.LogEntry.FromString(msg)
+        if not entry.HasField('tracking'):
+            return msg, 0
+
+        if source not in self._encoders:
+            self._encoders[source] = TrackingDeltaEncoder(self.keyframe_interval)
+        entry.tracking_delta.CopyFrom(self._encoders[source].encode(entry.tracking))
+        entry.ClearField('tracking')
+
+        return entry.SerializeToString(), TRACKING_DELTA | (KEYFRAME if entry.tracking_delta.keyframe else 0)
+
+    def _rotate_file(self):
+        if self.file.tell() == self._header_size:  # nothing written yet, e.g. a match started right after a size rotation
+            return
+        self.file.close()
+        self.index_file.close()
+        self._open()
+
     def close(self):
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._writer.join(timeout=max(1.0, 10 * self.flush_interval))
         self.file.close()
+        self.index_file.close()
         super().close()
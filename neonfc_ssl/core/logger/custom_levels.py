@@ -6,11 +6,17 @@ import logging
 TRACKING = 6
 # Decision Level is above represent decisions made based on the received information
 DECISION = 7
+# Latency Level carries the pipeline latency percentiles periodically reported by the output layer
+LATENCY = 8
+# Game Level carries the periodic pipeline metrics published by the game (layer frame and overrun counters)
+GAME = 9
 
-LEVELS = {TRACKING, DECISION}
+LEVELS = {TRACKING, DECISION, LATENCY, GAME}
 
 logging.addLevelName(TRACKING, "TRACKING")
 logging.addLevelName(DECISION, "DECISION")
+logging.addLevelName(LATENCY, "LATENCY")
+logging.addLevelName(GAME, "GAME")
 
 
 def tracking(self, message, *args, **kws):
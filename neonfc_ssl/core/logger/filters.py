@@ -1,20 +1,35 @@
 import logging
 
 
-class GameFilter(logging.Filter):
-    def __init__(self):
+class SamplingFilter(logging.Filter):
+    """Lets through at most ``rates[level]`` records per second of each sampled level and source logger.
+
+    Levels without a rate are not sampled. Meant for handlers that can't keep up with the full telemetry stream,
+    e.g. the interface only needs tracking at 15 Hz while the game log keeps every frame.
+    """
+
+    def __init__(self, rates: dict[int | str, float]):
         super().__init__()
-        self.last_log_time = 0
-        self.refresh_rate = 1/15  # 15Hz
+        self.periods = {
+            level if isinstance(level, int) else logging.getLevelName(level): 1 / rate
+            for level, rate in rates.items()
+        }
+        self.last_log_time: dict[tuple[str, int], float] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        period = self.periods.get(record.levelno)
+        if period is None:
+            return True
 
-    def filter(self, record: logging.LogRecord) -> bool | logging.LogRecord:
-        if record.levelno != logging.getLevelName("GAME"):
-            return False
+        key = (record.name, record.levelno)
+        if record.created - self.last_log_time.get(key, float('-inf')) >= period:
+            self.last_log_time[key] = record.created
+            return True
+        return False
 
-        if record.msg == "frame":
-            if record.created - self.last_log_time >= self.refresh_rate:
-                self.last_log_time = record.created
-                return True
-            return False
 
-        return True
+def min_handler_level(logger: logging.Logger) -> int:
+    """Lowest level any handler of ``logger`` accepts, records below it would be thrown away by all of them"""
+    if not logger.handlers:
+        return logging.NOTSET
+    return min(handler.level for handler in logger.handlers)
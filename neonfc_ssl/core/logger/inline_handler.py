@@ -0,0 +1,15 @@
+import logging
+
+
+class InlineHandler(logging.Handler):
+    """Hands records straight to another logger of the same process, the inline counterpart of LayerHandler"""
+
+    def __init__(self, target: logging.Logger):
+        super().__init__()
+        self.target = target
+
+    def emit(self, record):
+        try:
+            self.target.handle(record)
+        except Exception:
+            self.handleError(record)
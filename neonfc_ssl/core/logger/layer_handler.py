@@ -1,4 +1,10 @@
 import logging
+import os
+import threading
+import time
+from .custom_levels import LEVELS
+from .protobuf_formatter import ProtobufFormatter
+from neonfc_ssl.core.gamelog.gamelog_index import record_frame
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -6,12 +12,73 @@ if TYPE_CHECKING:
 
 
 class LayerHandler(logging.Handler):
-    def __init__(self, queue: 'Queue'):
+    """Sends the records of a layer process to the main process in batches.
+
+    Records are serialized to protobuf here, in the layer process, and reduced to plain attributes so the queue
+    never pickles the logged objects (e.g. a whole MatchData). Batches are put on the queue every
+    ``flush_interval`` seconds by a background thread, when ``max_batch`` records are pending, or right away for
+    warnings and errors so they aren't lost if the layer dies. Each queue item is a list of record dicts, to be
+    rebuilt with ``logging.makeLogRecord``.
+    """
+
+    def __init__(self, queue: 'Queue', flush_interval: float = 0.02, max_batch: int = 256):
         super().__init__()
-        self.queue= queue
+        self.queue = queue
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.setFormatter(ProtobufFormatter())
+
+        self._batch = []
+        self._batch_lock = threading.Lock()
+        self._flusher_pid = None
 
     def emit(self, record):
         try:
-            self.queue.put(record)
+            self._ensure_flusher()
+            prepared = self.prepare(record)
+
+            with self._batch_lock:
+                self._batch.append(prepared)
+                full = len(self._batch) >= self.max_batch
+
+            if full or record.levelno >= logging.WARNING:
+                self.flush()
         except Exception:
             self.handleError(record)
+
+    def prepare(self, record: logging.LogRecord) -> dict:
+        protobuf = self.format(record)
+
+        prepared = dict(record.__dict__)
+        # structured records only travel as protobuf, text handlers get a placeholder instead of their repr
+        prepared['msg'] = f"<{type(record.msg).__name__}>" if record.levelno in LEVELS else record.getMessage()
+        prepared['args'] = None
+        if record.exc_info:
+            prepared['exc_text'] = logging.Formatter().formatException(record.exc_info)
+        prepared['exc_info'] = None
+        prepared['protobuf'] = protobuf
+        prepared['frame_id'] = record_frame(record)  # the logged object stays here, the game log indexes by frame
+
+        return prepared
+
+    def flush(self):
+        with self._batch_lock:
+            batch, self._batch = self._batch, []
+
+        if batch:
+            self.queue.put(batch)
+
+    def _ensure_flusher(self):
+        # the handler is created in the main process but emits from the layer one, where the thread must live
+        if self._flusher_pid == os.getpid():
+            return
+
+        self._flusher_pid = os.getpid()
+        self._batch = []
+        self._batch_lock = threading.Lock()
+        threading.Thread(target=self._flush_loop, daemon=True).start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
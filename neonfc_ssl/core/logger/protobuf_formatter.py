@@ -41,7 +41,16 @@ class ProtobufFormatter(logging.Formatter):
     ):
         super().__init__()
 
-    def format(self, record: logging.LogRecord) -> str:
+    def format(self, record: logging.LogRecord) -> bytes:
+        # serialized once per record, either by a previous handler or in the layer process (see LayerHandler)
+        if (serialized := getattr(record, 'protobuf', None)) is not None:
+            return serialized
+
+        record.protobuf = self.serialize(record)
+        return record.protobuf
+
+    @staticmethod
+    def serialize(record: logging.LogRecord) -> bytes:
         entry = NeonFCProtobuf.LogEntry(
             source=NeonFCProtobuf.Sources.Value(record.name.upper()),
             level=record.levelno,
@@ -0,0 +1,2 @@
+from .frame_trace import FrameTrace, STAGES, encode_trace, decode_trace, TRACE_SIZE
+from .latency_stats import LatencyStats, LatencyReport
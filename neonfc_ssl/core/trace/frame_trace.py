@@ -0,0 +1,67 @@
+import math
+import struct
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Optional
+
+from neonfc_ssl.core.transport.frame_codec import NAN, opt_float, from_opt_float
+
+# Pipeline stages stamped on every frame, in order. "received" is when the vision packet arrived, the others are
+# taken once the stage finished processing the frame.
+STAGES = ('received', 'input', 'tracking', 'decision', 'control', 'output')
+STAGE_INDEX = {stage: i for i, stage in enumerate(STAGES)}
+
+# frame_id (0 means no trace), t_capture, one monotonic timestamp per stage
+_TRACE = struct.Struct(f'<Qd{len(STAGES)}d')
+TRACE_SIZE = _TRACE.size
+
+
+@dataclass
+class FrameTrace:
+    """Identifies a vision frame along the pipeline and records when each stage was done with it.
+
+    Stage timestamps come from ``time.monotonic``, which is shared by every process on the machine, so they can be
+    compared across layers. ``t_capture`` is the capture time reported by the vision system, on its own clock.
+    """
+    frame_id: int
+    t_capture: Optional[float] = None
+    stamps: list[float] = field(default_factory=lambda: [NAN] * len(STAGES))
+
+    def mark(self, stage: str, t: Optional[float] = None):
+        self.stamps[STAGE_INDEX[stage]] = monotonic() if t is None else t
+
+    def stamp(self, stage: str) -> Optional[float]:
+        t = self.stamps[STAGE_INDEX[stage]]
+        return None if math.isnan(t) else t
+
+    def stage_latencies(self) -> dict[str, float]:
+        """Time spent between each stamped stage and the previous stamped one, plus the ``total`` time"""
+        latencies = {}
+        first = last = None
+        for stage, t in zip(STAGES, self.stamps):
+            if math.isnan(t):
+                continue
+            if last is not None:
+                latencies[stage] = t - last
+            else:
+                first = t
+            last = t
+
+        if first is not None and last is not first:
+            latencies['total'] = last - first
+        return latencies
+
+
+def encode_trace(trace: Optional[FrameTrace], buf: memoryview, offset: int) -> int:
+    if trace is None:
+        _TRACE.pack_into(buf, offset, 0, NAN, *([NAN] * len(STAGES)))
+    else:
+        _TRACE.pack_into(buf, offset, trace.frame_id, opt_float(trace.t_capture), *trace.stamps)
+    return _TRACE.size
+
+
+def decode_trace(buf: bytes | memoryview, offset: int) -> Optional[FrameTrace]:
+    frame_id, t_capture, *stamps = _TRACE.unpack_from(buf, offset)
+    if frame_id == 0:
+        return None
+    return FrameTrace(frame_id, from_opt_float(t_capture), stamps)
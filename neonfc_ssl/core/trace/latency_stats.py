@@ -0,0 +1,54 @@
+from collections import deque
+from dataclasses import dataclass
+import numpy as np
+from neonfc_ssl.protocols.internal import NeonFCProtobuf
+from .frame_trace import FrameTrace, STAGES
+
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class StageLatency:
+    stage: str
+    p50: float
+    p95: float
+    p99: float
+    samples: int
+
+    def to_proto(self):
+        return NeonFCProtobuf.StageLatency(
+            stage=self.stage, p50=self.p50, p95=self.p95, p99=self.p99, samples=self.samples
+        )
+
+
+@dataclass
+class LatencyReport:
+    stages: list[StageLatency]
+
+    def to_proto(self):
+        return NeonFCProtobuf.Latency(stages=[s.to_proto() for s in self.stages])
+
+    def __str__(self):
+        return "latency p50/p95/p99 (ms) " + ", ".join(
+            f"{s.stage}: {1e3 * s.p50:.1f}/{1e3 * s.p95:.1f}/{1e3 * s.p99:.1f}" for s in self.stages
+        )
+
+
+class LatencyStats:
+    """Rolling latency percentiles of each pipeline stage, over the last ``window`` traced frames"""
+
+    def __init__(self, window: int = 600):
+        self._samples = {stage: deque(maxlen=window) for stage in (*STAGES[1:], 'total')}
+
+    def add(self, trace: FrameTrace):
+        for stage, dt in trace.stage_latencies().items():
+            self._samples[stage].append(dt)
+
+    def report(self) -> LatencyReport:
+        stages = []
+        for stage, samples in self._samples.items():
+            if not samples:
+                continue
+            p50, p95, p99 = np.percentile(samples, PERCENTILES)
+            stages.append(StageLatency(stage, p50, p95, p99, len(samples)))
+        return LatencyReport(stages)
@@ -0,0 +1,3 @@
+from .frame_codec import FrameCodec, MAX_ROBOTS_PER_TEAM
+from .shm_ring import ShmRing, ShmReader, ShmWriter, ShmPipe
+from .pipe_reader import PipeReader
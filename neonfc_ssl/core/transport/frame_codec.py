@@ -0,0 +1,59 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+# Upper bound of robots per team carried in a frame (SSL robot ids go from 0 to 15)
+MAX_ROBOTS_PER_TEAM = 16
+
+NAN = float('nan')
+
+COLOR_CODES = {None: 0, 'yellow': 1, 'blue': 2}
+CODE_COLORS = {v: k for k, v in COLOR_CODES.items()}
+
+TOO_MANY_ROBOTS_MSG = "{} can encode at most {} robots per team, got {}"
+
+
+class FrameCodec(ABC):
+    """Fixed-layout binary encoding of a layer output.
+
+    Every frame produced by a codec fits in ``size`` bytes so it can be written directly into a preallocated
+    buffer (e.g. a shared memory slot) and decoded on the other side without pickling.
+    """
+
+    size: int = 0
+
+    @classmethod
+    @abstractmethod
+    def encode_into(cls, data: Any, buf: memoryview, offset: int = 0) -> int:
+        """Write ``data`` into ``buf`` starting at ``offset`` and return the number of bytes written"""
+        raise NotImplementedError("This method should be implemented by subclasses")
+
+    @classmethod
+    @abstractmethod
+    def decode(cls, buf: bytes | memoryview, offset: int = 0) -> Any:
+        """Rebuild the object encoded in ``buf`` starting at ``offset``"""
+        raise NotImplementedError("This method should be implemented by subclasses")
+
+
+def opt_float(value: Optional[float]) -> float:
+    """Map an optional float to the wire format (None is sent as NaN)"""
+    return NAN if value is None else value
+
+
+def from_opt_float(value: float) -> Optional[float]:
+    """Map a wire float back to an optional float (NaN is read as None)"""
+    return None if math.isnan(value) else value
+
+
+def opt_bool(value: Optional[bool]) -> int:
+    """Map an optional bool to 0 (None), 1 (False) or 2 (True)"""
+    return 0 if value is None else 1 + bool(value)
+
+
+def from_opt_bool(value: int) -> Optional[bool]:
+    return None if value == 0 else value == 2
+
+
+def check_robot_count(codec: type[FrameCodec], count: int):
+    if count > MAX_ROBOTS_PER_TEAM:
+        raise ValueError(TOO_MANY_ROBOTS_MSG.format(codec.__name__, MAX_ROBOTS_PER_TEAM, count))
@@ -0,0 +1,34 @@
+from multiprocessing.connection import Connection
+from multiprocessing.reduction import ForkingPickler
+from typing import Any, Optional
+
+
+class PipeReader:
+    """Receiving end of a ``multiprocessing.Pipe`` with the same reading interface as :class:`ShmReader`"""
+
+    def __init__(self, conn: Connection):
+        self._conn = conn
+
+        self.skipped = 0  # frames passed over by recv_latest
+        self.dropped = 0  # a pipe never loses frames, kept for interface parity with ShmReader
+
+    def fileno(self) -> int:
+        return self._conn.fileno()
+
+    def poll(self, timeout: Optional[float] = 0.0) -> bool:
+        return self._conn.poll(timeout)
+
+    def recv(self) -> Any:
+        return self._conn.recv()
+
+    def recv_latest(self) -> Any:
+        """Block for a frame and return the newest one queued, older frames are discarded without unpickling"""
+        payload = self._conn.recv_bytes()
+        while self._conn.poll():
+            payload = self._conn.recv_bytes()
+            self.skipped += 1
+
+        return ForkingPickler.loads(payload)
+
+    def close(self):
+        self._conn.close()
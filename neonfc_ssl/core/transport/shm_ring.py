@@ -0,0 +1,175 @@
+import os
+import struct
+from multiprocessing import Pipe
+from multiprocessing.shared_memory import SharedMemory
+from time import monotonic
+from typing import Any, Optional
+
+from .frame_codec import FrameCodec
+
+# Ring header, sequence number of the last published frame
+_RING_HEADER = struct.Struct('<Q')
+# Slot header, sequence number of the frame held by the slot (0 while being written) and payload length
+_SLOT_HEADER = struct.Struct('<QI')
+
+MIN_SLOTS = 2
+MIN_SLOTS_MSG = "A shared memory ring needs at least {} slots, got {}"
+
+
+class ShmRing:
+    """Single producer, single consumer ring of fixed-size frames living in shared memory.
+
+    Frames are written in place by a :class:`FrameCodec` and tagged with a monotonically increasing sequence number,
+    so the consumer can tell new, stale and overwritten slots apart without any locking. A non-blocking doorbell pipe
+    is rung after each publish, only to wake up a consumer waiting for data; it never carries the frame itself.
+    """
+
+    def __init__(self, codec: type[FrameCodec], slots: int = 4):
+        if slots < MIN_SLOTS:
+            raise ValueError(MIN_SLOTS_MSG.format(MIN_SLOTS, slots))
+
+        self.codec = codec
+        self.slots = slots
+        self.slot_size = _SLOT_HEADER.size + codec.size
+
+        self.shm = SharedMemory(create=True, size=_RING_HEADER.size + slots * self.slot_size)
+        _RING_HEADER.pack_into(self.shm.buf, 0, 0)
+
+        self.bell_rx, self.bell_tx = Pipe(duplex=False)
+        # a full doorbell already guarantees the consumer will wake up, so the producer must never block on it
+        os.set_blocking(self.bell_tx.fileno(), False)
+
+    def slot_offset(self, seq: int) -> int:
+        return _RING_HEADER.size + ((seq - 1) % self.slots) * self.slot_size
+
+    def published(self) -> int:
+        return _RING_HEADER.unpack_from(self.shm.buf, 0)[0]
+
+    def unlink(self):
+        """Release the shared memory block, should be called once by the process that created the ring"""
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class ShmWriter:
+    """Producer end of a :class:`ShmRing`, mirrors the sending end of a ``multiprocessing.Pipe``"""
+
+    def __init__(self, ring: ShmRing):
+        self._ring = ring
+        self._seq = 0
+
+    def send(self, data: Any):
+        ring = self._ring
+        buf = ring.shm.buf
+        seq = self._seq + 1
+        offset = ring.slot_offset(seq)
+
+        _SLOT_HEADER.pack_into(buf, offset, 0, 0)  # flag the slot as being written
+        length = ring.codec.encode_into(data, buf, offset + _SLOT_HEADER.size)
+        _SLOT_HEADER.pack_into(buf, offset, seq, length)
+        _RING_HEADER.pack_into(buf, 0, seq)
+
+        self._seq = seq
+        try:
+            ring.bell_tx.send_bytes(b'')
+        except BlockingIOError:
+            pass
+
+    def close(self):
+        self._ring.bell_tx.close()
+        self._ring.shm.close()
+
+
+class ShmReader:
+    """Consumer end of a :class:`ShmRing`, mirrors the receiving end of a ``multiprocessing.Pipe``
+
+    Frames are delivered in order. If the producer laps the consumer the overwritten frames are counted as dropped
+    and the reader resumes from the oldest frame still available.
+    """
+
+    def __init__(self, ring: ShmRing):
+        self._ring = ring
+        self._seq = 0
+
+        self.skipped = 0  # frames passed over by recv_latest
+        self.dropped = 0  # frames overwritten by the producer before being read
+
+    def fileno(self) -> int:
+        """File descriptor that becomes readable when new frames are published"""
+        return self._ring.bell_rx.fileno()
+
+    def poll(self, timeout: Optional[float] = 0.0) -> bool:
+        deadline = None if timeout is None else monotonic() + timeout
+
+        while self._ring.published() <= self._seq:
+            # rings for frames already read must not keep the doorbell readable, or waiters would spin on it
+            if self._ring.bell_rx.poll():
+                self._drain_bell()
+                continue
+
+            remaining = None if deadline is None else deadline - monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+
+            self._ring.bell_rx.poll(remaining)
+
+        return True
+
+    def recv(self) -> Any:
+        self.poll(None)
+        return self._read(self._seq + 1)
+
+    def recv_latest(self) -> Any:
+        """Block for a frame and return the newest one published, older frames are never decoded"""
+        self.poll(None)
+        newest = self._ring.published()
+        self.skipped += newest - self._seq - 1
+        self._seq = newest - 1
+        return self._read(newest)
+
+    def close(self):
+        self._ring.bell_rx.close()
+        self._ring.shm.close()
+
+    def unlink(self):
+        """Release the shared memory block of the ring, see :meth:`ShmRing.unlink`"""
+        self._ring.unlink()
+
+    def _drain_bell(self):
+        # the doorbell content is meaningless, read it in bulk instead of one message at a time
+        fd = self.fileno()
+        while self._ring.bell_rx.poll():
+            os.read(fd, 4096)
+
+    def _oldest_readable(self) -> int:
+        # the slot after the newest frame may be under rewrite, hence the + 2
+        return self._ring.published() - self._ring.slots + 2
+
+    def _read(self, seq: int) -> Any:
+        ring = self._ring
+        buf = ring.shm.buf
+
+        requested = seq
+        seq = max(seq, self._oldest_readable())
+        while True:
+            offset = ring.slot_offset(seq)
+            slot_seq, length = _SLOT_HEADER.unpack_from(buf, offset)
+            if slot_seq == seq:
+                start = offset + _SLOT_HEADER.size
+                payload = bytes(buf[start:start + length])
+
+                # the producer may have lapped us while copying
+                if _SLOT_HEADER.unpack_from(buf, offset)[0] == seq:
+                    self.dropped += seq - requested
+                    self._seq = seq
+                    return ring.codec.decode(payload)
+
+            seq = max(seq + 1, self._oldest_readable())
+
+
+def ShmPipe(codec: type[FrameCodec], slots: int = 4) -> tuple[ShmReader, ShmWriter]:
+    """Shared memory counterpart of ``multiprocessing.Pipe(duplex=False)``, returns the (reader, writer) pair"""
+    ring = ShmRing(codec, slots)
+    return ShmReader(ring), ShmWriter(ring)
@@ -1,6 +1,7 @@
 import math
 from .base_coach import Coach
 from neonfc_ssl.commons.math import distance_between_points
+from neonfc_ssl.commons.field_model import field_model
 from ..special_strategies import BallHolder, GoalKeeper, Receiver
 from ..positional_strategies import Libero, LeftBack, RightBack, PrepPenalty, PrepBallPlacement, PrepKickoff, \
     PrepGKPenalty, PrepBHPenalty, IndividualDefender
@@ -134,15 +135,10 @@ class SimpleCoach(Coach):
         )
 
     def _check_ball_inside_area(self):
-        field = self.data.field
         ball = self.data.ball
-
-        non_area_space = (field.field_width - field.penalty_width)/2
-
-        check_ball_x = ball.x <= field.penalty_depth
-        check_ball_y = non_area_space <= ball.y <= non_area_space+field.penalty_width
-
-        return check_ball_x and check_ball_y
+        # the area starts at the goal line, a ball behind it counts as inside
+        area = field_model(self.data.field).friendly_area
+        return ball.x <= area.x_max and area.y <= ball.y <= area.y_max
 
     def _ball_inside_area(self):
         self.decision.set_strategy(self.data.robots[self._gk_id], self._strategy_gk)
@@ -159,22 +155,25 @@ class SimpleCoach(Coach):
         )
 
     def _use_right_back(self):
-        field = self.data.field
-        limit = (field.field_width - field.penalty_width) / 2 + 0.5
+        field = field_model(self.data.field)
+        limit = field.friendly_area.y + 0.5
 
-        return self.data.ball.x < field.field_length / 2 and self.data.ball.y < limit
+        return self.data.ball.x < field.half_length and self.data.ball.y < limit
 
     def _use_left_back(self):
-        field = self.data.field
-        limit = (field.field_width + field.penalty_width) / 2 - 0.5
+        field = field_model(self.data.field)
+        limit = field.friendly_area.y_max - 0.5
 
-        return self.data.ball.x < field.field_length / 2 and self.data.ball.y > limit
+        return self.data.ball.x < field.half_length and self.data.ball.y > limit
 
     def _closest_non_keeper(self) -> Optional['TrackedRobot']:
-        sq_dist_to_ball = lambda r: np.sum(np.square(np.array(r) - self.data.ball)) \
-            if r.id != self._gk_id else np.inf
-        my_closest = min(self.data.robots.actives, key=sq_dist_to_ball, default=None)
-        return my_closest
+        team = self.data.robots.arrays
+        rows = np.flatnonzero(team.active)
+        if not rows.size:
+            return None
+
+        dist_to_ball = np.where(team.ids == self._gk_id, np.inf, self.data.features.ball_distances('robots'))
+        return self.data.robots[int(rows[np.argmin(dist_to_ball[rows])])]
 
     def _get_defending_positions(self, avoid=2, fouls=False):
         targets = []
@@ -4,6 +4,7 @@ import numpy as np
 from neonfc_ssl.core import Layer
 from neonfc_ssl.core.event import EventType, Event, event_callback
 from .decision_data import DecisionData, RobotRubric
+from .decision_codec import DecisionDataCodec
 from .coaches import COACHES
 from neonfc_ssl.tracking_layer.tracking_data import States
 
@@ -21,6 +22,9 @@ STRATEGY_INDEX = 1
 
 
 class Decision(Layer):
+    OUTPUT_CODEC = DecisionDataCodec
+    TRACE_STAGE = 'decision'
+
     def __init__(self, config, log_q):
         super().__init__("DecisionLayer", config, log_q)
         self.events = {}
@@ -0,0 +1,76 @@
+import struct
+from neonfc_ssl.core.transport.frame_codec import FrameCodec, MAX_ROBOTS_PER_TEAM, check_robot_count
+from neonfc_ssl.tracking_layer.tracking_codec import MatchDataCodec
+from neonfc_ssl.core.trace import encode_trace, decode_trace, TRACE_SIZE
+from .decision_data import DecisionData, RobotRubric
+
+# number of commands
+_HEADER = struct.Struct('<B')
+# id, halt, has target, target_pose (x, y, theta), kick_speed (vx, vz), spinner, avoid_area,
+# avoid_opponents mask, avoid_allies mask
+_RUBRIC = struct.Struct('<B??3d2d??HH')
+
+
+def _ids_to_mask(ids: list[int]) -> int:
+    mask = 0
+    for robot_id in ids:
+        mask |= 1 << robot_id
+    return mask
+
+
+def _mask_to_ids(mask: int) -> list[int]:
+    return [robot_id for robot_id in range(MAX_ROBOTS_PER_TEAM) if mask & (1 << robot_id)]
+
+
+class DecisionDataCodec(FrameCodec):
+    size = _HEADER.size + MAX_ROBOTS_PER_TEAM * _RUBRIC.size + TRACE_SIZE + MatchDataCodec.size
+
+    @classmethod
+    def encode_into(cls, data: DecisionData, buf: memoryview, offset: int = 0) -> int:
+        start = offset
+        check_robot_count(cls, len(data.commands))
+
+        _HEADER.pack_into(buf, offset, len(data.commands))
+        offset += _HEADER.size
+
+        for cmd in data.commands:
+            target = cmd.target_pose if cmd.target_pose is not None else (0, 0, 0)
+            _RUBRIC.pack_into(
+                buf, offset, cmd.id, cmd.halt,
+                cmd.target_pose is not None, *target,
+                *cmd.kick_speed, cmd.spinner, cmd.avoid_area,
+                _ids_to_mask(cmd.avoid_opponents), _ids_to_mask(cmd.avoid_allies)
+            )
+            offset += _RUBRIC.size
+
+        offset += encode_trace(data.trace, buf, offset)
+        offset += MatchDataCodec.encode_into(data.world_model, buf, offset)
+
+        return offset - start
+
+    @classmethod
+    def decode(cls, buf: bytes | memoryview, offset: int = 0) -> DecisionData:
+        n_commands, = _HEADER.unpack_from(buf, offset)
+        offset += _HEADER.size
+
+        commands = []
+        for _ in range(n_commands):
+            (robot_id, halt, has_target, x, y, theta, kick_vx, kick_vz, spinner, avoid_area,
+             avoid_opponents, avoid_allies) = _RUBRIC.unpack_from(buf, offset)
+
+            commands.append(RobotRubric(
+                id=robot_id,
+                halt=halt,
+                target_pose=(x, y, theta) if has_target else None,
+                kick_speed=(kick_vx, kick_vz),
+                spinner=spinner,
+                avoid_area=avoid_area,
+                avoid_opponents=_mask_to_ids(avoid_opponents),
+                avoid_allies=_mask_to_ids(avoid_allies)
+            ))
+            offset += _RUBRIC.size
+
+        trace = decode_trace(buf, offset)
+        offset += TRACE_SIZE
+
+        return DecisionData(commands, MatchDataCodec.decode(buf, offset), trace)
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
-from typing import Tuple, Optional
+from typing import Tuple, Optional, TYPE_CHECKING
 from neonfc_ssl.tracking_layer.tracking_data import MatchData
+if TYPE_CHECKING:
+    from neonfc_ssl.core.trace import FrameTrace
 
 
 @dataclass
@@ -28,3 +30,4 @@ class RobotRubric:
 class DecisionData:
     commands: list[RobotRubric]
     world_model: MatchData
+    trace: Optional['FrameTrace'] = None
@@ -23,7 +23,7 @@ class FullBack:
 
         sq_dist_to_ball = lambda r: (r.x - ball.x) ** 2 + (r.y - ball.y) ** 2
         angle_to_ball_delta = lambda r: abs(angle_to_first_quadrant(angle_between(r, ball) - r.theta))
-        closest_op = min(data.opposites.active, key=sq_dist_to_ball, default=None)
+        closest_op = data.features.closest_to_ball('opposites')
 
         use_op_angle = (
                 sq_dist_to_ball(closest_op) < USE_OP_DIST_TOLERANCE
@@ -1,5 +1,6 @@
 from itertools import chain, pairwise
 from neonfc_ssl.commons.math import point_in_triangle
+from neonfc_ssl.commons.field_model import field_model
 from .base_skill import BaseSkill
 from .passing import SimplePass
 
@@ -29,11 +30,7 @@ class Shoot(BaseSkill):
     def find_best_shoot(data: "MatchData"):
         ball = data.ball
         field = data.field
-
-        goal_posts = (
-            (field.field_length, (field.field_width-field.goal_width)/2),
-            (field.field_length, (field.field_width+field.goal_width)/2)
-        )
+        goal_posts = field_model(field).opponent_goal_posts
 
         obstacles = filter(
             lambda r: point_in_triangle(r, ball, goal_posts[0], goal_posts[1]),
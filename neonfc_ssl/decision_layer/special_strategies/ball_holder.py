@@ -15,8 +15,9 @@ def angle_between(p1, p2, p3):
 class BallHolder(SpecialStrategy):
     def __init__(self, logger):
         super().__init__(logger)
-        self.passable_robots = []
-        self.intercepting_robots = []
+        # positions (n, 2) of the active teammates, but the holder, and of the active opponents
+        self.passable_robots = np.empty((0, 2))
+        self.intercepting_robots = np.empty((0, 2))
 
         self._shooting_value = 0
         self._pass_value = 0
@@ -71,8 +72,9 @@ class BallHolder(SpecialStrategy):
         self.active.start(self._robot_id)
 
     def decide(self, data):
-        self.passable_robots = [r for r in data.robots if not r.missing and r.id != self._robot_id]
-        self.intercepting_robots = [r for r in data.opposites if not r.missing]
+        team, opponents = data.robots.arrays, data.opposites.arrays
+        self.passable_robots = team.positions[team.active & (team.ids != self._robot_id)]
+        self.intercepting_robots = opponents.positions[opponents.active]
 
         self.update_shooting_value(data)
         self.update_pass_value(data)
@@ -153,57 +155,41 @@ class BallHolder(SpecialStrategy):
 
     def _pass_probability(self, p, data):
         robot = data.robots[self._robot_id]
-
-        dp = p - robot
-        px = dp[:, 0]
-        py = dp[:, 1]
-
-        norm = px * px + py * py
-        total = np.inf*np.ones(p.shape[0])
-
-        for op in self.intercepting_robots:
-            u = np.divide((op[0] - robot[0]) * px + (op[1] - robot[1]) * py, norm)
-            u = np.minimum(np.maximum(u, 0), 1)
-
-            dx = robot[0] + u * px - op[0]
-            dy = robot[1] + u * py - op[1]
-
-            total = np.minimum(dx**2 + dy**2, total)
-
-        # return total
-        return np.minimum(np.sqrt(total), 1)
+        return self._segment_clearance(np.array(robot, dtype=np.float64), p)
 
     def _receiving_probability(self, p, data):
-        closest_teammate_dist = np.inf * np.ones(p.shape[0])
-        for r in self.passable_robots:
-            closest_teammate_dist = np.minimum(np.sum(np.square(r-p), axis=1), closest_teammate_dist)
-
-        closest_opponent_dist = np.inf * np.ones(p.shape[0])
-        for r in self.intercepting_robots:
-            closest_opponent_dist = np.minimum(np.sum(np.square(r-p), axis=1), closest_opponent_dist)
+        closest_teammate_dist = np.min(self._sq_distances(self.passable_robots, p), axis=0, initial=np.inf)
+        closest_opponent_dist = np.min(self._sq_distances(self.intercepting_robots, p), axis=0, initial=np.inf)
 
         return closest_opponent_dist > closest_teammate_dist
 
     def _goal_probability(self, p, data):
-        dp = np.array([9, 3]) - p
-        px = dp[:, 0]
-        py = dp[:, 1]
+        return self._segment_clearance(p, np.array([9, 3]))
 
+    def _segment_clearance(self, start, end):
+        """Distance, capped at 1, from the closest opponent to each segment from ``start`` to ``end``"""
+        dp = end - start
+        px = dp[..., 0]
+        py = dp[..., 1]
         norm = px * px + py * py
-        total = np.inf*np.ones(p.shape[0])
 
-        for op in self.intercepting_robots:
-            u = np.divide((op[0] - p[:, 0]) * px + (op[1] - p[:, 1]) * py, norm)
-            u = np.minimum(np.maximum(u, 0), 1)
+        # one row per opponent, one column per segment
+        ops = self.intercepting_robots[:, np.newaxis, :]
+        u = np.divide((ops[..., 0] - start[..., 0]) * px + (ops[..., 1] - start[..., 1]) * py, norm)
+        u = np.minimum(np.maximum(u, 0), 1)
 
-            dx = p[:, 0] + u * px - op[0]
-            dy = p[:, 1] + u * py - op[1]
+        dx = start[..., 0] + u * px - ops[..., 0]
+        dy = start[..., 1] + u * py - ops[..., 1]
 
-            total = np.minimum(dx**2 + dy**2, total)
-
-        # return total
+        total = np.min(dx**2 + dy**2, axis=0, initial=np.inf)
         return np.minimum(np.sqrt(total), 1)
 
+    @staticmethod
+    def _sq_distances(robots, p):
+        """Squared distances (n robots, k points) between robot positions and points"""
+        d = robots[:, np.newaxis, :] - p
+        return np.einsum('ijk,ijk->ij', d, d)
+
     @staticmethod
     def _passing_targets():
         dx, dy = 0.1, 0.1
@@ -1,5 +1,6 @@
 from NeonPathPlanning import Point
 from neonfc_ssl.commons.math import point_in_rect, distance_between_points, reduce_ang
+from neonfc_ssl.commons.field_model import field_model
 from math import tan, pi, atan2
 from neonfc_ssl.decision_layer.skills import *
 from neonfc_ssl.decision_layer.special_strategies.special_strategy import SpecialStrategy
@@ -70,10 +71,9 @@ class GoalKeeper(SpecialStrategy):
     # calcula os limites do y
     def limit_y(self, data: "MatchData", x, y):
         ball = data.ball
-        field = data.field
+        field = field_model(data.field)
 
-        y_goal_min = (field.field_width/2)-field.goal_width/2
-        y_goal_max = (field.field_width/2)+field.goal_width/2
+        y_goal_min, y_goal_max = field.goal_y_min, field.goal_y_max
 
         y_max = ((y_goal_max - ball.y) / (-ball.x)) * (x - ball.x) + ball.y
         y_min = ((y_goal_min - ball.y) / (-ball.x)) * (x - ball.x) + ball.y
@@ -98,19 +98,11 @@ class GoalKeeper(SpecialStrategy):
             return field.field_width/2
 
         # checa o robo adversario mais próximo
-        # TODO: rewrite this using the built in min function
-        closest = 100000
-        for op in data.opposites:
-            dist = distance_between_points([ball.x, ball.y], [op.x, op.y])
-            if dist < closest:
-                closest = dist
-                theta = reduce_ang(op.theta - pi)
-                x_robot = op.x
-                y_robot = op.y
+        op = data.features.closest_to_ball('opposites')
 
         # se o robo adversario mais prox da bola estiver perto (15 cm)
-        if closest < 0.15:
-            y = tan(theta) * (x - x_robot) + y_robot
+        if op is not None and distance_between_points(ball, op) < 0.15:
+            y = tan(reduce_ang(op.theta - pi)) * (x - op.x) + op.y
 
         # bola quase parada
         elif abs(ball.vx) < 0.05:
@@ -211,12 +203,9 @@ class GoalKeeper(SpecialStrategy):
 
     def go_to_ball_transition(self, data: "MatchData"):
         ball = data.ball
-        field = data.field
-
-        area_ymin = (field.field_width - field.penalty_width)/2
-        area_ymax = area_ymin + field.penalty_width
+        area = field_model(data.field).friendly_area
 
-        if (ball.x < field.penalty_depth) and (ball.y > area_ymin) and (ball.y < area_ymax):
+        if (ball.x < area.x_max) and (ball.y > area.y) and (ball.y < area.y_max):
             return True
         return False
 
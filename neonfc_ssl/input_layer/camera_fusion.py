@@ -0,0 +1,166 @@
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+from .input_data import Ball, Robot, Entities
+
+# cameras that sent nothing for this long are left out of the cycle (and of the fusion)
+CAMERA_TIMEOUT = 0.5  # s
+# detections are moved to the cycle time with the speed seen by their camera, measured over this long
+SPEED_WINDOW = 0.1  # s
+HISTORY = 8  # frames kept per camera to measure speeds
+# ball detections closer than this are taken as the same ball
+BALL_MERGE_RADIUS = 0.2  # m
+# a ball seen earlier farther than this speed allows is taken as another ball
+MAX_BALL_SPEED = 6.5  # m/s, the rules' kick speed limit
+
+_MIN_CONFIDENCE = 1e-3
+
+
+@dataclass
+class CameraFrame:
+    """Detections of a single camera, positions in meters"""
+    camera_id: int
+    t_capture: float
+    balls: list[Ball] = field(default_factory=list)
+    robots_blue: dict[int, Robot] = field(default_factory=dict)
+    robots_yellow: dict[int, Robot] = field(default_factory=dict)
+
+
+class CameraFusion:
+    """Merges the detections of every camera into one Entities frame per vision cycle.
+
+    The latest frame of each camera is kept. A cycle ends once every active camera reported, or as soon as one
+    reports twice, and then the frames are aligned to the newest capture time, extrapolating each detection with
+    the speed its own camera saw, and the detections of the same object are averaged weighted by confidence. Of
+    the ball candidates, the cluster with the highest total confidence wins. Robots no camera sees are left out,
+    the ball keeps its last position.
+    """
+
+    def __init__(self, camera_timeout: float = CAMERA_TIMEOUT, speed_window: float = SPEED_WINDOW,
+                 ball_merge_radius: float = BALL_MERGE_RADIUS):
+        self.camera_timeout = camera_timeout
+        self.speed_window = speed_window
+        self.ball_merge_radius = ball_merge_radius
+
+        self._latest: dict[int, CameraFrame] = {}
+        self._history: dict[int, deque[CameraFrame]] = {}
+        self._cycle: set[int] = set()
+        self._ball: Optional[Ball] = None
+        self.t_capture: Optional[float] = None  # time the last fused frame was aligned to
+
+    def add(self, frame: CameraFrame) -> Optional[Entities]:
+        """Buffers a camera frame, returns the fused frame if it completed a vision cycle"""
+        fused = None
+        if frame.camera_id in self._cycle:
+            # this camera already started the next cycle, the others are late or gone
+            fused = self.fuse()
+            self._cycle.clear()
+
+        self._history.setdefault(frame.camera_id, deque(maxlen=HISTORY)).append(frame)
+        self._latest[frame.camera_id] = frame
+        self._cycle.add(frame.camera_id)
+
+        if fused is None and self._cycle >= self._active_cameras():
+            fused = self.fuse()
+            self._cycle.clear()
+
+        return fused
+
+    def _active_cameras(self) -> set[int]:
+        newest = max(f.t_capture for f in self._latest.values())
+        return {c for c, f in self._latest.items() if newest - f.t_capture < self.camera_timeout}
+
+    def fuse(self) -> Entities:
+        frames = [self._latest[c] for c in self._active_cameras()]
+        t_ref = self.t_capture = max(f.t_capture for f in frames)
+
+        return Entities(
+            ball=self._fuse_ball(frames, t_ref),
+            robots_blue=self._fuse_robots(frames, t_ref, 'robots_blue'),
+            robots_yellow=self._fuse_robots(frames, t_ref, 'robots_yellow'),
+        )
+
+    def _lookahead(self, frame: CameraFrame) -> Optional[tuple[CameraFrame, float]]:
+        """Oldest frame of the same camera within the speed window and the time since it, to estimate speeds"""
+        for previous in self._history[frame.camera_id]:
+            if 0 < frame.t_capture - previous.t_capture <= self.speed_window:
+                return previous, frame.t_capture - previous.t_capture
+        return None
+
+    def _fuse_robots(self, frames: list[CameraFrame], t_ref: float, team: str) -> dict[int, Robot]:
+        seen: dict[int, list[tuple[float, float, float, float, Robot]]] = {}
+        for frame in frames:
+            dt = t_ref - frame.t_capture
+            lookahead = self._lookahead(frame) if dt > 0 else None
+            for robot_id, robot in getattr(frame, team).items():
+                x, y = robot.x, robot.y
+                if lookahead is not None and (before := getattr(lookahead[0], team).get(robot_id)) is not None:
+                    x += (robot.x - before.x) / lookahead[1] * dt
+                    y += (robot.y - before.y) / lookahead[1] * dt
+                seen.setdefault(robot_id, []).append((x, y, robot.theta, _weight(robot), robot))
+
+        fused = {}
+        for robot_id, detections in seen.items():
+            total = sum(w for *_, w, _ in detections)
+            best = max(detections, key=lambda d: d[3])[4]
+            fused[robot_id] = Robot(
+                id=robot_id,
+                team=best.team,
+                x=sum(x * w for x, _, _, w, _ in detections) / total,
+                y=sum(y * w for _, y, _, w, _ in detections) / total,
+                theta=math.atan2(sum(math.sin(t) * w for _, _, t, w, _ in detections),
+                                 sum(math.cos(t) * w for _, _, t, w, _ in detections)),
+                timestamp=t_ref,
+                confidence=best.confidence,
+                camera_id=best.camera_id,
+            )
+        return fused
+
+    def _fuse_ball(self, frames: list[CameraFrame], t_ref: float) -> Optional[Ball]:
+        candidates = []
+        for frame in frames:
+            dt = t_ref - frame.t_capture
+            lookahead = self._lookahead(frame) if dt > 0 else None
+            for ball in frame.balls:
+                x, y = ball.x, ball.y
+                if lookahead is not None and (before := _closest_ball(*lookahead, ball)) is not None:
+                    x += (ball.x - before.x) / lookahead[1] * dt
+                    y += (ball.y - before.y) / lookahead[1] * dt
+                candidates.append((x, y, _weight(ball), ball))
+
+        # greedy clustering, most confident detections first
+        clusters: list[list[tuple[float, float, float, Ball]]] = []
+        for candidate in sorted(candidates, key=lambda c: -c[2]):
+            for cluster in clusters:
+                x, y = _center(cluster)
+                if math.hypot(candidate[0] - x, candidate[1] - y) <= self.ball_merge_radius:
+                    cluster.append(candidate)
+                    break
+            else:
+                clusters.append([candidate])
+
+        if clusters:
+            cluster = max(clusters, key=lambda c: sum(w for _, _, w, _ in c))
+            x, y = _center(cluster)
+            best = cluster[0][3]
+            self._ball = Ball(x=x, y=y, z=best.z, timestamp=t_ref, confidence=best.confidence,
+                              camera_id=best.camera_id)
+
+        return self._ball
+
+
+def _closest_ball(frame: CameraFrame, dt: float, ball: Ball) -> Optional[Ball]:
+    closest = min(frame.balls, key=lambda b: math.hypot(b.x - ball.x, b.y - ball.y), default=None)
+    if closest is None or math.hypot(closest.x - ball.x, closest.y - ball.y) > MAX_BALL_SPEED * dt:
+        return None
+    return closest
+
+
+def _weight(detection) -> float:
+    return max(detection.confidence if detection.confidence is not None else 1.0, _MIN_CONFIDENCE)
+
+
+def _center(cluster) -> tuple[float, float]:
+    total = sum(w for _, _, w, _ in cluster)
+    return sum(x * w for x, _, w, _ in cluster) / total, sum(y * w for _, y, w, _ in cluster) / total
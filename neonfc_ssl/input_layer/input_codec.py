@@ -0,0 +1,176 @@
+import struct
+from functools import lru_cache
+from neonfc_ssl.core.transport.frame_codec import FrameCodec, MAX_ROBOTS_PER_TEAM, opt_float, from_opt_float, \
+    check_robot_count
+from neonfc_ssl.core.trace import encode_trace, decode_trace, TRACE_SIZE
+from .input_data import Ball, Robot, Entities, Geometry, GameController, InputData
+
+# present, x, y, z, vx, vy, vz, timestamp, confidence, camera_id
+_BALL = struct.Struct('<?8dh')
+# id, x, y, theta, vx, vy, vtheta, timestamp, confidence, camera_id
+_ROBOT = struct.Struct('<B8dh')
+# number of blue robots, number of yellow robots
+_ROBOT_COUNT = struct.Struct('<BB')
+# present, field_length, field_width, goal_width, penalty_depth, penalty_width, version
+_GEOMETRY = struct.Struct('<?5dI')
+# can_play, state, has designated position, designated position, team is blue, command counter
+_GAME_CONTROLLER = struct.Struct('<?32s?2d?q')
+
+GEOMETRY_SIZE = _GEOMETRY.size
+
+STATE_TOO_LONG_MSG = "Game controller state '{}' does not fit in {} bytes"
+
+
+def encode_geometry(geometry: Geometry, buf: memoryview, offset: int) -> int:
+    if geometry is None:
+        _GEOMETRY.pack_into(buf, offset, False, 0, 0, 0, 0, 0, 0)
+    else:
+        _GEOMETRY.pack_into(
+            buf, offset, True,
+            geometry.field_length, geometry.field_width, geometry.goal_width,
+            geometry.penalty_depth, geometry.penalty_width, geometry.version
+        )
+    return _GEOMETRY.size
+
+
+def decode_geometry(buf: bytes | memoryview, offset: int) -> Geometry:
+    return _geometry(_GEOMETRY.unpack_from(buf, offset))
+
+
+@lru_cache(maxsize=4)
+def _geometry(values: tuple) -> Geometry:
+    # the field hardly ever changes, every frame gets the same object until it does
+    present, *values = values
+    return Geometry(*values) if present else None
+
+
+class InputDataCodec(FrameCodec):
+    size = (
+        _BALL.size + _ROBOT_COUNT.size + 2 * MAX_ROBOTS_PER_TEAM * _ROBOT.size + _GEOMETRY.size + _GAME_CONTROLLER.size
+        + TRACE_SIZE
+    )
+
+    @classmethod
+    def encode_into(cls, data: InputData, buf: memoryview, offset: int = 0) -> int:
+        start = offset
+        entities = data.entities
+
+        offset += cls._encode_ball(entities.ball, buf, offset)
+
+        blue, yellow = entities.robots_blue, entities.robots_yellow
+        check_robot_count(cls, len(blue))
+        check_robot_count(cls, len(yellow))
+        _ROBOT_COUNT.pack_into(buf, offset, len(blue), len(yellow))
+        offset += _ROBOT_COUNT.size
+
+        for robot in (*blue.values(), *yellow.values()):
+            _ROBOT.pack_into(
+                buf, offset, robot.id,
+                robot.x, robot.y, robot.theta,
+                opt_float(robot.vx), opt_float(robot.vy), opt_float(robot.vtheta),
+                opt_float(robot.timestamp), opt_float(robot.confidence),
+                -1 if robot.camera_id is None else robot.camera_id
+            )
+            offset += _ROBOT.size
+
+        offset += encode_geometry(data.geometry, buf, offset)
+        offset += cls._encode_game_controller(data.game_controller, buf, offset)
+        offset += encode_trace(data.trace, buf, offset)
+
+        return offset - start
+
+    @classmethod
+    def decode(cls, buf: bytes | memoryview, offset: int = 0) -> InputData:
+        ball = cls._decode_ball(buf, offset)
+        offset += _BALL.size
+
+        n_blue, n_yellow = _ROBOT_COUNT.unpack_from(buf, offset)
+        offset += _ROBOT_COUNT.size
+
+        robots_blue = {}
+        for _ in range(n_blue):
+            robot = cls._decode_robot(buf, offset, 'blue')
+            robots_blue[robot.id] = robot
+            offset += _ROBOT.size
+
+        robots_yellow = {}
+        for _ in range(n_yellow):
+            robot = cls._decode_robot(buf, offset, 'yellow')
+            robots_yellow[robot.id] = robot
+            offset += _ROBOT.size
+
+        geometry = decode_geometry(buf, offset)
+        offset += GEOMETRY_SIZE
+
+        game_controller = cls._decode_game_controller(buf, offset)
+        offset += _GAME_CONTROLLER.size
+
+        return InputData(
+            entities=Entities(ball=ball, robots_blue=robots_blue, robots_yellow=robots_yellow),
+            geometry=geometry,
+            game_controller=game_controller,
+            trace=decode_trace(buf, offset)
+        )
+
+    @staticmethod
+    def _encode_ball(ball: Ball, buf: memoryview, offset: int) -> int:
+        if ball is None:
+            _BALL.pack_into(buf, offset, False, 0, 0, 0, 0, 0, 0, 0, 0, -1)
+        else:
+            _BALL.pack_into(
+                buf, offset, True,
+                ball.x, ball.y, opt_float(ball.z),
+                opt_float(ball.vx), opt_float(ball.vy), opt_float(ball.vz),
+                opt_float(ball.timestamp), opt_float(ball.confidence),
+                -1 if ball.camera_id is None else ball.camera_id
+            )
+        return _BALL.size
+
+    @staticmethod
+    def _decode_ball(buf: bytes | memoryview, offset: int) -> Ball:
+        present, x, y, z, vx, vy, vz, timestamp, confidence, camera_id = _BALL.unpack_from(buf, offset)
+        if not present:
+            return None
+
+        return Ball(
+            x=x, y=y, z=from_opt_float(z),
+            vx=from_opt_float(vx), vy=from_opt_float(vy), vz=from_opt_float(vz),
+            timestamp=from_opt_float(timestamp), confidence=from_opt_float(confidence),
+            camera_id=None if camera_id < 0 else camera_id
+        )
+
+    @staticmethod
+    def _decode_robot(buf: bytes | memoryview, offset: int, team: str) -> Robot:
+        robot_id, x, y, theta, vx, vy, vtheta, timestamp, confidence, camera_id = _ROBOT.unpack_from(buf, offset)
+        return Robot(
+            id=robot_id, team=team,
+            x=x, y=y, theta=theta,
+            vx=from_opt_float(vx), vy=from_opt_float(vy), vtheta=from_opt_float(vtheta),
+            timestamp=from_opt_float(timestamp), confidence=from_opt_float(confidence),
+            camera_id=None if camera_id < 0 else camera_id
+        )
+
+    @staticmethod
+    def _encode_game_controller(gc: GameController, buf: memoryview, offset: int) -> int:
+        state = gc.state.encode()
+        if len(state) > 32:
+            raise ValueError(STATE_TOO_LONG_MSG.format(gc.state, 32))
+
+        pos = gc.designated_position
+        _GAME_CONTROLLER.pack_into(
+            buf, offset, gc.can_play, state,
+            pos is not None, *(pos if pos is not None else (0, 0)),
+            gc.team == 'blue', gc.command_counter
+        )
+        return _GAME_CONTROLLER.size
+
+    @staticmethod
+    def _decode_game_controller(buf: bytes | memoryview, offset: int) -> GameController:
+        can_play, state, has_pos, pos_x, pos_y, is_blue, counter = _GAME_CONTROLLER.unpack_from(buf, offset)
+        return GameController(
+            can_play=can_play,
+            state=state.rstrip(b'\0').decode(),
+            designated_position=(pos_x, pos_y) if has_pos else None,
+            team='blue' if is_blue else 'yellow',
+            command_counter=counter
+        )
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    from neonfc_ssl.core.trace import FrameTrace
 
 
 @dataclass
@@ -40,21 +42,23 @@ class Entities:
     robots_yellow: dict[int, Robot]
 
 
-@dataclass
+@dataclass(frozen=True)
 class Geometry:
     field_length: float
     field_width: float
     goal_width: float
     penalty_depth: float
     penalty_width: float
+    version: int = 0  # bumped by the vision every time the field changes
 
 
-@dataclass
+@dataclass(frozen=True)
 class GameController:
     can_play: bool
     state: str
     designated_position: tuple[int, int]
     team: str
+    command_counter: int = 0  # changes with every new referee command, -1 before the first one
 
 
 @dataclass
@@ -62,4 +66,5 @@ class InputData:
     entities: Entities
     geometry: Geometry
     game_controller: GameController
+    trace: Optional['FrameTrace'] = None
 
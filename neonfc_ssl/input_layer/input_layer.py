@@ -1,37 +1,65 @@
 from typing import Any
 import time
+from functools import partial
+from itertools import count
 from dataclasses import asdict
 from neonfc_ssl.core import Layer
 from neonfc_ssl.core.logger import TRACKING
+from neonfc_ssl.core.trace import FrameTrace
 from .sockets.gr_sim_vision import GrSimVision
 from .sockets.auto_ref_vision import AutoRefVision
 from .sockets.ssl_game_controller import SSLGameControllerReferee
+from .sockets.async_input import AsyncInput
+from .sockets.udp_capture import UdpRecorder, UdpReplay
 from .input_data import InputData
+from .input_codec import InputDataCodec
+
+SOCKET_STATS_LOG = "{} socket: {} packets received, {} dropped while catching up, {} late"
+CAPTURE_LOG = "Recording the vision, autoref and referee packets to {}"
+REPLAY_LOG = "Replaying {} at {}"
+REFEREE_COMMAND_LOG = "Referee command #{}: {}"
+
+# "threads" runs a thread per socket, "asyncio" serves every socket from one event loop
+INPUT_BACKENDS = ('threads', 'asyncio')
+UNKNOWN_INPUT_BACKEND_ERROR = "Unknown input backend '{}', must be one of {}"
 
 
 class InputLayer(Layer):
+    OUTPUT_CODEC = InputDataCodec
+    TRACE_STAGE = 'input'
+
     def __init__(self, config, log_q):
         super().__init__("InputLayer", config, log_q)
 
         if self.config['side'] != 'left' and self.config['side'] != 'right':
             raise ValueError("side must be either 'left' or 'right'")
 
+        self.backend = self.config.get("backend", "threads")
+        if self.backend not in INPUT_BACKENDS:
+            raise ValueError(UNKNOWN_INPUT_BACKEND_ERROR.format(self.backend, INPUT_BACKENDS))
+
         self.ssl_vison = GrSimVision(self.config, self.logger)
         self.auto_ref = AutoRefVision(self.config, self.logger)
         self.referee = SSLGameControllerReferee(self.config, self.logger)
+        self.sources = {'vision': self.ssl_vison, 'autoref': self.auto_ref, 'referee': self.referee}
+        self.async_input = None  # event loop serving the sources, with the asyncio backend
+        self.recorder = None
+        self.replay = None
 
         self.use_ref_vision = self.config["use_ref_vision"]
+        self.frame_ids = count(1)
+
+        self.socket_report_period = self.config.get("socket_report_period", 5.0)  # s
+        self.__last_socket_report = 0
+        self.__socket_losses = {}
 
     def _step(self, data) -> Any:
-        if self.use_ref_vision:
-            while not self.auto_ref.new_data:
-                time.sleep(0.01)
-            vision_data = self.auto_ref.get_last_frame()
+        vision = self.auto_ref if self.use_ref_vision else self.ssl_vison
+        # woken up by the receiver thread as soon as a detection is published
+        frame = vision.wait_frame()
 
-        else:
-            while not self.ssl_vison.new_data:
-                time.sleep(0.01)
-            vision_data = self.ssl_vison.get_last_frame()
+        trace = FrameTrace(next(self.frame_ids), t_capture=frame.t_capture)
+        trace.mark('received', frame.received)
 
         geometry = self.ssl_vison.get_geometry()
         # self.log(GAME, {
@@ -39,17 +67,79 @@ class InputLayer(Layer):
         #     "content": asdict(geometry)
         # })
         gc = self.referee.get_data()
+        self.__report_sockets()
 
         return InputData(
-            entities=vision_data,
+            entities=frame.entities,
             geometry=geometry,
-            game_controller=gc
+            game_controller=gc,
+            trace=trace
         )
 
+    def __report_sockets(self):
+        if (now := time.monotonic()) - self.__last_socket_report < self.socket_report_period:
+            return
+        self.__last_socket_report = now
+
+        for name, source in self.sources.items():
+            receiver = source.receiver
+            losses = (receiver.dropped, receiver.late)
+            if losses != self.__socket_losses.get(name, (0, 0)):
+                self.__socket_losses[name] = losses
+                self.logger.info(SOCKET_STATS_LOG.format(name, receiver.received, *losses))
+
+    def __open_capture(self):
+        """Records the feeds and/or reads them from a recording instead of the network, as configured"""
+        if capture := self.config.get("capture"):
+            self.logger.info(CAPTURE_LOG.format(capture))
+            self.recorder = UdpRecorder(capture)
+            for name, source in self.sources.items():
+                source.receiver.tap = self.recorder.tap(name)
+
+        if replay := self.config.get("replay"):
+            speed = self.config.get("replay_speed", 1.0)
+            self.logger.info(REPLAY_LOG.format(replay, f"{speed}x" if speed else "full speed"))
+            self.replay = UdpReplay(replay, speed=speed, logger=self.logger)
+            for name, source in self.sources.items():
+                source.socket_factory = partial(self.replay.feed_socket, name)
+
+    def __on_referee_command(self, gc):
+        self.logger.info(REFEREE_COMMAND_LOG.format(gc.command_counter, gc.state))
+
     def _start(self):
-        self.ssl_vison.start()
-        self.auto_ref.start()
-        self.referee.start()
+        self.__open_capture()
+        self.referee.subscribe(self.__on_referee_command)
+
+        if self.backend == "asyncio":
+            self.async_input = AsyncInput(
+                self.sources,
+                self.logger,
+                feed_timeout=self.config.get("feed_timeout", 1.0),
+            )
+            self.async_input.start()
+        else:
+            self.ssl_vison.start()
+            self.auto_ref.start()
+            self.referee.start()
+
+        if self.replay is not None:
+            self.replay.start()
 
         while not self.ssl_vison.any_geometry:
             time.sleep(0.1)
+
+    def _stop(self):
+        if self.replay is not None:
+            self.replay.stop()
+
+        # the event loop must be done with the sockets before they are closed
+        if self.async_input is not None:
+            self.async_input.stop()
+            self.async_input.join(timeout=1.0)
+        for source in self.sources.values():
+            if source.receiver.sock is not None:
+                source.stop()
+
+        # the last second of a capture is only flushed on close
+        if self.recorder is not None:
+            self.recorder.close()
@@ -0,0 +1,89 @@
+import asyncio
+import threading
+import time
+from typing import Protocol
+
+FEED_LOST_LOG = "No packets from the {} feed for {:.1f} s"
+FEED_RESTORED_LOG = "{} feed is back"
+
+
+class InputSource(Protocol):
+    running: bool
+
+    def open_socket(self): ...
+
+    def poll(self): ...
+
+
+class AsyncInput(threading.Thread):
+    """Serves every input socket from one asyncio event loop, in a single thread.
+
+    Each source socket is made non-blocking and registered as a reader on the loop, which calls the source ``poll``
+    as soon as packets are waiting, so parsing, draining and frame publishing are the same as with one thread per
+    socket. A feed that stays silent for ``feed_timeout`` seconds is reported as lost, and again once it's back.
+    """
+
+    def __init__(self, sources: dict[str, InputSource], logger, feed_timeout: float = 1.0):
+        super().__init__(daemon=True)
+        self.sources = sources
+        self.logger = logger
+        self.feed_timeout = feed_timeout
+
+        self.last_packet = {}  # source name -> monotonic time of its last packet
+        self.lost = set()
+        self._loop = None
+        self._serving_since = 0.0
+
+    def run(self):
+        self._loop = asyncio.new_event_loop()
+        serving = self._loop.create_task(self._serve())
+        serving.add_done_callback(lambda _: self._loop.stop())  # only ends on errors, raised below
+        try:
+            self._loop.run_forever()
+        finally:
+            serving.cancel()
+            self._loop.run_until_complete(asyncio.gather(serving, return_exceptions=True))
+            self._loop.close()
+
+        if not serving.cancelled():
+            serving.result()
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    async def _serve(self):
+        loop = asyncio.get_running_loop()
+        self._serving_since = time.monotonic()
+
+        for name, source in self.sources.items():
+            sock = source.open_socket()
+            sock.setblocking(False)
+            loop.add_reader(sock.fileno(), self._on_readable, name, source)
+            source.running = True  # as its own thread would, cleared by its stop
+
+        while True:
+            await asyncio.sleep(self.feed_timeout / 2)
+            self._check_feeds()
+
+    def _on_readable(self, name: str, source: InputSource):
+        try:
+            source.poll()
+        except (BlockingIOError, InterruptedError):  # woken up without a packet
+            return
+        except Exception:
+            self.logger.exception(f"Error reading the {name} feed")
+            return
+
+        self.last_packet[name] = time.monotonic()
+        if name in self.lost:
+            self.lost.discard(name)
+            self.logger.info(FEED_RESTORED_LOG.format(name))
+
+    def _check_feeds(self):
+        now = time.monotonic()
+        for name in self.sources:
+            silent = now - self.last_packet.get(name, self._serving_since)
+            if silent >= self.feed_timeout and name not in self.lost:
+                self.lost.add(name)
+                self.logger.warning(FEED_LOST_LOG.format(name, silent))
@@ -1,12 +1,23 @@
-import json
 import socket
 import struct
 import logging
 import threading
 import math
-from google.protobuf.json_format import MessageToJson
+import time
+from typing import Optional
 from neonfc_ssl.protocols.gc.ssl_vision_wrapper_tracked_pb2 import TrackerWrapperPacket
+from neonfc_ssl.protocols.gc.ssl_gc_common_pb2 import Team
 from ..input_data import Ball, Robot, Entities
+from .datagram_receiver import DatagramReceiver, read_field
+from .frame_handoff import FrameHandoff, VisionFrame
+
+
+def _tracker_uuid(packet):
+    try:
+        uuid = read_field(packet, 1)
+        return None if uuid is None else bytes(packet[uuid[0]:uuid[1]])
+    except IndexError:  # malformed, left for ParseFromString to complain
+        return None
 
 
 class AutoRefVision(threading.Thread):
@@ -18,11 +29,15 @@ class AutoRefVision(threading.Thread):
         self.running = False
 
         self._fps = 60
-        self.new_data = False
+        self.handoff = FrameHandoff()
+        self.last_received = None  # monotonic time the last detection arrived
+        self.last_t_capture = None  # capture time of the last detection, on the vision clock
 
         self.raw_detection: Entities = Entities(None, {}, {})
         self.side_factor = 1
         self.angle_factor = 0
+        self.receiver = DatagramReceiver(None)
+        self.socket_factory = self._create_socket  # replaced to read from a replay
 
         self.vision_port = self.config['autoref_port']
         self.host = self.config['multicast_ip']
@@ -32,51 +47,63 @@ class AutoRefVision(threading.Thread):
     def run(self):
         self.logger.info(f"Starting AutoRef-Vision module...")
         self.logger.info(f"Creating socket with address: {self.host} and port: {self.vision_port}")
-        self.vision_sock = self._create_socket()
+        self.open_socket()
         self._wait_to_connect()
         self.logger.info(f"AutoRef-Vision module started!")
 
         self.running = True
         while self.running:
+            self.poll()
+        self.stop()
+
+    def open_socket(self) -> socket.socket:
+        self.vision_sock = self.socket_factory()
+        self.receiver.sock = self.vision_sock
+        return self.vision_sock
+
+    def poll(self):
+        """Reads the packets waiting on the socket (blocks for the first one if the socket is blocking)"""
+        # when behind, only the newest packet of each tracker is worth parsing
+        packets = self.receiver.receive(key=_tracker_uuid)
+        received = time.monotonic()
+        updated = False
+        for data in packets:
             env = TrackerWrapperPacket()
-            data = self.vision_sock.recv(2048)
             env.ParseFromString(data)
-            last_frame = json.loads(MessageToJson(env))
-            self.new_data = self.update_detection(last_frame) or self.new_data
-        self.stop()
+            updated = self.update_detection(env) or updated
+
+        if updated:
+            self.last_received = received
+            self.publish_frame()
 
     def stop(self):
         self.running = False
         self.vision_sock.close()
         self.logger.info(f"AutoRef-Vision module stopped!")
 
-    def update_detection(self, last_frame):
+    def update_detection(self, last_frame: TrackerWrapperPacket):
         # print(last_frame)
-        # if last_frame.get("uuid") != "odvppkjjmzivzjfewcoeflgwbiuazobk":
+        # if last_frame.uuid != "odvppkjjmzivzjfewcoeflgwbiuazobk":
         #     return
 
-        frame = last_frame.get('trackedFrame', None)
-        if not frame:
+        if not last_frame.HasField('tracked_frame'):
             # pacote de deteccao sem frame
             return False
-        t_capture = frame.get('timestamp')
+
+        frame = last_frame.tracked_frame
+        t_capture = frame.timestamp
+        if self.receiver.is_late(last_frame.uuid, t_capture):
+            return False
+        self.last_t_capture = t_capture
 
         # TODO: this should be done in tracking not in input
         self.side_factor = 1 if self.config['side'] == 'left' else -1
         self.angle_factor = 0 if self.config['side'] == 'left' else math.pi
 
-        balls = frame.get('balls', [])
-        self.update_ball_detection(balls, t_capture)
-
-        robots = frame.get('robots')
-        if robots:
-            for robot in robots:
-                self.update_robot_detection(robot, t_capture)
+        self.update_ball_detection(frame.balls, t_capture)
 
-        robots_yellow = frame.get('robotsYellow')
-        if robots_yellow:
-            for robot in robots_yellow:
-                self.update_robot_detection(robot, t_capture)
+        for robot in frame.robots:
+            self.update_robot_detection(robot, t_capture)
 
         return True
 
@@ -85,23 +112,23 @@ class AutoRefVision(threading.Thread):
             return
 
         ball = balls[0]
-        pos = ball['pos']
-        speed = ball['vel']
+        pos = ball.pos
+        speed = ball.vel
         self.raw_detection.ball = Ball(
-            x=self.side_factor*pos['x'],
-            y=self.side_factor*pos['y'],
-            z=pos['z'],
-            vx=self.side_factor*speed['x'],
-            vy=self.side_factor*speed['y'],
-            vz=speed['z'],
+            x=self.side_factor*pos.x,
+            y=self.side_factor*pos.y,
+            z=pos.z,
+            vx=self.side_factor*speed.x,
+            vy=self.side_factor*speed.y,
+            vz=speed.z,
             timestamp=_timestamp
         )
 
     def update_robot_detection(self, robot, _timestamp):
-        robot_id = robot['robotId']['id']
-        color = 'blue' if robot['robotId']['team'] == 'BLUE' else 'yellow'
-        pos = robot['pos']
-        speed = robot['vel']
+        robot_id = robot.robot_id.id
+        color = 'blue' if robot.robot_id.team == Team.BLUE else 'yellow'
+        pos = robot.pos
+        speed = robot.vel
 
         # last_robot_data = self.raw_detection[color][robot_id]
         # if last_robot_data.get('tCapture') > _timestamp:
@@ -111,12 +138,12 @@ class AutoRefVision(threading.Thread):
             self.raw_detection.robots_blue[robot_id] = Robot(
                 id=robot_id,
                 team=color,
-                x=self.side_factor*pos['x'],
-                y=self.side_factor*pos['y'],
-                theta=robot['orientation'] + self.angle_factor,
-                vx=self.side_factor*speed['x'],
-                vy=self.side_factor*speed['y'],
-                vtheta=robot['velAngular'],
+                x=self.side_factor*pos.x,
+                y=self.side_factor*pos.y,
+                theta=robot.orientation + self.angle_factor,
+                vx=self.side_factor*speed.x,
+                vy=self.side_factor*speed.y,
+                vtheta=robot.vel_angular,
                 timestamp=_timestamp
             )
 
@@ -124,18 +151,31 @@ class AutoRefVision(threading.Thread):
             self.raw_detection.robots_yellow[robot_id] = Robot(
                 id=robot_id,
                 team=color,
-                x=self.side_factor*pos['x'],
-                y=self.side_factor*pos['y'],
-                theta=robot['orientation'] + self.angle_factor,
-                vx=self.side_factor*speed['x'],
-                vy=self.side_factor*speed['y'],
-                vtheta=robot['velAngular'],
+                x=self.side_factor*pos.x,
+                y=self.side_factor*pos.y,
+                theta=robot.orientation + self.angle_factor,
+                vx=self.side_factor*speed.x,
+                vy=self.side_factor*speed.y,
+                vtheta=robot.vel_angular,
                 timestamp=_timestamp
             )
 
+    def publish_frame(self):
+        # the detection dicts keep being updated, the layer gets copies (robots and ball are replaced, not mutated)
+        detection = self.raw_detection
+        self.handoff.publish(VisionFrame(
+            entities=Entities(detection.ball, dict(detection.robots_blue), dict(detection.robots_yellow)),
+            received=self.last_received,
+            t_capture=self.last_t_capture,
+        ))
+
+    def wait_frame(self, timeout: Optional[float] = None) -> Optional[VisionFrame]:
+        """Blocks until a detection newer than the last one taken arrives, returns None on timeout"""
+        return self.handoff.take(timeout)
+
     def get_last_frame(self) -> Entities:
-        self.new_data = False
-        return self.raw_detection
+        frame = self.handoff.latest()
+        return Entities(None, {}, {}) if frame is None else frame.entities
 
     def _wait_to_connect(self):
         self.vision_sock.recv(1024)
@@ -0,0 +1,132 @@
+import socket
+from collections import deque
+from typing import Callable, Hashable, Optional
+
+PACKET_SIZE = 2048  # bytes, what the receivers always read per packet
+SLOTS = 16  # packets kept per drain, older ones are dropped
+
+# re-stamped packets older than this are taken as the source restarting its clock rather than as late
+CLOCK_RESET = 1.0  # s
+
+_MSG_DONTWAIT = getattr(socket, 'MSG_DONTWAIT', 0)
+
+
+class DatagramReceiver:
+    """Receives datagrams into preallocated buffers and drains whatever is already queued on the socket.
+
+    ``receive`` blocks until a packet arrives and then reads, without blocking, the packets queued behind it. When
+    a ``key`` function is given (e.g. the camera id) only the newest packet of each key is returned, the older ones
+    are counted in ``dropped``, as are the packets overwritten when more than ``slots`` were queued. The returned
+    views point into the receiver buffers and are only valid until the next ``receive``. Every packet read is also
+    handed to ``tap``, if set (e.g. to record the feed).
+    """
+
+    def __init__(self, sock: socket.socket, packet_size: int = PACKET_SIZE, slots: int = SLOTS):
+        self.sock = sock
+        self._buffers = [bytearray(packet_size) for _ in range(slots)]
+        self._views = [memoryview(buffer) for buffer in self._buffers]
+        self._packets = deque(maxlen=slots)  # (slot, size) of the packets of the last drain
+
+        self.received = 0  # packets read from the socket
+        self.dropped = 0  # packets read but never returned because a newer one replaced them
+        self.late = 0  # packets returned but older than one already processed, see is_late
+        self._last_stamp = {}
+        self.tap: Optional[Callable[[memoryview], None]] = None
+
+    def receive(self, key: Optional[Callable[[memoryview], Optional[Hashable]]] = None) -> list[memoryview]:
+        self._packets.clear()
+        slots = len(self._views)
+
+        count = 0
+        size = self.sock.recv_into(self._views[0])
+        while True:
+            if self.tap is not None:
+                self.tap(self._views[count % slots][:size])
+            self._packets.append((count % slots, size))
+            count += 1
+            try:
+                size = self._recv_nowait(self._views[count % slots])
+            except (BlockingIOError, InterruptedError):
+                break
+
+        packets = [self._views[slot][:size] for slot, size in self._packets]
+        if key is not None:
+            packets = self._newest(packets, key)
+
+        self.received += count
+        self.dropped += count - len(packets)
+        return packets
+
+    def _recv_nowait(self, view: memoryview) -> int:
+        if _MSG_DONTWAIT:
+            return self.sock.recv_into(view, 0, _MSG_DONTWAIT)
+
+        # sockets served by an event loop are already non-blocking, and others may have a timeout to keep
+        timeout = self.sock.gettimeout()
+        if timeout == 0.0:
+            return self.sock.recv_into(view)
+
+        self.sock.setblocking(False)
+        try:
+            return self.sock.recv_into(view)
+        finally:
+            self.sock.settimeout(timeout)
+
+    @staticmethod
+    def _newest(packets: list[memoryview], key) -> list[memoryview]:
+        newest = {}
+        for i, packet in enumerate(packets):
+            k = key(packet)
+            # packets without a key are always kept
+            newest[i if k is None else (k,)] = i
+        return [packets[i] for i in sorted(newest.values())]
+
+    def is_late(self, key: Hashable, stamp: float) -> bool:
+        """Whether a packet stamped ``stamp`` (e.g. its capture time) is older than the last one seen for ``key``"""
+        last = self._last_stamp.get(key)
+        if last is not None and last - CLOCK_RESET < stamp <= last:
+            self.late += 1
+            return True
+
+        self._last_stamp[key] = stamp
+        return False
+
+
+def read_field(buf, number: int, start: int = 0, end: Optional[int] = None):
+    """Looks for field ``number`` in a serialized protobuf message without parsing it.
+
+    Returns the value of a varint field, the ``(start, end)`` bounds of a length-delimited one, or None if the field
+    isn't there. Fixed size fields can only be skipped.
+    """
+    end = len(buf) if end is None else end
+    pos = start
+    while pos < end:
+        tag, pos = _varint(buf, pos)
+        field, wire_type = tag >> 3, tag & 7
+        if wire_type == 0:
+            value, pos = _varint(buf, pos)
+            if field == number:
+                return value
+        elif wire_type == 2:
+            length, pos = _varint(buf, pos)
+            if field == number:
+                return pos, pos + length
+            pos += length
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 5:
+            pos += 4
+        else:
+            return None
+    return None
+
+
+def _varint(buf, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
@@ -0,0 +1,47 @@
+import threading
+from dataclasses import dataclass
+from typing import Optional
+from ..input_data import Entities
+
+
+@dataclass(frozen=True)
+class VisionFrame:
+    entities: Entities
+    received: float  # monotonic time the detection arrived
+    t_capture: Optional[float]  # capture time, on the vision clock
+
+
+class FrameHandoff:
+    """Hands the newest frame of a receiver thread over to the input layer.
+
+    The receiver publishes immutable snapshots into a single slot, replacing the previous one, and wakes up whoever
+    waits on it. Taking a frame returns the newest snapshot as a whole, never one the receiver is still writing.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._frame: Optional[VisionFrame] = None
+        self._published = 0
+        self._taken = 0
+
+    @property
+    def pending(self) -> bool:
+        return self._published != self._taken
+
+    def publish(self, frame: VisionFrame):
+        with self._cond:
+            self._frame = frame
+            self._published += 1
+            self._cond.notify_all()
+
+    def take(self, timeout: Optional[float] = None) -> Optional[VisionFrame]:
+        """Waits for a frame that wasn't taken yet and returns it, or None if none came within ``timeout``"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._published != self._taken, timeout):
+                return None
+
+            self._taken = self._published
+            return self._frame
+
+    def latest(self) -> Optional[VisionFrame]:
+        return self._frame
@@ -1,12 +1,24 @@
-import json
 import socket
 import struct
 import logging
 import threading
 import math
-from google.protobuf.json_format import MessageToJson
+import time
+from dataclasses import replace
+from typing import Optional
 from neonfc_ssl.protocols.grSim import ssl_vision_wrapper_pb2
 from ..input_data import Ball, Robot, Geometry, Entities
+from .datagram_receiver import DatagramReceiver, read_field
+from .frame_handoff import FrameHandoff, VisionFrame
+from ..camera_fusion import CameraFusion, CameraFrame
+
+
+def _camera_id(packet):
+    try:
+        detection = read_field(packet, 1)
+        return None if detection is None else read_field(packet, 4, *detection)
+    except IndexError:  # malformed, left for ParseFromString to complain
+        return None
 
 
 class GrSimVision(threading.Thread):
@@ -18,11 +30,16 @@ class GrSimVision(threading.Thread):
         self.running = False
 
         self._fps = 60
-        self.new_data = False
+        self.handoff = FrameHandoff()
+        self.last_received = None  # monotonic time the last detection arrived
+        self.last_t_capture = None  # capture time of the last detection, on the vision clock
         self.any_geometry = False
 
         self.raw_detection: Entities = Entities(None, {}, {})
         self.raw_geometry: Geometry = None
+        self.receiver = DatagramReceiver(None)
+        self.socket_factory = self._create_socket  # replaced to read from a replay
+        self.fusion = CameraFusion(camera_timeout=self.config.get("camera_timeout", 0.5))
 
         self.side_factor = 1
         self.angle_factor = 0
@@ -37,121 +54,146 @@ class GrSimVision(threading.Thread):
         self.logger.info(
             f"Creating socket with address: {self.host} and port: {self.vision_port}"
         )
-        self.vision_sock = self._create_socket()
+        self.open_socket()
         self._wait_to_connect()
         self.logger.info(f"SSL-Vision module started!")
 
         self.running = True
         while self.running:
-            env = ssl_vision_wrapper_pb2.SSL_WrapperPacket()
-            data = self.vision_sock.recv(2048)
+            self.poll()
+        self.stop()
 
+    def open_socket(self) -> socket.socket:
+        self.vision_sock = self.socket_factory()
+        self.receiver.sock = self.vision_sock
+        return self.vision_sock
+
+    def poll(self):
+        """Reads the packets waiting on the socket (blocks for the first one if the socket is blocking)"""
+        # when behind, only the newest packet of each camera is worth parsing
+        packets = self.receiver.receive(key=_camera_id)
+        received = time.monotonic()
+
+        updated = False
+        for data in packets:
+            env = ssl_vision_wrapper_pb2.SSL_WrapperPacket()
             env.ParseFromString(data)
+            updated = self.update_detection(env) or updated
 
-            last_frame = json.loads(MessageToJson(env))
-            self.new_data = self.update_detection(last_frame) or self.new_data
-        self.stop()
+        if updated:
+            self.last_received = received
+            self.publish_frame()
 
     def stop(self):
         self.running = False
         self.vision_sock.close()
         self.logger.info(f"SSL-Vision module stopped!")
 
-    def update_detection(self, last_frame):
-        geometry = last_frame.get("geometry")
-        self.any_geometry = self.any_geometry or self.update_geometry(geometry)
+    def update_detection(self, last_frame: ssl_vision_wrapper_pb2.SSL_WrapperPacket):
+        if last_frame.HasField("geometry"):
+            self.any_geometry = self.update_geometry(last_frame.geometry) or self.any_geometry
 
-        frame = last_frame.get("detection")
-        if not frame:
+        if not last_frame.HasField("detection"):
             # pacote de deteccao sem frame
             return False
 
-        t_capture = frame.get("tCapture")
-        camera_id = frame.get("cameraId")
+        frame = last_frame.detection
+        t_capture = frame.t_capture
+        camera_id = frame.camera_id
+        if self.receiver.is_late(camera_id, t_capture):
+            return False
 
         # TODO: this should be done in tracking not in input
         self.side_factor = 1 if self.config["side"] == "left" else -1
         self.angle_factor = 0 if self.config["side"] == "left" else math.pi
 
-        balls = frame.get("balls", [])
-        self.update_ball_detection(balls, camera_id)
+        detections = CameraFrame(camera_id, t_capture)
+        self.update_ball_detection(frame.balls, detections)
 
-        robots_blue = frame.get("robotsBlue")
-        if robots_blue:
-            for robot in robots_blue:
-                self.update_robot_detection(robot, t_capture, camera_id, color="blue")
+        for robot in frame.robots_blue:
+            self.update_robot_detection(robot, detections, color="blue")
 
-        robots_yellow = frame.get("robotsYellow")
-        if robots_yellow:
-            for robot in robots_yellow:
-                self.update_robot_detection(robot, t_capture, camera_id, color="yellow")
+        for robot in frame.robots_yellow:
+            self.update_robot_detection(robot, detections, color="yellow")
+
+        # one frame is published per vision cycle, once the cameras are merged
+        fused = self.fusion.add(detections)
+        if fused is None:
+            return False
 
+        self.raw_detection = fused
+        self.last_t_capture = self.fusion.t_capture
         return True
 
     def update_geometry(self, frame):
-        if not frame:
-            # pacote de deteccao sem frame
+        if not frame.HasField("field"):
+            # pacote de geometria sem campo
             return False
 
-        frame = frame.get("field")
+        frame = frame.field
 
-        self.raw_geometry = Geometry(
-            field_length=frame.get("fieldLength") / 1000,
-            field_width=frame.get("fieldWidth") / 1000,
-            goal_width=frame.get("goalWidth") / 1000,
-            penalty_depth=frame.get("penaltyAreaDepth", 1000) / 1000,
-            penalty_width=frame.get("penaltyAreaWidth", 2000) / 1000,
+        geometry = Geometry(
+            field_length=frame.field_length / 1000,
+            field_width=frame.field_width / 1000,
+            goal_width=frame.goal_width / 1000,
+            penalty_depth=(frame.penalty_area_depth if frame.HasField("penalty_area_depth") else 1000) / 1000,
+            penalty_width=(frame.penalty_area_width if frame.HasField("penalty_area_width") else 2000) / 1000,
+            version=0 if self.raw_geometry is None else self.raw_geometry.version,
         )
 
+        # vision resends the geometry all the time, consumers only see a new one (and version) when it changes
+        if geometry != self.raw_geometry:
+            if self.raw_geometry is not None:
+                geometry = replace(geometry, version=geometry.version + 1)
+            self.raw_geometry = geometry
+
         return True
 
-    def update_ball_detection(self, balls, camera_id):
-        if len(balls) < 1:
+    def update_ball_detection(self, balls, detections: CameraFrame):
+        for ball in balls:
+            detections.balls.append(Ball(
+                x=self.side_factor * ball.x / 1000,
+                y=self.side_factor * ball.y / 1000,
+                timestamp=detections.t_capture,
+                confidence=ball.confidence,
+                camera_id=detections.camera_id,
+            ))
+
+    def update_robot_detection(self, robot, detections: CameraFrame, color="blue"):
+        robots = detections.robots_blue if color == "blue" else detections.robots_yellow
+
+        # a camera may see the same id twice, keep the detection it is surest of
+        last = robots.get(robot.robot_id)
+        if last is not None and last.confidence >= robot.confidence:
             return
 
-        ball = balls[0]
-        self.raw_detection.ball = Ball(
-            x=self.side_factor * ball.get("x") / 1000,
-            y=self.side_factor * ball.get("y") / 1000,
-            timestamp=ball.get("tCapture"),
-            camera_id=camera_id,
+        robots[robot.robot_id] = Robot(
+            id=robot.robot_id,
+            team=color,
+            x=self.side_factor * robot.x / 1000,
+            y=self.side_factor * robot.y / 1000,
+            theta=robot.orientation + self.angle_factor,
+            timestamp=detections.t_capture,
+            confidence=robot.confidence,
+            camera_id=detections.camera_id,
         )
 
-    def update_robot_detection(self, robot, _timestamp, camera_id, color="blue"):
-        robot_id = robot.get("robotId")
-
-        # last_robot_data = self.raw_detection[
-        #     'robots' + color
-        #  ][robot_id]
-        #
-        # if last_robot_data.get('tCapture') > _timestamp:
-        #     return
-
-        if color == "blue":
-            self.raw_detection.robots_blue[robot_id] = Robot(
-                id=robot_id,
-                team=color,
-                x=self.side_factor * robot["x"] / 1000,
-                y=self.side_factor * robot["x"] / 1000,
-                theta=robot["orientation"] + self.angle_factor,
-                timestamp=_timestamp,
-                camera_id=camera_id,
-            )
-
-        else:
-            self.raw_detection.robots_yellow[robot_id] = Robot(
-                id=robot_id,
-                team=color,
-                x=self.side_factor * robot["x"] / 1000,
-                y=self.side_factor * robot["x"] / 1000,
-                theta=robot["orientation"] + self.angle_factor,
-                timestamp=_timestamp,
-                camera_id=camera_id,
-            )
+    def publish_frame(self):
+        # the detection dicts keep being updated, the layer gets copies (robots and ball are replaced, not mutated)
+        detection = self.raw_detection
+        self.handoff.publish(VisionFrame(
+            entities=Entities(detection.ball, dict(detection.robots_blue), dict(detection.robots_yellow)),
+            received=self.last_received,
+            t_capture=self.last_t_capture,
+        ))
+
+    def wait_frame(self, timeout: Optional[float] = None) -> Optional[VisionFrame]:
+        """Blocks until a detection newer than the last one taken arrives, returns None on timeout"""
+        return self.handoff.take(timeout)
 
     def get_last_frame(self) -> Entities:
-        self.new_data = False
-        return self.raw_detection
+        frame = self.handoff.latest()
+        return Entities(None, {}, {}) if frame is None else frame.entities
 
     def get_geometry(self) -> Geometry:
         return self.raw_geometry
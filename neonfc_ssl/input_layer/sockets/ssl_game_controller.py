@@ -1,11 +1,15 @@
-import json
 import socket
 import struct
 import threading
 import logging
-from google.protobuf.json_format import MessageToJson
+from typing import Callable, Optional
 from neonfc_ssl.protocols.gc.ssl_gc_referee_message_pb2 import Referee
 from ..input_data import GameController
+from .datagram_receiver import DatagramReceiver, read_field
+
+# Referee message fields read before deciding whether the packet is worth parsing
+_PACKET_TIMESTAMP = 1
+_COMMAND_COUNTER = 5
 
 
 class SSLGameControllerReferee(threading.Thread):
@@ -19,7 +23,13 @@ class SSLGameControllerReferee(threading.Thread):
         self.referee_port = self.config["game_controller_port"]
         self.host = self.config["game_controller_ip"]
 
-        self._referee_message = {}
+        self._referee_message: Optional[Referee] = None
+        self._command = ""
+        self._packet_timestamp = 0
+        self._game_controller = self._snapshot()
+        self._subscribers: list[Callable[[GameController], None]] = []
+        self.receiver = DatagramReceiver(None)
+        self.socket_factory = self._create_socket  # replaced to read from a replay
 
         self.logger = log
 
@@ -27,28 +37,71 @@ class SSLGameControllerReferee(threading.Thread):
         """Calls _create_socket() and parses the status message from the Referee."""
         self.logger.info("Starting referee module...")
         self.logger.info(f"Creating socket with address: {self.host} and port: {self.referee_port}")
-        self.referee_sock = self._create_socket()
+        self.open_socket()
         self.logger.info("Referee module started!")
 
         self.running = True
         while self.running:
-            c = Referee()
-            data = self.referee_sock.recv(2048)
-            try:
-                c.ParseFromString(data)
-                self._referee_message = json.loads(MessageToJson(c))
-            except Exception as e:
-                print(e)
-                pass
+            self.poll()
             # print(self._referee_message)
         self.stop()
 
+    def open_socket(self) -> socket.socket:
+        self.referee_sock = self.socket_factory()
+        self.receiver.sock = self.referee_sock
+        return self.referee_sock
+
+    def poll(self):
+        """Reads the packets waiting on the socket (blocks for the first one if the socket is blocking)"""
+        # every message holds the whole referee state, only the newest one matters
+        packets = self.receiver.receive(key=lambda _: 0)
+        self.update_referee(packets[-1])
+
+    def update_referee(self, data: bytes) -> bool:
+        """Parses a referee packet if it carries a new command, returns whether the game controller state changed"""
+        # the game controller resends the same state ~every 100 ms, only the command counter tells a new one
+        if self._referee_message is not None:
+            try:
+                stamp, counter = read_field(data, _PACKET_TIMESTAMP), read_field(data, _COMMAND_COUNTER)
+            except IndexError:  # malformed, left for ParseFromString to complain
+                stamp = counter = None
+            # an older timestamp means the game controller restarted, and its counter with it
+            if counter == self._referee_message.command_counter and stamp is not None \
+                    and stamp >= self._packet_timestamp:
+                self._packet_timestamp = stamp
+                return False
+
+        c = Referee()
+        try:
+            c.ParseFromString(data)
+        except Exception as e:
+            print(e)
+            return False
+
+        self._referee_message = c
+        self._command = Referee.Command.Name(c.command)
+        self._packet_timestamp = c.packet_timestamp
+
+        self._game_controller = game_controller = self._snapshot()
+        for callback in self._subscribers:
+            callback(game_controller)
+        return True
+
+    def subscribe(self, callback: Callable[[GameController], None]):
+        """Calls ``callback`` with the new state every time the referee sends a new command, from the receiver thread"""
+        self._subscribers.append(callback)
+
     def get_data(self) -> GameController:
+        """The game controller state, the same object until a new command arrives"""
+        return self._game_controller
+
+    def _snapshot(self) -> GameController:
         return GameController(
             can_play=self.can_play(),
             state=self.get_command(),
             designated_position=self.get_designated_position(),
-            team=self.get_team()
+            team=self.get_team(),
+            command_counter=-1 if self._referee_message is None else self._referee_message.command_counter
         )
 
     def stop(self):
@@ -57,39 +110,40 @@ class SSLGameControllerReferee(threading.Thread):
         self.logger.info("Referee module stopped!")
 
     def can_play(self):
-        if not self._referee_message:
+        if self._referee_message is None:
             return False
 
-        _is_halted = self._referee_message.get('command') == 'HALT'
-        _is_stopped = self._referee_message.get('command') == 'STOP'
+        _is_halted = self._command == 'HALT'
+        _is_stopped = self._command == 'STOP'
 
         return not (_is_halted or _is_stopped)
 
     def is_stopped(self):
-        return self._referee_message.get('command') == 'STOP'
+        return self._command == 'STOP'
 
     def is_halted(self):
-        return self._referee_message.get('command') == 'HALT'
+        return self._command == 'HALT'
 
     def simplify(self):
         return {"command": self.get_command(), "team": self.get_team(), "pos": self.get_designated_position()}
 
     def get_command(self):
-        return self._referee_message.get('command', "")
+        return self._command
 
     def get_team(self):
-        return "blue" if self._referee_message.get('command', "").endswith('BLUE') else "yellow"
+        return "blue" if self._command.endswith('BLUE') else "yellow"
 
     def get_designated_position(self):
-        if pos := self._referee_message.get('designatedPosition', None):
+        if self._referee_message is not None and self._referee_message.HasField('designated_position'):
+            pos = self._referee_message.designated_position
             return (
-                pos['x'],
-                pos['y']
+                pos.x,
+                pos.y
             )
         return None
 
     def get_color(self):
-        return 'BLUE' if "BLUE" in self._referee_message.get('command') else 'YELLOW'
+        return 'BLUE' if "BLUE" in self._command else 'YELLOW'
 
     def _create_socket(self):
         """Returns a new socket binded to the Referee."""
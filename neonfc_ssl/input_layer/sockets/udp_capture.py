@@ -0,0 +1,155 @@
+import select
+import socket
+import struct
+import threading
+import time
+from typing import Callable, Iterator, Optional
+
+# the feeds the input layer listens to, in the order their ids are stored
+FEEDS = ('vision', 'autoref', 'referee')
+
+CAPTURE_MAGIC = b"NFCUDP\x01"
+# arrival time since the capture started, feed id and datagram length, followed by the datagram
+CAPTURE_RECORD = struct.Struct('<dBH')
+
+FLUSH_INTERVAL = 1.0  # s
+# as fast as possible, the next datagram is only sent once the previous one was read, checked this often
+CONSUMED_POLL = 0.0001  # s
+
+UNKNOWN_FEED_ERROR = "Unknown feed '{}', must be one of {}"
+NOT_A_CAPTURE_ERROR = "{} is not a UDP capture"
+TRUNCATED_CAPTURE_LOG = "UDP capture {} ends with a truncated record, it was ignored"
+REPLAY_DONE_LOG = "Replay of {} finished, {} datagrams sent"
+
+
+def _feed_id(feed: str) -> int:
+    if feed not in FEEDS:
+        raise ValueError(UNKNOWN_FEED_ERROR.format(feed, FEEDS))
+    return FEEDS.index(feed)
+
+
+class UdpRecorder:
+    """Writes the raw datagrams of every feed to one file, with the time they arrived.
+
+    ``tap(feed)`` returns the callable a DatagramReceiver calls with each datagram it reads, the receivers of the
+    different feeds may call it from their own threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'wb')
+        self._file.write(CAPTURE_MAGIC)
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._last_flush = self._start
+
+        self.recorded = 0
+
+    def tap(self, feed: str) -> Callable[[memoryview], None]:
+        feed_id = _feed_id(feed)
+        return lambda data: self.write(feed_id, data)
+
+    def write(self, feed_id: int, data):
+        now = time.monotonic()
+        with self._lock:
+            if self._file.closed:  # the receivers may outlive the recorder
+                return
+            self._file.write(CAPTURE_RECORD.pack(now - self._start, feed_id, len(data)))
+            self._file.write(data)
+            self.recorded += 1
+            if now - self._last_flush >= FLUSH_INTERVAL:
+                self._file.flush()
+                self._last_flush = now
+
+    def close(self):
+        """Flush what is left of the capture and close it, can be called more than once"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_capture(path: str, logger=None) -> Iterator[tuple[float, str, bytes]]:
+    """Yields the (arrival time, feed, datagram) records of a capture"""
+    with open(path, 'rb') as f:
+        if f.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise ValueError(NOT_A_CAPTURE_ERROR.format(path))
+
+        while header := f.read(CAPTURE_RECORD.size):
+            if len(header) < CAPTURE_RECORD.size:
+                break
+            t, feed_id, length = CAPTURE_RECORD.unpack(header)
+            if len(data := f.read(length)) < length:
+                break
+            yield t, FEEDS[feed_id], data
+        else:
+            return
+
+    # the recorder was killed mid write
+    if logger is not None:
+        logger.warning(TRUNCATED_CAPTURE_LOG.format(path))
+
+
+class UdpReplay(threading.Thread):
+    """Plays a capture back through local sockets, in place of the network.
+
+    Each feed gets a datagram socket the input sources read from as they would from the multicast one (see their
+    ``socket_factory``), so parsing, draining and both input backends work unchanged. Datagrams are sent at their
+    recorded times divided by ``speed``, or, with a ``speed`` of 0, as fast as possible: each one as soon as the
+    previous one was read, so no datagram is dropped and they are handled in the recorded order. ``done`` is set
+    once the whole capture was sent.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0, feeds: tuple[str, ...] = FEEDS, logger=None):
+        super().__init__(daemon=True)
+        self.path = path
+        self.speed = speed
+        self.logger = logger
+
+        self._sockets = {_feed_id(feed): socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM) for feed in feeds}
+        self._stopped = threading.Event()
+        self.done = threading.Event()
+        self.sent = 0
+
+    def feed_socket(self, feed: str) -> socket.socket:
+        """The socket the datagrams of ``feed`` arrive on"""
+        return self._sockets[_feed_id(feed)][0]
+
+    def run(self):
+        start = time.monotonic()
+        last: Optional[socket.socket] = None
+        try:
+            for t, feed, data in read_capture(self.path, self.logger):
+                pair = self._sockets.get(FEEDS.index(feed))
+                if pair is None:
+                    continue
+
+                if self.speed:
+                    delay = start + t / self.speed - time.monotonic()
+                    if delay > 0 and self._stopped.wait(delay):
+                        return
+                elif last is not None:
+                    self._wait_consumed(last)
+                if self._stopped.is_set():
+                    return
+
+                pair[1].send(data)
+                last = pair[0]
+                self.sent += 1
+        finally:
+            self.done.set()
+            if self.logger is not None:
+                self.logger.info(REPLAY_DONE_LOG.format(self.path, self.sent))
+
+    def _wait_consumed(self, sock: socket.socket):
+        while not self._stopped.is_set() and select.select([sock], [], [], 0)[0]:
+            time.sleep(CONSUMED_POLL)
+
+    def stop(self):
+        self._stopped.set()
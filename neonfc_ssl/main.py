@@ -8,19 +8,28 @@ import sys
 import argparse
 from threading import Thread
 from multiprocessing import Pipe, Queue
+from queue import Empty, SimpleQueue
 from neonfc_ssl.input_layer import InputLayer
 from neonfc_ssl.tracking_layer import Tracking
 from neonfc_ssl.decision_layer import Decision
 from neonfc_ssl.control_layer import Control
 from neonfc_ssl.output_layer import OutputLayer
-from neonfc_ssl.core import DebugLayer, event
-from neonfc_ssl.core.logger import setup_logging
+from neonfc_ssl.core import DebugLayer, InlinePipeline, MetricsSampler, event
+from neonfc_ssl.core.logger import setup_logging, GAME_LOGGER, GAME
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from neonfc_ssl.core import Layer
     from multiprocessing.connection import Connection
 
+# multiprocess: one process per layer connected by pipes
+# inline: every layer steps in sequence in the main process, see InlinePipeline
+RUN_MODES = ('multiprocess', 'inline')
+UNKNOWN_RUN_MODE_ERROR = "Unknown run mode '{}', expected one of {}"
+GAME_STOPPED_LOG = "Game stopped"
+GAMELOG_ROTATED_LOG = "New match, game log rotated"
+GAMELOG_DROPPED_LOG = "Game log dropped {} records under backpressure ({} in total)"
+
 
 class Game:
     def __init__(self, args) -> None:
@@ -32,18 +41,27 @@ class Game:
             self.config["Tracking"]["Color"] = args.color
         if args.side:
             self.config["InputLayer"]["side"] = args.side
+        if args.mode:
+            self.config["Game"]["mode"] = args.mode
+
+        self.mode = self.config["Game"].get("mode", "multiprocess")
+        if self.mode not in RUN_MODES:
+            raise ValueError(UNKNOWN_RUN_MODE_ERROR.format(self.mode, RUN_MODES))
 
         self.layers: list[Layer] = []
         self.layers_event: dict[str, 'Connection'] = {}
-        self.layers_log_q = Queue()
+        # inline layers log straight to the game logger
+        self.layers_log_q = Queue() if self.mode == 'multiprocess' else None
 
         # Config Logger
         setup_logging(self.config['Game'])
 
-        self.logger = logging.getLogger("game")
+        self.logger = logging.getLogger(GAME_LOGGER)
 
         self.event_engine = event.EventEngine()
         self.event_engine.create_socket(self.config['Game']["host"], self.config['Game']["input_port"])
+        self.events_q = SimpleQueue()  # events handled by the game itself
+        self.event_engine.subscribe(event.EventType.NEW_MATCH, self.events_q)
 
         self.new_layer(InputLayer)
         self.new_layer(Tracking)
@@ -53,6 +71,11 @@ class Game:
 
         self.output_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
+        self.metrics = MetricsSampler(self.layers)
+        self.metrics_period = self.config['Game'].get('metrics_period', 1.0)  # s
+        self.__last_metrics = time.monotonic()
+        self.__gamelog_dropped = 0
+
         self.__intervals = {}
 
     def send_udp(self, msg):
@@ -65,19 +88,75 @@ class Game:
     def start(self):
         self.logger.info("Starting game")
 
-        for prev_layer, layer in zip(self.layers[:-1], self.layers[1:]):
-            layer.bind_input_pipe(prev_layer.output_pipe)
+        try:
+            if self.mode == 'inline':
+                self.run_inline()
+                return
 
-        for layer in self.layers:
-            layer.start()
+            for prev_layer, layer in zip(self.layers[:-1], self.layers[1:]):
+                layer.bind_input_pipe(prev_layer.output_pipe)
+
+            for layer in self.layers:
+                layer.start()
 
-        self.read_log_queue()
+            self.read_log_queue()
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Stop the layer processes and release their pipes"""
+        self.event_engine.stop_all()  # nothing must be put in the layers event queues once closed
+        for layer in self.layers:
+            if layer.is_alive():
+                layer.terminate()
+                layer.join()
+            layer.close()
+
+        self.logger.info(GAME_STOPPED_LOG)
+
+    def run_inline(self):
+        pipeline = InlinePipeline(self.layers)
+        pipeline.start()
+        try:
+            while True:
+                pipeline.step()
+                self.process_events()
+                self.publish_metrics()
+        finally:
+            pipeline.stop()
 
     def read_log_queue(self):
         while True:
-            record = self.layers_log_q.get()
-            self.logger.handle(record)
+            try:
+                batch = self.layers_log_q.get(timeout=self.metrics_period)
+                for record in batch:
+                    self.logger.handle(logging.makeLogRecord(record))
+            except Empty:
+                pass
             # self.logger.log(log["type"], f"{log['source']}: {log}")
+            self.process_events()
+            self.publish_metrics()
+
+    def process_events(self):
+        while not self.events_q.empty():
+            if self.events_q.get().type == event.EventType.NEW_MATCH:
+                for handler in self.logger.handlers:
+                    if hasattr(handler, 'rotate'):
+                        handler.rotate()
+                self.logger.info(GAMELOG_ROTATED_LOG)
+
+    def publish_metrics(self):
+        """Log the layers frame, drop and overrun counters, at most once per metrics period"""
+        if (now := time.monotonic()) - self.__last_metrics < self.metrics_period:
+            return
+
+        self.__last_metrics = now
+        self.logger.log(GAME, self.metrics.sample())
+
+        dropped = sum(getattr(handler, 'dropped', 0) for handler in self.logger.handlers)
+        if dropped > self.__gamelog_dropped:
+            self.logger.warning(GAMELOG_DROPPED_LOG.format(dropped - self.__gamelog_dropped, dropped))
+            self.__gamelog_dropped = dropped
 
     def new_layer(self, layer: type['Layer']):
         layer_obj = layer(self.config[layer.__name__], self.layers_log_q)
@@ -110,6 +189,12 @@ def main(args=None):
         default=None,
         choices=["left", "right"]
     )
+    parser.add_argument(
+        "-m", "--mode",
+        help="run every layer in its own process or all of them in sequence in this one (will overwrite the config file)",
+        default=None,
+        choices=list(RUN_MODES)
+    )
     w = os.get_terminal_size().columns
     print("=" * w)
     print(r"""⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀                             
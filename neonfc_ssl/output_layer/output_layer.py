@@ -1,4 +1,7 @@
+from time import monotonic
 from neonfc_ssl.core import Layer
+from neonfc_ssl.core.logger import LATENCY
+from neonfc_ssl.core.trace import LatencyStats
 from .comm import GrComm, SerialComm
 
 from typing import TYPE_CHECKING
@@ -14,12 +17,32 @@ class OutputLayer(Layer):
 
         self.use_gr_sim = self.config["use_gr_sim"]
 
+        self.latency = LatencyStats(self.config.get("latency_window", 600))
+        self.latency_report_period = self.config.get("latency_report_period", 1.0)  # s
+        self.__last_latency_report = 0
+        self.__last_frame_id = None
+
     def _step(self, data: 'ControlData'):
         if self.use_gr_sim:
             self.gr_comm.update(data)
         else:
             self.serial_comm.update(data)
 
+        self.__trace(data)
+
+    def __trace(self, data: 'ControlData'):
+        # idle re-executions resend an already traced frame, it's only measured the first time it goes out
+        if data.trace is None or data.trace.frame_id == self.__last_frame_id:
+            return
+
+        data.trace.mark('output')
+        self.__last_frame_id = data.trace.frame_id
+        self.latency.add(data.trace)
+
+        if (now := monotonic()) - self.__last_latency_report >= self.latency_report_period:
+            self.__last_latency_report = now
+            self.logger.log(LATENCY, self.latency.report())
+
     def _start(self):
         if self.use_gr_sim:
             self.gr_comm.start()
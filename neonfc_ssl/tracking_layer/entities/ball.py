@@ -6,14 +6,17 @@ from ..tracking_data import TrackedBall
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from neonfc_ssl.input_layer.input_data import Geometry, Ball as InputBall
+    from ..filter_bank import KalmanBank
 
 
 class Ball:
-    def __init__(self, match):
+    def __init__(self, match, filters: 'KalmanBank' = None, slot: int = None):
         self.lt = time.time()
         self.dt = 1 / 60
 
         self.match = match
+        self.filters = filters
+        self.slot = slot
 
         self.data = TrackedBall(
             x=0,
@@ -28,13 +31,20 @@ class Ball:
         return self.data.speed
 
     def update(self, b: 'InputBall', field: 'Geometry'):
+        if b is None:  # not seen yet
+            return
+
         # TODO: encapsulate all this inside an update function the dataclass
         last_speed = self.get_speed()
-        self.data.x = b.x + field.field_length/2
-        self.data.y = b.y + field.field_width/2
+        if b.vx is None and self.filters is not None:
+            # raw vision, position and speed come from the filter bank
+            (self.data.x, self.data.y, _), (self.data.vx, self.data.vy, _) = self.filters.state[self.slot].T.tolist()
+        else:
+            self.data.x = b.x + field.field_length/2
+            self.data.y = b.y + field.field_width/2
+            self.data.vx = b.vx
+            self.data.vy = b.vy
         self.data.z = b.z
-        self.data.vx = b.vx
-        self.data.vy = b.vy
         self.data.vz = b.vz
 
         self.data.update_speed()
@@ -5,6 +5,7 @@ from ..tracking_data import TrackedRobot
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from neonfc_ssl.input_layer.input_data import Robot, Geometry
+    from ..filter_bank import KalmanBank
 
 
 class OmniRobot:
@@ -15,11 +16,15 @@ class OmniRobot:
 
     ALLOWED_MISSING_FRAMES = 20
 
-    def __init__(self, match, color, robot_id, calculate_speed=False) -> None:
+    def __init__(self, match, color, robot_id, calculate_speed=False, filters: 'KalmanBank' = None,
+                 slot: int = None) -> None:
         self.lt = time.time()
         self.dt = 1 / 60
 
         self.match = match
+        self.filters = filters
+        self.slot = slot
+        self.filtered = False  # whether the last detection was raw vision, estimated by the filter bank
 
         self.data = TrackedRobot(
             id=robot_id,
@@ -45,11 +50,20 @@ class OmniRobot:
             self.missed_frames += 1
             if self.missed_frames >= self.ALLOWED_MISSING_FRAMES:
                 self.data.missing = True
+            elif self.filtered:
+                # not seen for a few frames, keep moving it as predicted
+                self._read_filter()
 
         else:
             self.missed_frames = 0
             self.data.missing = False
 
+            # raw vision (no speeds) goes through the filter bank, tracked sources (AutoRef) already are filtered
+            self.filtered = r.vx is None and self.filters is not None
+            if self.filtered:
+                self._read_filter()
+                return
+
             self.data.x = r.x + field.field_length/2
             self.data.y = r.y + field.field_width/2
             self.data.theta = r.theta
@@ -58,6 +72,10 @@ class OmniRobot:
             self.data.vy = r.vy
             self.data.vtheta = r.vtheta
 
+    def _read_filter(self):
+        (self.data.x, self.data.y, self.data.theta), (self.data.vx, self.data.vy, self.data.vtheta) = \
+            self.filters.state[self.slot].T.tolist()
+
     def __getitem__(self, item):
         return self.data[item]
 
@@ -0,0 +1,105 @@
+import math
+import numpy as np
+
+# white acceleration noise (standard deviation) of x, y and theta, in m/s² and rad/s²
+ROBOT_ACCELERATION = (4.0, 4.0, 30.0)
+BALL_ACCELERATION = (15.0, 15.0, 0.0)  # kicks and bounces
+# vision noise (standard deviation) of x, y and theta, in m and rad
+ROBOT_MEASUREMENT = (0.005, 0.005, 0.02)
+BALL_MEASUREMENT = (0.005, 0.005, 1.0)
+INITIAL_SPEED = 2.0  # m/s or rad/s, speed uncertainty (standard deviation) right after a (re)start
+
+THETA = 2
+
+
+class KalmanBank:
+    """Constant velocity Kalman filters for many objects at once, kept in stacked numpy arrays.
+
+    Every object has x, y and theta, each filtered on its own as (position, speed), so the innovation covariance is
+    a scalar and the whole bank is predicted and corrected with a handful of array operations, without matrix
+    inversions. Objects not observed in a frame only get the prediction. One seen again after ``reset_after``
+    frames (or for the first time) restarts from its measurement, at rest.
+    """
+
+    def __init__(self, size: int, reset_after: int = 20):
+        self.size = size
+        self.reset_after = reset_after
+
+        self.state = np.zeros((size, 3, 2))  # [object, axis, (position, speed)]
+        self.cov = np.zeros((size, 3, 2, 2))
+        self.missed = np.full(size, reset_after)  # frames since each object was last observed
+
+        self.acceleration = np.tile(ROBOT_ACCELERATION, (size, 1)) ** 2
+        self.measurement = np.tile(ROBOT_MEASUREMENT, (size, 1)) ** 2
+
+    def set_noise(self, slot, acceleration: tuple[float, float, float], measurement: tuple[float, float, float]):
+        """Noise standard deviations of some objects, see ROBOT_ACCELERATION and ROBOT_MEASUREMENT"""
+        self.acceleration[slot] = np.square(acceleration)
+        self.measurement[slot] = np.square(measurement)
+
+    @property
+    def positions(self) -> np.ndarray:
+        """x, y and theta of every object"""
+        return self.state[..., 0]
+
+    @property
+    def speeds(self) -> np.ndarray:
+        """vx, vy and vtheta of every object"""
+        return self.state[..., 1]
+
+    def step(self, measurements: np.ndarray, observed: np.ndarray, dt: float):
+        """Predicts every object ``dt`` ahead and corrects the ``observed`` ones with their (x, y, theta) row"""
+        self.predict(dt)
+        self.missed += 1
+
+        restart = observed & (self.missed > self.reset_after)
+        correct = observed & ~restart
+        if restart.any():
+            self._restart(restart, measurements[restart])
+        if correct.any():
+            self._correct(correct, measurements[correct])
+        self.missed[observed] = 0
+
+    def predict(self, dt: float):
+        p, v = self.state[..., 0], self.state[..., 1]
+        p += v * dt
+        self.state[..., THETA, 0] = _wrap(self.state[..., THETA, 0])
+
+        q = self.acceleration
+        cov = self.cov
+        p00, p01, p11 = cov[..., 0, 0], cov[..., 0, 1], cov[..., 1, 1]
+        # F P F' + Q, with F = [[1, dt], [0, 1]] and the white acceleration Q
+        p00 += dt * 2 * p01 + dt * dt * p11 + q * dt ** 4 / 4
+        p01 += dt * p11 + q * dt ** 3 / 2
+        p11 += q * dt * dt
+        cov[..., 1, 0] = p01
+
+    def _correct(self, mask: np.ndarray, z: np.ndarray):
+        state, cov = self.state[mask], self.cov[mask]
+        p00, p01, p11 = cov[..., 0, 0], cov[..., 0, 1], cov[..., 1, 1]
+
+        innovation = z - state[..., 0]
+        innovation[:, THETA] = _wrap(innovation[:, THETA])
+        s = p00 + self.measurement[mask]
+        k0, k1 = p00 / s, p01 / s
+
+        state[..., 0] += k0 * innovation
+        state[..., 1] += k1 * innovation
+        state[:, THETA, 0] = _wrap(state[:, THETA, 0])
+
+        cov[..., 1, 1] = p11 - k1 * p01
+        cov[..., 0, 1] = cov[..., 1, 0] = (1 - k0) * p01
+        cov[..., 0, 0] = (1 - k0) * p00
+
+        self.state[mask], self.cov[mask] = state, cov
+
+    def _restart(self, mask: np.ndarray, z: np.ndarray):
+        self.state[mask, :, 0] = z
+        self.state[mask, :, 1] = 0
+        self.cov[mask] = 0
+        self.cov[mask, :, 0, 0] = self.measurement[mask]
+        self.cov[mask, :, 1, 1] = INITIAL_SPEED ** 2
+
+
+def _wrap(theta):
+    return (theta + math.pi) % (2 * math.pi) - math.pi
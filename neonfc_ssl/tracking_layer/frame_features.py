@@ -0,0 +1,99 @@
+import numpy as np
+from typing import Callable, Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    from .tracking_data import MatchData, RobotList, TrackedRobot
+
+TEAMS = ('robots', 'opposites')  # the MatchData attributes holding each team
+
+UNKNOWN_TEAM_ERROR = "Unknown team '{}', must be one of {}"
+
+
+class CacheStats:
+    """Hit and miss counters of the frame features of this process"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset(self):
+        self.hits = self.misses = 0
+
+    def __repr__(self):
+        return "<CacheStats hits={} misses={} hit_rate={:.2f}>".format(self.hits, self.misses, self.hit_rate)
+
+
+FEATURE_STATS = CacheStats()
+
+
+class FrameFeatures:
+    """Quantities derived from one frame of match data that several strategies need.
+
+    Each one is computed with numpy the first time it is asked for and shared by every strategy for the rest of the
+    frame, get them through ``MatchData.features``. Distances use every robot in the RobotList order, inactive
+    ones included, so rows line up with ``RobotList.arrays``; the closest robots only consider active ones.
+    """
+
+    def __init__(self, data: 'MatchData'):
+        self._data = data
+        self._cache = {}
+
+    def _memo(self, key, compute: Callable):
+        try:
+            value = self._cache[key]
+        except KeyError:
+            FEATURE_STATS.misses += 1
+            value = self._cache[key] = compute()
+            return value
+
+        FEATURE_STATS.hits += 1
+        return value
+
+    def _team(self, team: str) -> 'RobotList':
+        if team not in TEAMS:
+            raise ValueError(UNKNOWN_TEAM_ERROR.format(team, TEAMS))
+        return getattr(self._data, team)
+
+    def _rows(self, team: str) -> slice:
+        n = len(self._data.robots.robots)
+        return slice(0, n) if team == 'robots' else slice(n, n + len(self._data.opposites.robots))
+
+    @property
+    def distances(self) -> np.ndarray:
+        """Pairwise distances between the friendly robots, the opponents and the ball, in that order"""
+        return self._memo('distances', self._distances)
+
+    def _distances(self) -> np.ndarray:
+        points = np.vstack((self._data.robots.arrays.positions, self._data.opposites.arrays.positions,
+                            np.array(self._data.ball, dtype=np.float64)))
+        d = points[:, np.newaxis, :] - points
+        return np.sqrt(np.einsum('ijk,ijk->ij', d, d))
+
+    def ball_distances(self, team: str) -> np.ndarray:
+        """Distance from every robot of ``team`` to the ball"""
+        return self._memo(('ball_distances', team),
+                          lambda: np.sqrt(self._team(team).arrays.sq_distances(self._data.ball)))
+
+    @property
+    def robot_opposite_distances(self) -> np.ndarray:
+        """Distances (friendly robots, opponents) between the robots of both teams"""
+        return self.distances[self._rows('robots'), self._rows('opposites')]
+
+    def times_to_ball(self, team: str) -> np.ndarray:
+        """Time each robot of ``team`` takes to reach the ball, inf for the inactive ones"""
+        return self._memo(('times_to_ball', team), lambda: self._team(team).arrays.times_to_ball(self._data.ball))
+
+    def closest_to_ball(self, team: str) -> Optional['TrackedRobot']:
+        """The active robot of ``team`` closest to the ball, None if there is none"""
+        return self._memo(('closest_to_ball', team), lambda: self._closest(self._team(team), self.ball_distances(team)))
+
+    @staticmethod
+    def _closest(robots: 'RobotList', distances: np.ndarray) -> Optional['TrackedRobot']:
+        rows = np.flatnonzero(robots.arrays.active)
+        if not rows.size:
+            return None
+        return robots.robots[int(rows[np.argmin(distances[rows])])]
@@ -1,17 +1,22 @@
 import logging
-from collections import deque
 import numpy as np
+from neonfc_ssl.commons.rolling_stats import RollingWindow, TimeWindow
 from ..tracking_data import Possession
 
-from typing import TYPE_CHECKING
+POSSESSION_FRAMES = 500  # the balance is averaged over this many frames
+RECENT_POSSESSION = 2.0  # s, window of the recent balance
+
+from typing import Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from ..tracking import Tracking
+    from ..tracking_data import RobotList, TrackedBall
 
 
 class FloatPossessionTracker:
     def __init__(self, match: 'Tracking', state_controller):
         self.poss = 0
-        self.last_poss = deque([], maxlen=500)
+        self.last_poss = RollingWindow(POSSESSION_FRAMES)
+        self.recent_poss = TimeWindow(RECENT_POSSESSION)
         self.match = match
         self.state_controller = state_controller
         self.current_closest = None
@@ -21,32 +26,44 @@ class FloatPossessionTracker:
 
         self.match.logger.info(f"{self.get_possession()} team ball possession")
 
-    def update(self):
-        time_to_ball = lambda r: r.time_to_ball(self.match.ball) if r is not None else float('inf')
-        sq_dist_to_ball = lambda r: np.sum(np.square(np.array(r)-self.match.ball)) if r is not None else float('inf')
-
-        op_closest = min(self.match.active_opposites, key=time_to_ball, default=None)
-        my_closest = min(self.match.active_robots, key=time_to_ball, default=None)
-
-        op_time = time_to_ball(op_closest)
-        my_time = time_to_ball(my_closest)
+    def update(self, robots: 'RobotList', opposites: 'RobotList', ball: 'TrackedBall', t: float):
+        """Possession of the frame at match time ``t`` (in seconds)"""
+        my_row, my_time = self._first_to_ball(robots, ball)
+        op_row, op_time = self._first_to_ball(opposites, ball)
 
         current_balance = op_time - my_time
-        self.current_closest = my_closest
-        self.last_poss.append(current_balance)
-        self.poss = sum(self.last_poss)/len(self.last_poss)
+        self.current_closest = robots[my_row] if my_row is not None else None
+        self.last_poss.add(current_balance)
+        self.recent_poss.add(t, current_balance)
+        self.poss = self.last_poss.mean
 
-        if not self.in_ball_contact and sq_dist_to_ball(my_closest) <= 0.0144: # (robot_radius + 0.03m)^2
+        sq_dist_to_ball = float('inf')
+        if my_row is not None:
+            sq_dist_to_ball = robots.arrays.sq_distances(ball)[my_row]
+
+        if not self.in_ball_contact and sq_dist_to_ball <= 0.0144: # (robot_radius + 0.03m)^2
             self.in_ball_contact = True
-            self.contact_start_position = np.array(my_closest)
+            self.contact_start_position = robots.arrays.positions[my_row].copy()
 
-        if self.in_ball_contact and not sq_dist_to_ball(my_closest) <= 0.0196: # (robot_radius + 0.05m)^2
+        if self.in_ball_contact and not sq_dist_to_ball <= 0.0196: # (robot_radius + 0.05m)^2
             self.in_ball_contact = False
 
-        my_closest_id = my_closest.id if my_closest is not None else None
-        op_closest_id = op_closest.id if op_closest is not None else None
+        my_closest_id = int(robots.arrays.ids[my_row]) if my_row is not None else None
+        op_closest_id = int(opposites.arrays.ids[op_row]) if op_row is not None else None
+
+        return Possession(my_closest_id, op_closest_id, self.get_possession(), self.poss, self.contact_start_position,
+                          recent_balance=self.recent_poss.mean)
+
+    @staticmethod
+    def _first_to_ball(robots: 'RobotList', ball: 'TrackedBall') -> tuple[Optional[int], float]:
+        """Row of the active robot that reaches the ball first and its time, (None, inf) without active robots"""
+        arrays = robots.arrays
+        if not arrays.active.any():
+            return None, float('inf')
 
-        return Possession(my_closest_id, op_closest_id, self.get_possession(), self.poss, self.contact_start_position)
+        times = arrays.times_to_ball(ball)
+        row = int(np.argmin(times))
+        return row, float(times[row])
 
     def get_possession(self):
         return self.match.team_color if self.poss > 0 else self.match.opponent_color
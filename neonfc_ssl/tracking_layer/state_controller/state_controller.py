@@ -29,6 +29,8 @@ class GameState(State):
 class StateController:
     def __init__(self):
         self.current_state = None
+        self._last_update = None  # (command counter, command, team color) of the last update
+        self._last_data: Optional[StateData] = None
 
         # Following appendix B found in: https://robocup-ssl.github.io/ssl-rules/sslrules.pdf
         self.states = {
@@ -44,9 +46,12 @@ class StateController:
             'Run': GameState('Run')
         }
 
+        ref_triggers = set()
+
         def on_ref_message(msg):
             def trig(cmd, **kwargs):
                 return cmd.startswith(msg)
+            ref_triggers.add(trig)
             return trig
 
         def after_secs(delay):
@@ -120,22 +125,36 @@ class StateController:
         self.states['FreeKick'].add_transition(self.states['Run'], ball_moved)
         self.states['FreeKick'].add_transition(self.states['Run'], after_10)
 
+        # states that only leave on a referee command, nothing changes for them until a new one arrives
+        self._ref_driven = {
+            state for state in self.states.values()
+            if all(condition in ref_triggers for _, condition in state.transitions)
+        }
+
         self.current_state = self.states['Halt']
         self.current_state.start(None, None, None)
 
     def update(self, ref: 'GameController', ball: "TrackedBall", team_color) -> StateData:
+        key = (ref.command_counter, ref.state, team_color)
+        if key == self._last_update and self.current_state in self._ref_driven:
+            return self._last_data
+
         next_state = self.current_state.update(origin=self.current_state, cmd=ref.state, ball=ball)
         if next_state != self.current_state:
             # self._match.logger.info(f"Changing state {self.current_state.name} -> {next_state.name}")
             print(f"Changing state {self.current_state.name} -> {next_state.name}")
             self.current_state = next_state
             self.current_state.start(ball, ref.team, ref.designated_position)
+            self._last_update = None  # the new state may still react to the same command
+        else:
+            self._last_update = key
 
-        return StateData(
+        self._last_data = StateData(
             state=States(self.current_state.name),
             friendly=self.current_state.color == team_color,
             position=self.current_state.position
         )
+        return self._last_data
 
     def is_stopped(self):
         return self.current_state.name in ["Stop", "PrepareKickOff", "BallPlacement", "PreparePenalty"]
@@ -1,17 +1,29 @@
 import logging
+import numpy as np
 from neonfc_ssl.core import Layer
 from neonfc_ssl.core.logger import TRACKING
 from .entities import OmniRobot, Ball, ball
+from .filter_bank import KalmanBank, BALL_ACCELERATION, BALL_MEASUREMENT
 from .possession_tracker import FloatPossessionTracker as PossessionTracker
 from .state_controller import StateController
-from .tracking_data import MatchData
+from .tracking_data import MatchData, RobotList
+from .tracking_codec import MatchDataCodec
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from neonfc_ssl.input_layer.input_data import InputData
 
+ROBOTS_PER_TEAM = 16
+# filter bank slots: friendly robots, then opponents, then the ball
+BALL_SLOT = 2 * ROBOTS_PER_TEAM
+FRAME_PERIOD = 1 / 60  # s, assumed when frames carry no usable capture time
+MAX_FRAME_GAP = 0.5  # s, longer gaps between captures are taken as a vision restart
+
 
 class Tracking(Layer):
+    OUTPUT_CODEC = MatchDataCodec
+    TRACE_STAGE = 'tracking'
+
     def __init__(self, config, log_q):
         super().__init__("TrackingLayer", config, log_q)
 
@@ -26,6 +38,14 @@ class Tracking(Layer):
         self.active_opposites: list[OmniRobot] = None
         self.game_state: StateController = None
         self.possession: PossessionTracker = None
+        self.filters: KalmanBank = None
+        self.__measurements = np.zeros((BALL_SLOT + 1, 3))
+        self.__observed = np.zeros(BALL_SLOT + 1, dtype=bool)
+        self.__last_capture = None
+        self.__last_frame_id = None
+        self.__last_ball_stamp = None
+        self.__robot_stamps = np.full(BALL_SLOT, np.nan)  # detection timestamp each robot slot was last corrected with
+        self.__clock = 0.0  # s, match time, advanced by the time between the filtered frames
 
         # Other Tracking Parameters
         self.team_color = self.config['color']
@@ -35,17 +55,21 @@ class Tracking(Layer):
         self.logger.info("Starting match module starting ...")
 
         # Create Layer
-        self.ball = Ball(self)
+        self.filters = KalmanBank(BALL_SLOT + 1, reset_after=OmniRobot.ALLOWED_MISSING_FRAMES)
+        self.filters.set_noise(BALL_SLOT, BALL_ACCELERATION, BALL_MEASUREMENT)
+
+        self.ball = Ball(self, self.filters, BALL_SLOT)
 
         self.robots = [
-            OmniRobot(self, self.team_color, i) for i in range(0, 16)
+            OmniRobot(self, self.team_color, i, filters=self.filters, slot=i) for i in range(0, ROBOTS_PER_TEAM)
         ]
 
         self.active_robots = self.robots
 
         self.opposites = [
             # 0, 1, 2, 3, 4, 5 opposite robots
-            OmniRobot(self, self.opponent_color, i) for i in range(0, 16)
+            OmniRobot(self, self.opponent_color, i, filters=self.filters, slot=ROBOTS_PER_TEAM + i)
+            for i in range(0, ROBOTS_PER_TEAM)
         ]
 
         self.active_opposites = self.opposites
@@ -59,9 +83,11 @@ class Tracking(Layer):
     def _step(self, data: 'InputData'):
         geometry = data.geometry
 
+        rob, opp = (data.entities.robots_blue, data.entities.robots_yellow) if self.team_color == 'blue' else (data.entities.robots_yellow, data.entities.robots_blue)
+        self.__clock += self.__filter(data, rob, opp)
+
         self.ball.update(data.entities.ball, data.geometry)
 
-        rob, opp = (data.entities.robots_blue, data.entities.robots_yellow) if self.team_color == 'blue' else (data.entities.robots_yellow, data.entities.robots_blue)
         for robot in self.robots:
             robot.update(rob, data.geometry)
 
@@ -74,10 +100,13 @@ class Tracking(Layer):
 
         state = self.game_state.update(data.game_controller, self.ball.data, self.team_color)
 
-        poss = self.possession.update()
+        robots = RobotList([r.data for r in self.robots])
+        opposites = RobotList([r.data for r in self.opposites])
+
+        poss = self.possession.update(robots, opposites, self.ball.data, self.__clock)
         out_data = MatchData(
-            robots=[r.data for r in self.robots],
-            opposites=[r.data for r in self.opposites],
+            robots=robots,
+            opposites=opposites,
             ball=self.ball.data,
             possession=poss,
             game_state=state,
@@ -86,3 +115,44 @@ class Tracking(Layer):
         )
         self.logger.log(TRACKING, out_data)
         return out_data
+
+    def __filter(self, data: 'InputData', rob, opp) -> float:
+        """Runs the filter bank over the detections of this frame, the entities read their estimates from it.
+
+        Returns the time step it used, 0 when the layer steps again on a frame it already filtered (on idle).
+        """
+        t_capture = data.trace.t_capture if data.trace is not None else None
+        frame_id = data.trace.frame_id if data.trace is not None else None
+        if (frame_id is not None and frame_id == self.__last_frame_id) \
+                or (t_capture is not None and t_capture == self.__last_capture):
+            return 0.0
+        self.__last_frame_id = frame_id
+
+        dt = FRAME_PERIOD
+        if t_capture is not None and self.__last_capture is not None \
+                and 0 < t_capture - self.__last_capture < MAX_FRAME_GAP:
+            dt = t_capture - self.__last_capture
+        self.__last_capture = t_capture
+
+        z, observed = self.__measurements, self.__observed
+        observed[:] = False
+        half_length, half_width = data.geometry.field_length / 2, data.geometry.field_width / 2
+
+        for slot, detections in ((0, rob), (ROBOTS_PER_TEAM, opp)):
+            for robot_id, r in detections.items():
+                # like the ball, a robot no camera saw again keeps its last detection, which isn't a new observation
+                if robot_id < ROBOTS_PER_TEAM and (r.timestamp is None
+                                                   or r.timestamp != self.__robot_stamps[slot + robot_id]):
+                    z[slot + robot_id] = (r.x + half_length, r.y + half_width, r.theta)
+                    observed[slot + robot_id] = True
+                    self.__robot_stamps[slot + robot_id] = np.nan if r.timestamp is None else r.timestamp
+
+        # the vision keeps the last ball when no camera sees it, only a new capture is a new observation
+        b = data.entities.ball
+        if b is not None and (b.timestamp is None or b.timestamp != self.__last_ball_stamp):
+            z[BALL_SLOT] = (b.x + half_length, b.y + half_width, 0)
+            observed[BALL_SLOT] = True
+            self.__last_ball_stamp = b.timestamp
+
+        self.filters.step(z, observed, dt)
+        return dt
@@ -0,0 +1,150 @@
+import struct
+import numpy as np
+from neonfc_ssl.core.transport.frame_codec import FrameCodec, MAX_ROBOTS_PER_TEAM, COLOR_CODES, CODE_COLORS, \
+    opt_float, from_opt_float, opt_bool, from_opt_bool, check_robot_count
+from neonfc_ssl.input_layer.input_codec import encode_geometry, decode_geometry, GEOMETRY_SIZE
+from neonfc_ssl.core.trace import encode_trace, decode_trace, TRACE_SIZE
+from .tracking_data import TrackedBall, TrackedRobot, Possession, GameState, States, MatchData
+
+# is_yellow, number of robots, number of opposites
+_HEADER = struct.Struct('<?BB')
+# x, y, z, vx, vy, vz, v_shoot (x, y), v_switch, d_switch, speed
+_BALL = struct.Struct('<11d')
+# my_closest, op_closest, possession_team, possession_balance, contact_start_position (x, y), recent_balance
+_POSSESSION = struct.Struct('<bbBd2dd')
+# state, color, friendly, position (x, y)
+_GAME_STATE = struct.Struct('<BBB2d')
+# id, color, x, y, theta, vx, vy, vtheta, missing
+_ROBOT = struct.Struct('<BB6d?')
+
+_STATES = list(States)
+_STATE_CODES = {state: i for i, state in enumerate(_STATES)}
+
+
+class MatchDataCodec(FrameCodec):
+    size = (
+        _HEADER.size + _BALL.size + _POSSESSION.size + _GAME_STATE.size + GEOMETRY_SIZE
+        + 2 * MAX_ROBOTS_PER_TEAM * _ROBOT.size + TRACE_SIZE
+    )
+
+    @classmethod
+    def encode_into(cls, data: MatchData, buf: memoryview, offset: int = 0) -> int:
+        start = offset
+        robots, opposites = list(data.robots), list(data.opposites)
+        check_robot_count(cls, len(robots))
+        check_robot_count(cls, len(opposites))
+
+        _HEADER.pack_into(buf, offset, data.is_yellow, len(robots), len(opposites))
+        offset += _HEADER.size
+
+        ball = data.ball
+        _BALL.pack_into(
+            buf, offset,
+            ball.x, ball.y, opt_float(ball.z), ball.vx, ball.vy, opt_float(ball.vz),
+            ball.v_shoot[0], ball.v_shoot[1], ball.v_switch, ball.d_switch, ball.speed
+        )
+        offset += _BALL.size
+
+        poss = data.possession
+        _POSSESSION.pack_into(
+            buf, offset,
+            -1 if poss.my_closest is None else poss.my_closest,
+            -1 if poss.op_closest is None else poss.op_closest,
+            COLOR_CODES[poss.possession_team], poss.possession_balance,
+            poss.contact_start_position[0], poss.contact_start_position[1], poss.recent_balance
+        )
+        offset += _POSSESSION.size
+
+        state = data.game_state
+        position = state.position if state.position is not None else (None, None)
+        _GAME_STATE.pack_into(
+            buf, offset,
+            _STATE_CODES[state.state], COLOR_CODES[state.color], opt_bool(state.friendly),
+            opt_float(position[0]), opt_float(position[1])
+        )
+        offset += _GAME_STATE.size
+
+        offset += encode_geometry(data.field, buf, offset)
+        offset += encode_trace(data.trace, buf, offset)
+
+        for robot in (*robots, *opposites):
+            _ROBOT.pack_into(
+                buf, offset, robot.id, COLOR_CODES[robot.color],
+                robot.x, robot.y, robot.theta,
+                opt_float(robot.vx), opt_float(robot.vy), opt_float(robot.vtheta),
+                robot.missing
+            )
+            offset += _ROBOT.size
+
+        return offset - start
+
+    @classmethod
+    def decode(cls, buf: bytes | memoryview, offset: int = 0) -> MatchData:
+        is_yellow, n_robots, n_opposites = _HEADER.unpack_from(buf, offset)
+        offset += _HEADER.size
+
+        x, y, z, vx, vy, vz, shoot_x, shoot_y, v_switch, d_switch, speed = _BALL.unpack_from(buf, offset)
+        ball = TrackedBall(x=x, y=y, z=from_opt_float(z), vx=vx, vy=vy, vz=from_opt_float(vz))
+        # the shooting parameters are only refreshed when the ball accelerates, they can't be derived again here
+        ball.v_shoot = np.array((shoot_x, shoot_y))
+        ball.v_switch = v_switch
+        ball.d_switch = d_switch
+        ball.speed = speed
+        offset += _BALL.size
+
+        my_closest, op_closest, team, balance, contact_x, contact_y, recent = _POSSESSION.unpack_from(buf, offset)
+        possession = Possession(
+            my_closest=None if my_closest < 0 else my_closest,
+            op_closest=None if op_closest < 0 else op_closest,
+            possession_team=CODE_COLORS[team],
+            possession_balance=balance,
+            contact_start_position=np.array((contact_x, contact_y)),
+            recent_balance=recent
+        )
+        offset += _POSSESSION.size
+
+        state, color, friendly, pos_x, pos_y = _GAME_STATE.unpack_from(buf, offset)
+        game_state = GameState(
+            state=_STATES[state],
+            color=CODE_COLORS[color],
+            friendly=from_opt_bool(friendly),
+            position=None if from_opt_float(pos_x) is None else (pos_x, pos_y)
+        )
+        offset += _GAME_STATE.size
+
+        field = decode_geometry(buf, offset)
+        offset += GEOMETRY_SIZE
+
+        trace = decode_trace(buf, offset)
+        offset += TRACE_SIZE
+
+        robots = []
+        for _ in range(n_robots):
+            robots.append(cls._decode_robot(buf, offset))
+            offset += _ROBOT.size
+
+        opposites = []
+        for _ in range(n_opposites):
+            opposites.append(cls._decode_robot(buf, offset))
+            offset += _ROBOT.size
+
+        return MatchData(
+            ball=ball,
+            possession=possession,
+            game_state=game_state,
+            field=field,
+            robots=robots,
+            opposites=opposites,
+            is_yellow=is_yellow,
+            trace=trace
+        )
+
+    @staticmethod
+    def _decode_robot(buf: bytes | memoryview, offset: int) -> TrackedRobot:
+        robot_id, color, x, y, theta, vx, vy, vtheta, missing = _ROBOT.unpack_from(buf, offset)
+        return TrackedRobot(
+            id=robot_id, color=CODE_COLORS[color],
+            x=x, y=y, theta=theta,
+            vx=from_opt_float(vx), vy=from_opt_float(vy), vtheta=from_opt_float(vtheta),
+            missing=missing
+        )
@@ -1,17 +1,31 @@
 from dataclasses import dataclass, field as dc_f
 from enum import Enum
-from typing import Optional
+from functools import cached_property
+from typing import Optional, TYPE_CHECKING
 import numpy as np
 from numpy.linalg import norm
 import math
 from neonfc_ssl.protocols.internal import TrackingProtobuf, CommonsProtobuf
 from neonfc_ssl.commons.math import reduce_ang, distance_between_points
 from neonfc_ssl.input_layer.input_data import Geometry
+from neonfc_ssl.tracking_layer.frame_features import FrameFeatures
+if TYPE_CHECKING:
+    from neonfc_ssl.core.trace import FrameTrace
 
 A_SLIDE = 2.5
 A_ROLL = 0.3
 C_SWITCH = 0.6
 
+# ball deceleration of pos_after, in m/s²
+A_BALL = 0.8
+# intercept times assume robots go straight to the ball at this speed, refined until they change less than the
+# tolerance or for at most the given iterations
+INTERCEPT_SPEED = .35  # m/s
+INTERCEPT_TOLERANCE = 0.01  # s
+INTERCEPT_ITERATIONS = 50
+# batched intercepts finish the last few robots one by one, cheaper than numpy calls on tiny arrays
+INTERCEPT_SCALAR_TAIL = 2
+
 
 @dataclass
 class TrackedBall:
@@ -94,7 +108,7 @@ class TrackedBall:
     def pos_after(self, dt):
         # t_max = a/v
         # pos = initial_pos + initial_v * t_target + 0.5 * a * t_target ^ 2
-        a = 0.8
+        a = A_BALL
 
         t_max_x = abs(self.vx/a) if a else 0
         t_max_y = abs(self.vy/a) if a else 0
@@ -167,14 +181,14 @@ class TrackedRobot:
         return norm(np.array(self)-target)/TrackedRobot.VM
 
     def time_to_ball(self, ball):
-        avg_speed = .35
+        avg_speed = INTERCEPT_SPEED
         pos = np.array(ball)
         last_t = 0
-        for _ in range(50):
+        for _ in range(INTERCEPT_ITERATIONS):
             t = distance_between_points(pos, self) / avg_speed
             pos = ball.pos_after(t)
 
-            if abs(t - last_t) < 0.01:
+            if abs(t - last_t) < INTERCEPT_TOLERANCE:
                 return t
 
             last_t = t
@@ -189,6 +203,92 @@ class TrackedRobot:
         )
 
 
+class TeamArrays:
+    """Struct-of-arrays view of a team, one row per robot in the order of the RobotList it was built from.
+
+    Every array is a contiguous float64 (``active`` bool, ``ids`` int) copy, so consumers can work on the whole team
+    with numpy instead of rebuilding arrays from each TrackedRobot. ``index`` maps a robot id to its row.
+    """
+    __slots__ = ('ids', 'positions', 'thetas', 'velocities', 'vthetas', 'active', 'index')
+
+    def __init__(self, robots: list[TrackedRobot]):
+        # a single conversion from python objects, the slowest part by far
+        values = np.array([(r.id, r.x, r.y, r.theta, r.vx, r.vy, r.vtheta, r.missing) for r in robots],
+                          dtype=np.float64).reshape(-1, 8)
+
+        self.ids = values[:, 0].astype(int)
+        self.positions = np.ascontiguousarray(values[:, 1:3])
+        self.thetas = np.ascontiguousarray(values[:, 3])
+        self.velocities = np.ascontiguousarray(values[:, 4:6])
+        self.vthetas = np.ascontiguousarray(values[:, 6])
+        self.active = values[:, 7] == 0
+        self.index = {robot_id: row for row, robot_id in enumerate(self.ids.tolist())}
+
+    def sq_distances(self, point) -> np.ndarray:
+        """Squared distance from every robot to ``point``"""
+        d = self.positions - np.asarray(point, dtype=np.float64)
+        return np.einsum('ij,ij->i', d, d)
+
+    def times_to_ball(self, ball: TrackedBall) -> np.ndarray:
+        """TrackedRobot.time_to_ball of every robot, solved for all of them at once, inf for the inactive ones.
+
+        Runs the same iterations, but stops early for robots whose times alternate between two values (usually
+        the ball stopped short of them), which would otherwise keep all robots iterating until the limit.
+        """
+        times = np.full(len(self.ids), np.inf)
+        rows = np.flatnonzero(self.active)  # robots still iterating
+        robots = self.positions[rows]
+
+        # the kinematics of TrackedBall.pos_after, unrolled
+        v = np.array((ball.vx, ball.vy), dtype=np.float64)
+        start, t_stop, decel = np.array((ball.x, ball.y)), np.abs(v / A_BALL), np.copysign(0.5 * A_BALL, v)
+
+        pos = start
+        last_t, before_last = np.zeros(len(rows)), np.full(len(rows), np.nan)
+        for i in range(1, INTERCEPT_ITERATIONS + 1):
+            d = pos - robots
+            t = np.sqrt(np.einsum('ij,ij->i', d, d)) / INTERCEPT_SPEED
+
+            converged = np.abs(t - last_t) < INTERCEPT_TOLERANCE
+            # back to the time of two iterations ago, it alternates with the last one until the limit
+            cycling = (t == before_last) & ~converged
+            if (done := converged | cycling).any():
+                times[rows[converged]] = t[converged]
+                times[rows[cycling]] = (t if (INTERCEPT_ITERATIONS - i) % 2 == 0 else last_t)[cycling]
+
+                pending = ~done
+                if not pending.any():
+                    return times
+                rows, robots, t, last_t = rows[pending], robots[pending], t[pending], last_t[pending]
+
+            if len(rows) <= INTERCEPT_SCALAR_TAIL:
+                for row, (x, y), t_i in zip(rows.tolist(), robots.tolist(), t.tolist()):
+                    times[row] = _finish_time_to_ball(x, y, ball, t_i, i)
+                return times
+
+            dt = np.minimum(t[:, np.newaxis], t_stop)
+            pos = start + v * dt - decel * dt ** 2
+            before_last, last_t = last_t, t
+
+        times[rows] = last_t
+        return times
+
+
+def _finish_time_to_ball(x: float, y: float, ball: TrackedBall, t: float, i: int) -> float:
+    """The iterations of TrackedRobot.time_to_ball left after iteration ``i`` gave ``t``, in plain floats"""
+    a = A_BALL
+    t_max_x, t_max_y = abs(ball.vx / a), abs(ball.vy / a)
+    for _ in range(i, INTERCEPT_ITERATIONS):
+        dt_x, dt_y = min(t, t_max_x), min(t, t_max_y)
+        pos_x = ball.x + ball.vx * dt_x - math.copysign(0.5 * a * dt_x ** 2, ball.vx)
+        pos_y = ball.y + ball.vy * dt_y - math.copysign(0.5 * a * dt_y ** 2, ball.vy)
+
+        last_t, t = t, math.sqrt((pos_x - x) ** 2 + (pos_y - y) ** 2) / INTERCEPT_SPEED
+        if abs(t - last_t) < INTERCEPT_TOLERANCE:
+            break
+    return t
+
+
 @dataclass
 class RobotList:
     robots: list[TrackedRobot]
@@ -200,10 +300,21 @@ class RobotList:
     def __getitem__(self, item):
         return self.robots[item]
 
+    def __getstate__(self):
+        # the arrays are rebuilt on demand wherever the list ends up
+        state = self.__dict__.copy()
+        state.pop('arrays', None)
+        return state
+
     @property
     def actives(self):
         return self.active
 
+    @cached_property
+    def arrays(self) -> TeamArrays:
+        """The team as arrays, built on first use and kept for the rest of the frame"""
+        return TeamArrays(self.robots)
+
     def to_proto(self):
         return [r.to_proto() for r in self.robots]
 
@@ -218,6 +329,9 @@ class Possession:
 
     contact_start_position: np.array
 
+    # balance over the last RECENT_POSSESSION seconds only
+    recent_balance: float = 0.0
+
     def to_proto(self):
         return TrackingProtobuf.Possession(
             balance=self.possession_balance
@@ -267,10 +381,23 @@ class MatchData:
     robots: RobotList = dc_f()
     opposites: RobotList
     is_yellow: bool
+    trace: Optional['FrameTrace'] = None
 
     def __post_init__(self):
-        self.robots = RobotList(self.robots)
-        self.opposites = RobotList(self.opposites)
+        if not isinstance(self.robots, RobotList):
+            self.robots = RobotList(self.robots)
+        if not isinstance(self.opposites, RobotList):
+            self.opposites = RobotList(self.opposites)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('features', None)
+        return state
+
+    @cached_property
+    def features(self) -> FrameFeatures:
+        """Distances, times to the ball and closest robots of this frame, computed once and shared"""
+        return FrameFeatures(self)
 
     def to_proto(self):
         return TrackingProtobuf.Tracking(
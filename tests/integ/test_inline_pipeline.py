@@ -0,0 +1,34 @@
+import pytest
+from .fixture import *
+from neonfc_ssl.core import InlinePipeline
+from neonfc_ssl.core.trace import FrameTrace
+from neonfc_ssl.tracking_layer import Tracking
+from neonfc_ssl.decision_layer import Decision
+from neonfc_ssl.control_layer import Control
+from neonfc_ssl.control_layer import control_data
+from neonfc_ssl.input_layer import data as input_data
+
+
+@pytest.mark.integration
+def test_inline_pipeline(base_config):
+    layers = [layer(base_config[layer.__name__], None) for layer in (Tracking, Decision, Control)]
+    pipeline = InlinePipeline(layers)
+
+    test_data = input_data.InputData(
+        entities=input_data.Entities(
+            ball=input_data.Ball(x=0, y=0, vx=0, vy=0),
+            robots_blue={0: input_data.Robot(id=0, team='blue', x=1, y=1, theta=0, vx=0, vy=0, vtheta=0)},
+            robots_yellow={0: input_data.Robot(id=0, team='yellow', x=2, y=2, theta=0, vx=0, vy=0, vtheta=0)},
+        ),
+        geometry=input_data.Geometry(9, 6, 1, 1, 2),
+        game_controller=input_data.GameController(True, "HALT", (0, 0), 'blue'),
+        trace=FrameTrace(1),
+    )
+
+    pipeline.start()
+    response = pipeline.step(test_data)
+
+    assert all(layer.pid is None for layer in layers), "Inline layers must not spawn processes"
+    assert isinstance(response, control_data.ControlData), "Wrong return type"
+    assert response.trace is test_data.trace, "Frames should be handed over without copies"
+    assert all(layer.stats['frames'] == 1 for layer in layers)
@@ -1,8 +1,10 @@
+import os
 import pytest
 from .fixture import *
 from neonfc_ssl.tracking_layer import Tracking
 from neonfc_ssl.input_layer import data as input_data
 from neonfc_ssl.tracking_layer import data as tracking_data
+from neonfc_ssl.core.trace import FrameTrace
 
 
 @pytest.mark.integration
@@ -34,3 +36,85 @@ def test_tracking_layer(base_config):
 
     assert len(response.opposites.actives) == len(ids)
     assert len(response.opposites.robots) == 16
+
+
+@pytest.mark.integration
+def test_tracking_layer_shm_transport(base_config):
+    base_config['Tracking']['transport'] = 'shm'
+    layer_obj, pipe_in, pipe_out, log_q = instance_layer(Tracking, base_config)
+
+    test_data = input_data.InputData(
+        entities=input_data.Entities(
+            ball=input_data.Ball(x=0, y=0, vx=0, vy=0),
+            robots_blue={0: input_data.Robot(id=0, team='blue', x=0, y=0, theta=0, vx=0, vy=0, vtheta=0)},
+            robots_yellow={},
+        ),
+        geometry=input_data.Geometry(0, 0, 0, 0, 0),
+        game_controller=input_data.GameController(True, "", (0, 0), 'blue'),
+        trace=FrameTrace(7),
+    )
+
+    layer_obj.start()
+    try:
+        pipe_in.send(test_data)
+        response: tracking_data.MatchData = pipe_out.recv()
+    finally:
+        layer_obj.terminate()
+        layer_obj.join()
+        layer_obj.close()
+
+    assert not os.path.exists(os.path.join('/dev/shm', pipe_out._ring.shm.name))
+    assert isinstance(response, tracking_data.MatchData), "Wrong return type"
+    assert response.trace.frame_id == 7
+    assert response.trace.stamp('tracking') is not None
+    assert len(response.robots.actives) == 0
+    assert len(response.opposites.actives) == 1
+
+
+def _raw_vision_frame(i, trace=True):
+    # raw vision (grSim) has no speeds, the robot moves at 1 m/s along x
+    t = i / 60
+    return input_data.InputData(
+        entities=input_data.Entities(
+            ball=input_data.Ball(x=0, y=0, timestamp=t),
+            robots_blue={0: input_data.Robot(id=0, team='blue', x=t, y=0, theta=0, timestamp=t)},
+            robots_yellow={0: input_data.Robot(id=0, team='yellow', x=t, y=0, theta=0, timestamp=t)},
+        ),
+        geometry=input_data.Geometry(9, 6, 1, 1, 2),
+        game_controller=input_data.GameController(True, "", (0, 0), 'blue'),
+        trace=FrameTrace(i + 1, t_capture=t) if trace else None,
+    )
+
+
+def _robot(response):
+    return response.opposites.actives[0] if response.is_yellow else response.robots.actives[0]
+
+
+@pytest.mark.integration
+def test_tracking_estimates_speeds_of_raw_vision(base_config):
+    layer_obj = Tracking(base_config['Tracking'], None)
+    layer_obj.start_inline()
+
+    for i in range(60):
+        response = layer_obj.step_inline(_raw_vision_frame(i))
+
+    robot = _robot(response)
+    assert robot.vx == pytest.approx(1, abs=0.05) and robot.vy == pytest.approx(0, abs=0.05)
+    assert response.ball.vx == pytest.approx(0, abs=0.05)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('trace', [True, False])
+def test_tracking_stepping_again_on_the_same_frame(base_config, trace):
+    layer_obj = Tracking(base_config['Tracking'], None)
+    layer_obj.start_inline()
+
+    for i in range(60):
+        response = layer_obj.step_inline(_raw_vision_frame(i, trace))
+    speeds = (_robot(response).vx, _robot(response).vy, response.ball.vx)
+
+    # the layer steps on its last input again when no new frame arrives in time
+    for _ in range(5):
+        response = layer_obj.step_inline(_raw_vision_frame(59, trace))
+
+    assert (_robot(response).vx, _robot(response).vy, response.ball.vx) == pytest.approx(speeds, abs=1e-9)
@@ -0,0 +1,24 @@
+import pytest
+from neonfc_ssl.commons.field_model import field_model
+from neonfc_ssl.input_layer.input_data import Geometry
+
+
+@pytest.mark.unit
+class TestFieldModel:
+    def test_shapes(self):
+        field = field_model(Geometry(9, 6, 1, 1, 2))
+        assert field.center == (4.5, 3)
+        assert field.opponent_goal_posts == ((9, 2.5), (9, 3.5))
+        assert tuple(field.friendly_area) == (0, 2, 1, 2)
+        assert field.friendly_area.contains(0.5, 3) and not field.friendly_area.contains(1.5, 3)
+        assert field.opponent_area.obstacle == ((8, 2), 1, 2)
+
+        lower_limit = field.obstacles[2]
+        assert lower_limit == ((-12, -12), 33, 12.09)
+
+    def test_reused_until_the_geometry_changes(self):
+        geometry = Geometry(9, 6, 1, 1, 2)
+        assert field_model(geometry) is field_model(Geometry(9, 6, 1, 1, 2))
+
+        changed = field_model(Geometry(12, 9, 1.8, 1.8, 3.6, version=1))
+        assert changed is not field_model(geometry) and changed.version == 1
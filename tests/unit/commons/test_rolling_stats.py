@@ -0,0 +1,63 @@
+import math
+import pytest
+import numpy as np
+from neonfc_ssl.commons.rolling_stats import RollingWindow, TimeWindow, ExponentialMean
+
+
+@pytest.mark.unit
+def test_rolling_window_matches_recomputing_the_window():
+    rng = np.random.default_rng(0)
+    samples = rng.normal(0, 5, 2000).tolist()
+    window = RollingWindow(50)
+
+    for i, x in enumerate(samples):
+        window.add(x)
+        last = samples[max(0, i - 49):i + 1]
+        assert window.mean == pytest.approx(sum(last) / len(last), abs=1e-9)
+        assert (window.min, window.max) == (min(last), max(last))
+    assert len(window) == 50
+
+
+@pytest.mark.unit
+def test_rolling_window_non_finite_samples():
+    window = RollingWindow(3)
+    for x in (1.0, math.nan, 2.0):
+        window.add(x)
+    assert math.isnan(window.mean)
+    assert (window.min, window.max) == (1.0, 2.0)  # nan left out
+
+    window.add(math.inf)
+    window.add(3.0)  # the nan left the window
+    assert window.mean == math.inf
+    window.add(4.0)
+    window.add(5.0)  # the inf left the window
+    assert window.mean == 4.0
+
+
+@pytest.mark.unit
+def test_time_window():
+    window = TimeWindow(2.0)
+    for t in range(10):
+        window.add(t * 0.5, float(t))
+
+    # 2.5 s to 4.5 s
+    assert len(window) == 5
+    assert window.mean == 7.0
+    assert (window.min, window.max) == (5.0, 9.0)
+
+
+@pytest.mark.unit
+def test_exponential_mean():
+    ewm = ExponentialMean(0.5)
+    assert math.isnan(ewm.mean)
+    for x in (4.0, 0.0, 2.0):
+        ewm.add(x)
+    assert ewm.mean == 2.0
+    assert ExponentialMean.from_span(3).alpha == 0.5
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('make', [lambda: RollingWindow(0), lambda: TimeWindow(-1), lambda: ExponentialMean(0)])
+def test_invalid_windows(make):
+    with pytest.raises(ValueError):
+        make()
@@ -0,0 +1,31 @@
+import pytest
+from multiprocessing.connection import wait
+
+from neonfc_ssl.core.event import EventQueue
+
+
+@pytest.mark.unit
+class TestEventQueue:
+    def test_put_rings_the_doorbell(self):
+        q = EventQueue()
+        assert wait([q], 0) == []
+
+        q.put('a')
+        q.put('b')
+        assert wait([q], 1) == [q]
+
+        q.clear()
+        assert wait([q], 0) == []
+        assert [q.get(), q.get()] == ['a', 'b']
+        assert q.empty()
+        q.close()
+
+    def test_put_never_blocks_on_a_full_doorbell(self):
+        q = EventQueue()
+        for i in range(20_000):  # more rings than the doorbell pipe holds, it's never cleared
+            q.put(i)
+            assert q.get() == i
+
+        assert q.empty()
+        assert wait([q], 0) == [q]
+        q.close()
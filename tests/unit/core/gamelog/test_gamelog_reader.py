@@ -0,0 +1,80 @@
+import logging
+import pytest
+
+from neonfc_ssl.core.gamelog import GamelogReader, INDEX_SUFFIX, NO_FRAME
+from neonfc_ssl.core.logger import BinaryFileHandler, ProtobufFormatter, TRACKING
+from .test_tracking_delta import tracking_frame
+
+T0 = 1_700_000_000.0
+
+
+class Tracked:
+    def __init__(self, t):
+        self.t = t
+
+    def to_proto(self):
+        return tracking_frame(self.t)
+
+
+def _write_log(path, n, **kwargs):
+    handler = BinaryFileHandler(str(path), "test.gamelog", flush_interval=60, **kwargs)
+    handler.setFormatter(ProtobufFormatter())
+    for i in range(n):
+        if i % 2:
+            record = logging.LogRecord('TrackingLayer', TRACKING, __file__, 1, Tracked(i), None, None)
+        else:
+            record = logging.LogRecord('game', logging.INFO, __file__, 1, str(i), None, None)
+        record.created = T0 + i * 0.01
+        record.frame_id = i // 2
+        handler.handle(record)
+        if i == n // 2:
+            handler.flush()  # more than one compressed block
+    handler.close()
+
+    return str(next(path.glob('*.gamelog')))
+
+
+@pytest.mark.unit
+class TestGamelogReader:
+    def test_random_access(self, tmp_path):
+        with GamelogReader(_write_log(tmp_path, 100)) as reader:
+            assert len(reader) == 100
+            assert reader[50].message == "50"
+            assert reader[-1].tracking == tracking_frame(99)
+            assert reader.find_frame(10) == 20
+            assert reader.find_time(T0 + 0.5 - 1e-6) == 50
+            assert reader.find_time(T0 + 10) == 100
+            assert [e.message for e in reader.read(96, 99)] == ["96", "", "98"]
+
+    def test_log_without_index(self, tmp_path):
+        path = _write_log(tmp_path, 10)
+        (tmp_path / (path.rsplit('/', 1)[1] + INDEX_SUFFIX)).unlink()
+
+        with GamelogReader(path) as reader:
+            assert [e.message for e in reader][::2] == [str(i) for i in range(0, 10, 2)]
+            assert reader.entry(0).frame == NO_FRAME
+            assert reader.find_time(T0 + 0.05 - 1e-6) == 5
+            reader.save_index()
+
+        with GamelogReader(path) as reader:
+            assert reader.find_time(T0 + 0.05 - 1e-6) == 5
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_tracking_deltas(self, tmp_path, compress):
+        path = _write_log(tmp_path, 100, keyframe_interval=10, compress=compress)
+
+        with GamelogReader(path) as reader:
+            assert reader.compressed == compress
+            for i in (75, 99, 3, 1, 3, 5):  # jumping around and back
+                robot = reader[i].tracking.robots[0]
+                assert robot.pos.x == pytest.approx(0.0031 * i, abs=1e-3)
+            assert all(e.tracking.robots[0].pos.x == pytest.approx(0.0031 * i, abs=1e-3)
+                       for i, e in enumerate(reader) if i % 2)
+
+    def test_index_past_the_data_is_ignored(self, tmp_path):
+        path = _write_log(tmp_path, 10)
+        with open(path, 'r+b') as f:
+            f.truncate(f.seek(0, 2) - 1)
+
+        with GamelogReader(path) as reader:
+            assert len(reader) == 9
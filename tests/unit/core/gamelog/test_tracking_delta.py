@@ -0,0 +1,78 @@
+import math
+import pytest
+
+from neonfc_ssl.core.gamelog.tracking_delta import TrackingDeltaEncoder, TrackingDeltaDecoder
+from neonfc_ssl.protocols.internal import TrackingProtobuf, CommonsProtobuf
+
+
+def tracking_frame(t, ball=True):
+    frame = TrackingProtobuf.Tracking(
+        team_color=CommonsProtobuf.Colors.Value('blue'),
+        game_state=TrackingProtobuf.GameState(current_state=TrackingProtobuf.States.Value('RUN')),
+    )
+    if ball:
+        frame.ball.pos.x, frame.ball.vel.x = 0.01 * t, 0.6
+    for i in range(16):
+        # only the first robot moves
+        frame.robots.add(id=i, color=CommonsProtobuf.Colors.Value('blue'),
+                         pos=CommonsProtobuf.Vector(x=i + (0.0031 * t if i == 0 else 0), y=-i, z=0.1 * i))
+    return frame
+
+
+@pytest.mark.unit
+class TestTrackingDelta:
+    def test_round_trip(self):
+        encoder, decoder = TrackingDeltaEncoder(keyframe_interval=10), TrackingDeltaDecoder()
+        for t in range(25):
+            frame = tracking_frame(t)
+            delta = encoder.encode(frame)
+            decoded = decoder.decode(delta)
+
+            assert delta.keyframe == (t % 10 == 0)
+            if not delta.keyframe:
+                assert [r.id for r in delta.robots] == [0]
+                assert not delta.HasField('game_state')
+            assert decoded.game_state == frame.game_state
+            assert decoded.ball.pos.x == pytest.approx(frame.ball.pos.x, abs=1e-3)
+            for robot, original in zip(decoded.robots, frame.robots):
+                assert robot.id == original.id
+                assert robot.pos.x == pytest.approx(original.pos.x, abs=1e-3)
+                assert robot.pos.z == pytest.approx(original.pos.z, abs=1e-3)
+
+    def test_disappearing_ball_forces_a_keyframe(self):
+        encoder, decoder = TrackingDeltaEncoder(keyframe_interval=10), TrackingDeltaDecoder()
+        decoder.decode(encoder.encode(tracking_frame(0)))
+        delta = encoder.encode(tracking_frame(1, ball=False))
+
+        assert delta.keyframe
+        assert not decoder.decode(delta).HasField('ball')
+
+    def test_non_finite_values(self):
+        encoder, decoder = TrackingDeltaEncoder(keyframe_interval=10), TrackingDeltaDecoder()
+        decoder.decode(encoder.encode(tracking_frame(0)))
+
+        frame = tracking_frame(1)
+        frame.ball.vel.x = math.nan
+        frame.robots[0].pos.y = math.inf
+        delta = encoder.encode(frame)
+        decoded = decoder.decode(delta)
+
+        assert not delta.keyframe
+        assert math.isnan(decoded.ball.vel.x)
+        assert math.isnan(decoded.robots[0].pos.y)
+        assert decoded.ball.pos.x == pytest.approx(0.01, abs=1e-3)
+
+        # the next delta can't be taken from a nan, it falls back to a keyframe
+        delta = encoder.encode(tracking_frame(2))
+        decoded = decoder.decode(delta)
+
+        assert delta.keyframe
+        assert decoded.ball.vel.x == pytest.approx(0.6, abs=1e-3)
+        assert decoded.robots[0].pos.y == 0
+
+    def test_delta_before_keyframe(self):
+        encoder = TrackingDeltaEncoder(keyframe_interval=10)
+        encoder.encode(tracking_frame(0))
+
+        with pytest.raises(ValueError):
+            TrackingDeltaDecoder().decode(encoder.encode(tracking_frame(1)))
@@ -0,0 +1,43 @@
+import time
+from datetime import datetime
+from multiprocessing import Pipe
+import pytest
+
+from neonfc_ssl.core import Layer
+from neonfc_ssl.core.event import Event, EventType, event_callback
+
+
+class EventLayer(Layer):
+    """Never gets any input, writes a marker file when a new match starts"""
+
+    def __init__(self, path):
+        super().__init__("EventLayer", {}, None)
+        self.path = path
+
+    def _start(self):
+        pass
+
+    def _step(self, data):
+        return data
+
+    @event_callback(EventType.NEW_MATCH)
+    def _on_new_match(self, event):
+        self.path.write_text(event.source)
+
+
+@pytest.mark.unit
+def test_event_wakes_up_a_layer_waiting_for_input(tmp_path):
+    layer = EventLayer(tmp_path / "marker")
+    rx, tx = Pipe(duplex=False)
+    layer.bind_input_pipe(rx)  # with no input yet the layer sleeps without a timeout
+    layer.start()
+
+    layer.events_q.put(Event(EventType.NEW_MATCH, "test", datetime.now()))
+    deadline = time.monotonic() + 5
+    while not (tmp_path / "marker").exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    layer.terminate()
+    layer.join(timeout=5)
+    layer.close()
+    assert (tmp_path / "marker").read_text() == "test"
@@ -0,0 +1,43 @@
+import time
+import pytest
+
+from neonfc_ssl.core import Layer
+
+
+class MarkerLayer(Layer):
+    """Steps forever without input, writes a marker file once stopped"""
+
+    def __init__(self, path):
+        super().__init__("MarkerLayer", {}, None)
+        self.path = path
+
+    def _start(self):
+        pass
+
+    def _step(self, data):
+        time.sleep(0.001)
+
+    def _stop(self):
+        self.path.write_text("stopped")
+
+
+@pytest.mark.unit
+class TestLayerStop:
+    def test_terminate_runs_stop(self, tmp_path):
+        layer = MarkerLayer(tmp_path / "marker")
+        layer.start()
+        time.sleep(0.2)
+        layer.terminate()
+        layer.join(timeout=5)
+
+        assert layer.exitcode == 0
+        assert (tmp_path / "marker").read_text() == "stopped"
+        layer.close()
+
+    def test_stop_inline(self, tmp_path):
+        layer = MarkerLayer(tmp_path / "marker")
+        layer.start_inline()
+        layer.stop_inline()
+
+        assert (tmp_path / "marker").read_text() == "stopped"
+        layer.close()
@@ -0,0 +1,23 @@
+import os
+import pytest
+
+from neonfc_ssl.core.layers.placement import apply_placement, describe_placement
+
+
+@pytest.mark.unit
+def test_invalid_settings_are_reported():
+    cpus_before = os.sched_getaffinity(0)
+
+    failures = apply_placement({'cpu_affinity': [100000]})
+
+    assert [key for key, _, _ in failures] == ['cpu_affinity']
+    assert os.sched_getaffinity(0) == cpus_before
+
+
+@pytest.mark.unit
+def test_describe_current_placement():
+    cpus, nice, policy = describe_placement()
+
+    assert cpus == ",".join(str(cpu) for cpu in sorted(os.sched_getaffinity(0)))
+    assert nice == str(os.getpriority(os.PRIO_PROCESS, 0))
+    assert policy == "SCHED_OTHER"
@@ -0,0 +1,80 @@
+import pytest
+
+from neonfc_ssl.core import Layer
+from neonfc_ssl.core.layers import layer as layer_module
+
+
+class FakeClock:
+    """Stands for the layer clock, only moves when told to"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(layer_module, 'time', fake)
+    return fake
+
+
+class SlowLayer(Layer):
+    """Echoes its input, taking the duration given in it on the layer clock"""
+
+    def __init__(self, config):
+        super().__init__("SlowLayer", config, None)
+
+    def _start(self):
+        pass
+
+    def _step(self, data):
+        layer_module.time.now += data
+        return data
+
+
+def _run(policy, durations, **config):
+    layer = SlowLayer({'step_budget': 0.01, 'overrun_policy': policy, **config})
+    return layer, [layer.step_inline(d) for d in durations]
+
+
+@pytest.mark.unit
+class TestStepBudget:
+    def test_warn_only_counts(self):
+        layer, outputs = _run('warn', [0.02, 0, 0])
+
+        assert outputs == [0.02, 0, 0]
+        assert layer.stats['overruns'] == 1
+        assert layer.stats['shed'] == 0
+
+    def test_budget_is_inclusive(self):
+        layer, _ = _run('warn', [0.01, 0.0101])
+
+        assert layer.stats['overruns'] == 1
+
+    def test_skip_drops_the_next_frame(self):
+        layer, outputs = _run('skip', [0.02, 0, 0])
+
+        assert outputs == [0.02, None, 0]
+        assert layer.stats['shed'] == 1
+
+    def test_reuse_answers_with_last_output(self):
+        layer, outputs = _run('reuse', [0.02, 0, 0])
+
+        assert outputs == [0.02, 0.02, 0]
+        assert layer.stats['shed'] == 1
+
+    def test_degrade_until_recovered(self):
+        layer, _ = _run('degrade', [0.02], degrade_recovery=2)
+        assert layer.degraded
+
+        layer.step_inline(0)
+        assert layer.degraded
+        layer.step_inline(0)
+        assert not layer.degraded
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            SlowLayer({'overrun_policy': 'panic'})
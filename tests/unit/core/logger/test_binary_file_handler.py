@@ -0,0 +1,61 @@
+import logging
+import pytest
+
+from neonfc_ssl.core.logger import BinaryFileHandler
+
+
+class BytesFormatter(logging.Formatter):
+    def format(self, record):
+        return record.getMessage().encode()
+
+
+def _handler(path, **kwargs):
+    handler = BinaryFileHandler(str(path), "test.gamelog", **kwargs)
+    handler.setFormatter(BytesFormatter())
+    return handler
+
+
+def _emit(handler, *messages):
+    for msg in messages:
+        handler.handle(logging.LogRecord('game', logging.INFO, __file__, 1, msg, None, None))
+
+
+def _read(file):
+    data, records = file.read_bytes(), []
+    while data:
+        length = int.from_bytes(data[:4], 'big')
+        records.append(data[4:4 + length].decode())
+        data = data[4 + length:]
+    return records
+
+
+@pytest.mark.unit
+class TestBinaryFileHandler:
+    def test_records_are_written_in_order(self, tmp_path):
+        handler = _handler(tmp_path, flush_interval=60)
+        _emit(handler, "a", "bb", "ccc")
+        handler.flush()
+
+        assert _read(next(tmp_path.glob('*.gamelog'))) == ["a", "bb", "ccc"]
+        handler.close()
+
+    def test_full_buffer_drops_records(self, tmp_path):
+        handler = _handler(tmp_path, flush_interval=60, max_buffer=20)
+        _emit(handler, "0123456789", "0123456789")
+
+        assert handler.dropped == 1
+        handler.close()
+        assert _read(next(tmp_path.glob('*.gamelog'))) == ["0123456789"]
+
+    def test_rotation(self, tmp_path):
+        handler = _handler(tmp_path, flush_interval=60, max_bytes=10)
+        _emit(handler, "0123456789")
+        handler.flush()
+        _emit(handler, "second")
+        handler.rotate()
+        _emit(handler, "third")
+        handler.close()
+
+        # files rotated within the same second are numbered after the first one
+        files = sorted(tmp_path.glob('*.gamelog'), key=lambda f: int(f.name.split('-')[2]) if f.name.count('-') > 2 else 0)
+        assert [_read(f) for f in files] == [["0123456789"], ["second"], ["third"]]
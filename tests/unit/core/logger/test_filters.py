@@ -0,0 +1,40 @@
+import logging
+import pytest
+
+from neonfc_ssl.core.logger import SamplingFilter, ProtobufFormatter, TRACKING
+from neonfc_ssl.protocols.internal import TrackingProtobuf
+
+
+def _record(name, level, created, msg="frame"):
+    record = logging.LogRecord(name, level, __file__, 1, msg, None, None)
+    record.created = created
+    return record
+
+
+@pytest.mark.unit
+def test_sampling_filter_limits_rate_per_source():
+    sampler = SamplingFilter({TRACKING: 10})
+    times = [0.0, 0.05, 0.1, 0.15, 0.2]
+
+    passed = [sampler.filter(_record('TrackingLayer', TRACKING, t)) for t in times]
+    other_source = sampler.filter(_record('DecisionLayer', TRACKING, 0.05))
+    not_sampled = sampler.filter(_record('TrackingLayer', logging.INFO, 0.05))
+
+    assert passed == [True, False, True, False, True]
+    assert other_source and not_sampled
+
+
+@pytest.mark.unit
+def test_protobuf_formatter_serializes_once():
+    calls = []
+
+    class Structured:
+        def to_proto(self):
+            calls.append(1)
+            return TrackingProtobuf.Tracking()
+
+    record = _record('TrackingLayer', TRACKING, 0.0, Structured())
+    first, second = ProtobufFormatter(), ProtobufFormatter()
+
+    assert first.format(record) == second.format(record)
+    assert len(calls) == 1
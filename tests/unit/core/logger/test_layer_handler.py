@@ -0,0 +1,49 @@
+import logging
+import queue
+import pytest
+
+from neonfc_ssl.core.logger import LayerHandler, ProtobufFormatter, TRACKING
+from neonfc_ssl.protocols.internal import NeonFCProtobuf, TrackingProtobuf
+
+
+class Structured:
+    def to_proto(self):
+        return TrackingProtobuf.Tracking()
+
+
+def _record(level, msg, *args):
+    return logging.LogRecord('TrackingLayer', level, __file__, 1, msg, args, None)
+
+
+@pytest.mark.unit
+class TestLayerHandler:
+    @pytest.fixture
+    def handler(self):
+        return LayerHandler(queue.Queue(), flush_interval=60)
+
+    def test_records_are_batched(self, handler):
+        handler.handle(_record(logging.INFO, "frame %d", 1))
+        handler.handle(_record(logging.INFO, "frame %d", 2))
+        assert handler.queue.empty()
+
+        handler.flush()
+        batch = handler.queue.get_nowait()
+
+        assert [r['msg'] for r in batch] == ["frame 1", "frame 2"]
+        assert all(r['args'] is None for r in batch)
+
+    def test_warnings_are_sent_right_away(self, handler):
+        handler.handle(_record(logging.WARNING, "late"))
+
+        assert len(handler.queue.get_nowait()) == 1
+
+    def test_structured_records_are_serialized_in_place(self, handler):
+        handler.handle(_record(TRACKING, Structured()))
+        handler.flush()
+        record = logging.makeLogRecord(handler.queue.get_nowait()[0])
+
+        assert record.msg == "<Structured>"
+        serialized = ProtobufFormatter().format(record)
+        entry = NeonFCProtobuf.LogEntry.FromString(serialized)
+        assert entry.source == NeonFCProtobuf.Sources.Value('TRACKINGLAYER')
+        assert entry.HasField('tracking')
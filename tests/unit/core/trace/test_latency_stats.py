@@ -0,0 +1,39 @@
+import pytest
+
+from neonfc_ssl.core.trace import FrameTrace, LatencyStats
+
+
+def _trace(frame_id, received, **stages):
+    trace = FrameTrace(frame_id)
+    trace.mark('received', received)
+    for stage, t in stages.items():
+        trace.mark(stage, t)
+    return trace
+
+
+@pytest.mark.unit
+def test_stage_latencies_skip_missing_stages():
+    trace = _trace(1, 1.0, input=1.001, decision=1.006, output=1.010)
+
+    latencies = trace.stage_latencies()
+
+    assert latencies.keys() == {'input', 'decision', 'output', 'total'}
+    assert latencies['decision'] == pytest.approx(0.005)
+    assert latencies['total'] == pytest.approx(0.010)
+
+
+@pytest.mark.unit
+def test_latency_stats_window():
+    stats = LatencyStats(window=100)
+    for i in range(200):
+        # the first 100 frames are slow and must fall out of the window
+        dt = 1.0 if i < 100 else (i - 100) / 1000
+        stats.add(_trace(i + 1, 0.0, output=dt))
+
+    report = {s.stage: s for s in stats.report().stages}
+
+    assert report.keys() == {'output', 'total'}
+    assert report['output'].samples == 100
+    assert report['output'].p50 == pytest.approx(0.0495)
+    assert report['output'].p99 < 0.1
+    assert len(stats.report().to_proto().stages) == 2
@@ -0,0 +1,145 @@
+import pytest
+import numpy as np
+
+from neonfc_ssl.input_layer import data as input_data
+from neonfc_ssl.input_layer.input_codec import InputDataCodec
+from neonfc_ssl.tracking_layer import data as tracking_data
+from neonfc_ssl.tracking_layer.tracking_codec import MatchDataCodec
+from neonfc_ssl.decision_layer import decision_data
+from neonfc_ssl.decision_layer.decision_codec import DecisionDataCodec
+from neonfc_ssl.control_layer import control_data
+from neonfc_ssl.control_layer.control_codec import ControlDataCodec
+from neonfc_ssl.core.trace import FrameTrace
+
+
+def _roundtrip(codec, data):
+    buf = bytearray(codec.size)
+    written = codec.encode_into(data, memoryview(buf))
+    assert written <= codec.size
+    return codec.decode(bytes(buf))
+
+
+def _match_data(ids=(0, 3)):
+    return tracking_data.MatchData(
+        ball=tracking_data.TrackedBall(x=1.0, y=2.0, z=None, vx=0.5, vy=-0.5, vz=None),
+        possession=tracking_data.Possession(
+            my_closest=0, op_closest=None, possession_team='yellow',
+            possession_balance=0.25, contact_start_position=np.array([1., 2.]), recent_balance=-0.5
+        ),
+        game_state=tracking_data.GameState(
+            state=tracking_data.States.FREE_KICK, color='blue', friendly=False, position=(1.5, 3.0)
+        ),
+        field=tracking_data.Geometry(9, 6, 1, 1, 2),
+        robots=[tracking_data.TrackedRobot(
+            id=r_id, color='yellow', x=r_id, y=1.0, theta=0.1, vx=0, vy=0, vtheta=0, missing=False
+        ) for r_id in ids],
+        opposites=[tracking_data.TrackedRobot(
+            id=r_id, color='blue', x=r_id, y=2.0, theta=0.2, vx=None, vy=None, vtheta=None, missing=True
+        ) for r_id in ids],
+        is_yellow=True
+    )
+
+
+@pytest.mark.unit
+def test_input_data_codec():
+    data = input_data.InputData(
+        entities=input_data.Entities(
+            ball=input_data.Ball(x=0.1, y=0.2, vx=0, vy=0, camera_id=2),
+            robots_blue={1: input_data.Robot(id=1, team='blue', x=0, y=0, theta=0)},
+            robots_yellow={2: input_data.Robot(id=2, team='yellow', x=1, y=1, theta=1, vx=1, vy=1, vtheta=1)},
+        ),
+        geometry=input_data.Geometry(9, 6, 1, 1, 2),
+        game_controller=input_data.GameController(True, "PREPARE_KICKOFF_BLUE", None, 'blue'),
+    )
+
+    assert _roundtrip(InputDataCodec, data) == data
+
+
+@pytest.mark.unit
+def test_input_data_codec_without_ball():
+    data = input_data.InputData(
+        entities=input_data.Entities(None, {}, {}),
+        geometry=None,
+        game_controller=input_data.GameController(False, "", (100.0, -200.0), 'yellow'),
+    )
+
+    assert _roundtrip(InputDataCodec, data) == data
+
+
+@pytest.mark.unit
+def test_unchanged_geometry_decodes_to_the_same_object():
+    data = input_data.InputData(
+        entities=input_data.Entities(None, {}, {}),
+        geometry=input_data.Geometry(9, 6, 1, 1, 2, version=3),
+        game_controller=input_data.GameController(False, "", None, 'yellow', command_counter=7),
+    )
+
+    first, second = _roundtrip(InputDataCodec, data), _roundtrip(InputDataCodec, data)
+    assert first.geometry == data.geometry and first.geometry is second.geometry
+    assert first.game_controller.command_counter == 7
+
+
+@pytest.mark.unit
+def test_match_data_codec():
+    data = _match_data()
+    decoded = _roundtrip(MatchDataCodec, data)
+
+    assert decoded.is_yellow
+    assert decoded.field == data.field
+    assert decoded.game_state == data.game_state
+    assert decoded.possession.my_closest == 0 and decoded.possession.op_closest is None
+    assert np.allclose(decoded.possession.contact_start_position, [1., 2.])
+    assert decoded.possession.recent_balance == -0.5
+    assert decoded.ball.z is None
+    assert np.isclose(decoded.ball.speed, data.ball.speed)
+    assert np.allclose(decoded.ball.v_shoot, data.ball.v_shoot)
+    assert decoded.robots.robots == data.robots.robots
+    assert decoded.opposites.robots == data.opposites.robots
+    assert len(decoded.robots.actives) == 2
+    assert len(decoded.opposites.actives) == 0
+
+
+@pytest.mark.unit
+def test_match_data_codec_too_many_robots():
+    with pytest.raises(ValueError):
+        _roundtrip(MatchDataCodec, _match_data(ids=range(17)))
+
+
+@pytest.mark.unit
+def test_decision_data_codec():
+    commands = [
+        decision_data.RobotRubric.still(1),
+        decision_data.RobotRubric(
+            id=0, halt=False, target_pose=(1, 2, 3), kick_speed=(2, 0), avoid_area=True,
+            avoid_opponents=[0, 3], avoid_allies=[15]
+        ),
+    ]
+    decoded = _roundtrip(DecisionDataCodec, decision_data.DecisionData(commands, _match_data()))
+
+    assert decoded.commands == commands
+    assert decoded.world_model.robots.robots == _match_data().robots.robots
+
+
+@pytest.mark.unit
+def test_control_data_codec():
+    data = control_data.ControlData(commands=[
+        control_data.RobotCommand(id=r_id, is_yellow=True, vel_tangent=1, vel_normal=2, vel_angular=3, kick_x=1)
+        for r_id in range(16)
+    ])
+
+    assert _roundtrip(ControlDataCodec, data) == data
+
+
+@pytest.mark.unit
+def test_control_data_codec_with_trace():
+    trace = FrameTrace(42, t_capture=1234.5)
+    trace.mark('received', 10.0)
+    trace.mark('control', 10.01)
+    data = control_data.ControlData(commands=[], trace=trace)
+
+    decoded = _roundtrip(ControlDataCodec, data)
+
+    assert decoded.trace.frame_id == 42
+    assert decoded.trace.t_capture == 1234.5
+    assert decoded.trace.stamp('received') == 10.0
+    assert decoded.trace.stamp('tracking') is None
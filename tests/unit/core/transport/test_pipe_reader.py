@@ -0,0 +1,31 @@
+import pytest
+from multiprocessing import Pipe
+
+from neonfc_ssl.core.transport import PipeReader
+
+
+@pytest.mark.unit
+class TestPipeReader:
+    @pytest.fixture
+    def pipe(self):
+        tail, head = Pipe(duplex=False)
+        return PipeReader(tail), head
+
+    def test_recv_in_order(self, pipe):
+        reader, head = pipe
+        head.send({'frame': 1})
+        head.send({'frame': 2})
+
+        assert reader.recv() == {'frame': 1}
+        assert reader.recv() == {'frame': 2}
+        assert not reader.poll()
+
+    def test_recv_latest(self, pipe):
+        reader, head = pipe
+        for i in range(5):
+            head.send(i)
+
+        assert reader.recv_latest() == 4
+        assert reader.skipped == 4
+        assert reader.dropped == 0
+        assert not reader.poll()
@@ -0,0 +1,89 @@
+import struct
+import pytest
+from multiprocessing import Process
+
+from neonfc_ssl.core.transport import FrameCodec, ShmPipe
+
+_VALUE = struct.Struct('<q')
+
+
+class IntCodec(FrameCodec):
+    size = _VALUE.size
+
+    @classmethod
+    def encode_into(cls, data, buf, offset=0):
+        _VALUE.pack_into(buf, offset, data)
+        return _VALUE.size
+
+    @classmethod
+    def decode(cls, buf, offset=0):
+        return _VALUE.unpack_from(buf, offset)[0]
+
+
+def _produce(writer, n):
+    for i in range(n):
+        writer.send(i)
+
+
+@pytest.mark.unit
+class TestShmRing:
+    @pytest.fixture
+    def pipe(self):
+        reader, writer = ShmPipe(IntCodec, slots=4)
+        yield reader, writer
+        reader._ring.unlink()
+
+    def test_poll_without_data(self, pipe):
+        reader, _ = pipe
+        assert not reader.poll()
+        assert not reader.poll(0.01)
+
+    def test_send_recv_in_order(self, pipe):
+        reader, writer = pipe
+        writer.send(1)
+        writer.send(2)
+
+        assert reader.poll()
+        assert reader.recv() == 1
+        assert reader.recv() == 2
+        assert not reader.poll()
+
+    def test_lapped_reader_skips_overwritten_frames(self, pipe):
+        reader, writer = pipe
+        for i in range(10):
+            writer.send(i)
+
+        # 4 slots, the oldest one may be under rewrite so only the last 3 frames are readable
+        assert reader.recv() == 7
+        assert reader.recv() == 8
+        assert reader.recv() == 9
+        assert not reader.poll()
+        assert reader.dropped == 7
+
+    def test_recv_latest(self, pipe):
+        reader, writer = pipe
+        for i in range(3):
+            writer.send(i)
+
+        assert reader.recv_latest() == 2
+        assert reader.skipped == 2
+        assert reader.dropped == 0
+        assert not reader.poll()
+
+        writer.send(3)
+        assert reader.recv_latest() == 3
+        assert reader.skipped == 2
+
+    def test_minimum_slots(self):
+        with pytest.raises(ValueError):
+            ShmPipe(IntCodec, slots=1)
+
+    def test_cross_process(self, pipe):
+        reader, writer = pipe
+        producer = Process(target=_produce, args=(writer, 3))
+        producer.start()
+
+        received = [reader.recv() for _ in range(3)]
+        producer.join(timeout=5)
+
+        assert received == [0, 1, 2]
@@ -0,0 +1,121 @@
+"""Packets and camera feeds the input unit tests are fed with"""
+import math
+import random
+
+from neonfc_ssl.input_layer.camera_fusion import CameraFusion, CameraFrame
+from neonfc_ssl.input_layer.input_data import Ball, Robot
+from neonfc_ssl.protocols.grSim.ssl_vision_wrapper_pb2 import SSL_WrapperPacket
+from neonfc_ssl.protocols.gc.ssl_vision_wrapper_tracked_pb2 import TrackerWrapperPacket
+from neonfc_ssl.protocols.gc.ssl_gc_referee_message_pb2 import Referee
+from neonfc_ssl.protocols.gc.ssl_gc_common_pb2 import Team
+
+CONFIG = {'side': 'left', 'multicast_ip': '224.5.23.2', 'vision_port': 10006, 'autoref_port': 10010,
+          'game_controller_ip': '224.5.23.1', 'game_controller_port': 10003}
+ROBOTS_PER_TEAM = 11
+
+
+def grsim_packet() -> bytes:
+    packet = SSL_WrapperPacket()
+    frame = packet.detection
+    frame.frame_number, frame.t_capture, frame.t_sent, frame.camera_id = 1, 1.0, 1.001, 0
+    frame.balls.add(confidence=1, x=100, y=-200, z=0, pixel_x=0, pixel_y=0)
+    for robots in (frame.robots_blue, frame.robots_yellow):
+        for i in range(ROBOTS_PER_TEAM):
+            robots.add(confidence=1, robot_id=i, x=100 * i, y=-50 * i, orientation=0.1 * i, pixel_x=0, pixel_y=0)
+    return packet.SerializeToString()
+
+
+def autoref_packet() -> bytes:
+    packet = TrackerWrapperPacket(uuid="test")
+    frame = packet.tracked_frame
+    frame.frame_number, frame.timestamp = 1, 1.0
+    ball = frame.balls.add()
+    ball.pos.x, ball.pos.y, ball.pos.z = 0.1, -0.2, 0
+    ball.vel.x, ball.vel.y, ball.vel.z = 1.0, 0.5, 0
+    for team in (Team.BLUE, Team.YELLOW):
+        for i in range(ROBOTS_PER_TEAM):
+            robot = frame.robots.add(orientation=0.1 * i, vel_angular=0)
+            robot.robot_id.id, robot.robot_id.team = i, team
+            robot.pos.x, robot.pos.y = 0.1 * i, -0.05 * i
+            robot.vel.x, robot.vel.y = 0.2, 0
+    return packet.SerializeToString()
+
+
+def referee_packet() -> bytes:
+    packet = Referee(packet_timestamp=1, stage=Referee.NORMAL_FIRST_HALF, command=Referee.DIRECT_FREE_BLUE,
+                     command_counter=3, command_timestamp=1)
+    for team in (packet.yellow, packet.blue):
+        team.name, team.score, team.red_cards, team.yellow_cards = "team", 0, 0, 0
+        team.timeouts, team.timeout_time, team.goalkeeper = 4, 300, 0
+    packet.designated_position.x, packet.designated_position.y = 1000, -500
+    return packet.SerializeToString()
+
+
+FIELD = (9.0, 6.0)  # m
+OVERLAP = 0.3  # m, each camera sees this far into its neighbours
+RATE = 60  # Hz, per camera
+NOISE = 0.005  # m
+GRIDS = {4: (2, 2), 8: (4, 2)}
+
+
+def truth(t: float) -> tuple[tuple[float, float], dict[tuple[str, int], tuple[float, float, float]]]:
+    """Ball and robot (team, id) positions at time t"""
+    ball = (3.5 * math.cos(0.8 * t), 2.5 * math.sin(1.1 * t))
+    robots = {}
+    for team, sign in (('blue', -1), ('yellow', 1)):
+        for i in range(ROBOTS_PER_TEAM):
+            phase = 2 * math.pi * i / ROBOTS_PER_TEAM
+            cx, cy = sign * (0.5 + 3.5 * (i % 3) / 2), 2.4 * math.sin(phase)
+            x, y = cx + 0.4 * math.cos(1.5 * t + phase), cy + 0.4 * math.sin(1.5 * t + phase)
+            robots[team, i] = (x, y, 1.5 * t + phase)
+    return ball, robots
+
+
+def camera_frames(cameras: int, duration: float, seed: int = 0):
+    """Yields the frames of every camera in capture order"""
+    rng = random.Random(seed)
+    columns, rows = GRIDS[cameras]
+    width, height = FIELD[0] / columns, FIELD[1] / rows
+    views = []
+    for c in range(cameras):
+        x0, y0 = -FIELD[0] / 2 + (c % columns) * width, -FIELD[1] / 2 + (c // columns) * height
+        views.append((x0 - OVERLAP, y0 - OVERLAP, x0 + width + OVERLAP, y0 + height + OVERLAP))
+    phases = [rng.uniform(0, 1 / RATE) for _ in range(cameras)]
+
+    captures = sorted((k / RATE + phases[c], c) for c in range(cameras) for k in range(int(duration * RATE)))
+    for t, c in captures:
+        x0, y0, x1, y1 = views[c]
+        (bx, by), robots = truth(t)
+        frame = CameraFrame(c, t)
+        if x0 <= bx <= x1 and y0 <= by <= y1:
+            frame.balls.append(Ball(x=bx + rng.gauss(0, NOISE), y=by + rng.gauss(0, NOISE),
+                                    confidence=rng.uniform(0.7, 1), camera_id=c))
+        for (team, i), (x, y, theta) in robots.items():
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                getattr(frame, f"robots_{team}")[i] = Robot(
+                    id=i, team=team, x=x + rng.gauss(0, NOISE), y=y + rng.gauss(0, NOISE),
+                    theta=theta + rng.gauss(0, 0.01), timestamp=t, confidence=rng.uniform(0.7, 1), camera_id=c,
+                )
+        yield frame
+
+
+def fused(frames, fusion: CameraFusion):
+    for frame in frames:
+        if (entities := fusion.add(frame)) is not None:
+            yield fusion.t_capture, entities
+
+
+def errors(merged) -> tuple[int, float, float]:
+    """Frames, mean robot error and mean ball error, in meters"""
+    count, robot_error, robot_count, ball_error = 0, 0.0, 0, 0.0
+    for t, entities in merged:
+        (bx, by), robots = truth(t)
+        for team in ('blue', 'yellow'):
+            for i, robot in getattr(entities, f"robots_{team}").items():
+                x, y, _ = robots[team, i]
+                robot_error += math.hypot(robot.x - x, robot.y - y)
+                robot_count += 1
+        if entities.ball is not None:
+            ball_error += math.hypot(entities.ball.x - bx, entities.ball.y - by)
+        count += 1
+    return count, robot_error / max(robot_count, 1), ball_error / max(count, 1)
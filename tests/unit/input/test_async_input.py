@@ -0,0 +1,71 @@
+import logging
+import socket
+import time
+import pytest
+
+from .fixture import CONFIG, grsim_packet, referee_packet
+from neonfc_ssl.input_layer import InputLayer
+from neonfc_ssl.input_layer.sockets import GrSimVision
+from neonfc_ssl.input_layer.sockets.async_input import AsyncInput
+from neonfc_ssl.input_layer.sockets.ssl_game_controller import SSLGameControllerReferee
+
+
+def _local_socket():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(('127.0.0.1', 0))
+    return sock
+
+
+def _until(condition, timeout=2.0):
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.mark.unit
+def test_async_input_serves_every_source_and_reports_lost_feeds(caplog):
+    logger = logging.getLogger("test")
+    vision, referee = GrSimVision(CONFIG, logger), SSLGameControllerReferee(CONFIG, logger)
+    # plain local sockets instead of the multicast groups
+    vision.socket_factory = referee.socket_factory = _local_socket
+
+    async_input = AsyncInput({'vision': vision, 'referee': referee}, logger, feed_timeout=0.2)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    with caplog.at_level(logging.WARNING, logger="test"):
+        async_input.start()
+        assert _until(lambda: hasattr(vision, 'vision_sock') and hasattr(referee, 'referee_sock'))
+
+        sender.sendto(grsim_packet(), vision.vision_sock.getsockname())
+        frame = vision.wait_frame(timeout=2)
+        assert frame is not None and len(frame.entities.robots_blue) == 11
+
+        # the referee hasn't sent anything yet
+        assert _until(lambda: 'referee' in async_input.lost)
+        assert "referee feed" in caplog.text
+
+        sender.sendto(referee_packet(), referee.referee_sock.getsockname())
+        assert _until(lambda: 'referee' not in async_input.lost)
+        assert referee.get_command() == 'DIRECT_FREE_BLUE'
+
+    async_input.stop()
+    sender.close()
+
+
+@pytest.mark.unit
+def test_input_layer_stop_closes_the_event_loop_and_sockets():
+    layer = InputLayer({**CONFIG, 'use_ref_vision': False, 'backend': 'asyncio'}, None)
+    for source in layer.sources.values():
+        source.socket_factory = _local_socket
+    # what _start does for the asyncio backend, without waiting for a geometry
+    layer.async_input = AsyncInput(layer.sources, layer.logger)
+    layer.async_input.start()
+    assert _until(lambda: all(source.running for source in layer.sources.values()))
+
+    layer.stop_inline()
+
+    assert not layer.async_input.is_alive()
+    for source in layer.sources.values():
+        assert not source.running
+        assert source.receiver.sock.fileno() == -1  # closed
+    layer.close()
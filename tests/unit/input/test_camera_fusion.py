@@ -0,0 +1,80 @@
+import math
+import pytest
+
+from .fixture import camera_frames, fused, errors
+from neonfc_ssl.input_layer.camera_fusion import CameraFusion, CameraFrame
+from neonfc_ssl.input_layer.input_data import Ball, Robot
+
+
+def _prime(fusion, t=0.0):
+    """Makes cameras 0 and 1 known at time t, with cycles starting at camera 0"""
+    for camera, dt in ((0, -0.2), (1, -0.2), (0, -0.199)):
+        fusion.add(CameraFrame(camera, t + dt))
+
+
+def _robot(x, theta=0.0, confidence=1.0, camera_id=0):
+    return Robot(id=0, team='blue', x=x, y=0, theta=theta, confidence=confidence, camera_id=camera_id)
+
+
+@pytest.mark.unit
+class TestCameraFusion:
+    def test_one_frame_per_cycle(self):
+        fusion = CameraFusion()
+        assert fusion.add(CameraFrame(0, 1.0)) is not None  # a single camera is a whole cycle
+
+        assert fusion.add(CameraFrame(1, 1.005)) is None  # a new camera, waits for the rest of the cycle
+        assert fusion.add(CameraFrame(0, 1.016)) is not None
+        assert fusion.add(CameraFrame(1, 1.021)) is None
+        assert fusion.add(CameraFrame(0, 1.033)) is not None
+
+    def test_a_camera_reporting_twice_ends_the_cycle(self):
+        fusion = CameraFusion()
+        _prime(fusion, 1.0)
+
+        assert fusion.add(CameraFrame(0, 1.0)) is None
+        assert fusion.add(CameraFrame(0, 1.016)) is not None  # camera 1 missed the cycle
+        assert fusion.t_capture == 1.0
+
+    def test_silent_cameras_are_dropped(self):
+        fusion = CameraFusion(camera_timeout=0.5)
+        fusion.add(CameraFrame(0, 1.0, robots_blue={0: _robot(1.0)}))
+        fused = fusion.add(CameraFrame(1, 2.0))
+        assert fused is not None and fused.robots_blue == {}
+
+    def test_overlapping_detections_are_merged_by_confidence(self):
+        fusion = CameraFusion()
+        _prime(fusion, 2.0)
+
+        fusion.add(CameraFrame(0, 2.0, robots_blue={0: _robot(1.0, theta=math.pi - 0.1, confidence=0.75)}))
+        fused = fusion.add(CameraFrame(1, 2.0, robots_blue={0: _robot(2.0, theta=-math.pi + 0.1, confidence=0.25,
+                                                                      camera_id=1)}))
+        robot = fused.robots_blue[0]
+        assert robot.x == pytest.approx(1.25)
+        assert abs(robot.theta) == pytest.approx(math.pi - 0.05, abs=1e-3)  # averaged across the wrap around
+        assert (robot.confidence, robot.camera_id, robot.timestamp) == (0.75, 0, 2.0)
+
+    def test_detections_are_aligned_to_the_newest_capture(self):
+        fusion = CameraFusion()
+        _prime(fusion, 1.0)
+        for t, x in ((1.0, 1.0), (1.05, 1.05)):  # 1 m/s
+            fusion.add(CameraFrame(0, t, robots_blue={0: _robot(x)}))
+            fusion.add(CameraFrame(1, t + 0.01))
+
+        fused = fusion.add(CameraFrame(0, 1.1, robots_blue={0: _robot(1.1)}))
+        assert fused is None  # camera 1 still has to report
+        fused = fusion.add(CameraFrame(1, 1.11))
+        assert fused.robots_blue[0].x == pytest.approx(1.11)
+
+    def test_most_confident_ball_cluster_wins(self):
+        fusion = CameraFusion()
+        balls = [Ball(x=0, y=0, confidence=0.9), Ball(x=0.05, y=0, confidence=0.5), Ball(x=3, y=0, confidence=1.0)]
+        ball = fusion.add(CameraFrame(0, 1.0, balls=balls)).ball
+        assert ball.x == pytest.approx(0.05 * 0.5 / 1.4)
+
+        assert fusion.add(CameraFrame(0, 1.016)).ball is ball  # no camera sees it, it stays where it was
+
+    @pytest.mark.parametrize("cameras", [4, 8])
+    def test_synthetic_feed(self, cameras):
+        count, robot_error, ball_error = errors(fused(camera_frames(cameras, duration=1.0), CameraFusion()))
+        assert count == pytest.approx(60, abs=1)
+        assert robot_error < 0.01 and ball_error < 0.02
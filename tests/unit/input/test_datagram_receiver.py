@@ -0,0 +1,70 @@
+import socket
+import pytest
+
+from neonfc_ssl.input_layer.sockets import datagram_receiver
+from neonfc_ssl.input_layer.sockets.datagram_receiver import DatagramReceiver, read_field
+
+
+@pytest.fixture
+def sockets():
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(('127.0.0.1', 0))
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender.connect(receiver.getsockname())
+    yield receiver, sender
+    receiver.close()
+    sender.close()
+
+
+@pytest.mark.unit
+class TestDatagramReceiver:
+    def test_drains_queued_packets(self, sockets):
+        sock, sender = sockets
+        receiver = DatagramReceiver(sock, slots=4)
+        for i in range(6):
+            sender.send(bytes([i]))
+
+        # only the last 4 fit in the slots
+        assert [bytes(p) for p in receiver.receive()] == [bytes([i]) for i in range(2, 6)]
+        assert (receiver.received, receiver.dropped) == (6, 2)
+
+        sender.send(b'\x09')
+        assert [bytes(p) for p in receiver.receive()] == [b'\x09']
+
+    def test_newest_packet_per_key(self, sockets):
+        sock, sender = sockets
+        receiver = DatagramReceiver(sock)
+        for packet in (b'a1', b'b1', b'a2', b'x', b'a3', b'x'):
+            sender.send(packet)
+
+        packets = receiver.receive(key=lambda p: None if bytes(p) == b'x' else bytes(p[:1]))
+        assert [bytes(p) for p in packets] == [b'b1', b'x', b'a3', b'x']
+        assert receiver.dropped == 2
+
+    @pytest.mark.parametrize('timeout', [0.0, 0.5, None])
+    def test_drain_keeps_the_socket_mode(self, sockets, monkeypatch, timeout):
+        monkeypatch.setattr(datagram_receiver, '_MSG_DONTWAIT', 0)  # platforms without it toggle the socket mode
+        sock, sender = sockets
+        sock.settimeout(timeout)
+        receiver = DatagramReceiver(sock)
+        for packet in (b'a', b'b'):
+            sender.send(packet)
+
+        assert [bytes(p) for p in receiver.receive()] == [b'a', b'b']
+        assert sock.gettimeout() == timeout
+
+    def test_late_packets(self):
+        receiver = DatagramReceiver(None)
+        assert not receiver.is_late(0, 10.0)
+        assert not receiver.is_late(1, 9.0)
+        assert receiver.is_late(0, 9.5)
+        assert not receiver.is_late(0, 2.0)  # clock restarted
+        assert receiver.late == 1
+
+    def test_read_field(self):
+        # field 1 = varint 300, field 2 = "hi", field 3 = fixed64, field 4 = varint 7
+        buf = bytes([0x08, 0xac, 0x02, 0x12, 2]) + b'hi' + bytes([0x19]) + bytes(8) + bytes([0x20, 7])
+        assert read_field(buf, 1) == 300
+        assert read_field(buf, 2) == (5, 7)
+        assert read_field(buf, 4) == 7
+        assert read_field(buf, 5) is None
@@ -0,0 +1,61 @@
+import logging
+import threading
+import time
+import pytest
+
+from .fixture import CONFIG, grsim_packet
+from neonfc_ssl.input_layer.input_data import Entities
+from neonfc_ssl.input_layer.sockets import GrSimVision
+from neonfc_ssl.input_layer.sockets.frame_handoff import FrameHandoff, VisionFrame
+from neonfc_ssl.protocols.grSim.ssl_vision_wrapper_pb2 import SSL_WrapperPacket
+
+
+def _frame(t):
+    return VisionFrame(Entities(None, {}, {}), received=t, t_capture=t)
+
+
+@pytest.mark.unit
+class TestFrameHandoff:
+    def test_take_returns_the_newest_frame_once(self):
+        handoff = FrameHandoff()
+        assert handoff.take(timeout=0) is None
+
+        handoff.publish(_frame(1))
+        handoff.publish(_frame(2))
+        assert handoff.pending
+        assert handoff.take(timeout=0).t_capture == 2
+        assert not handoff.pending
+        assert handoff.take(timeout=0) is None
+        assert handoff.latest().t_capture == 2
+
+    def test_waiter_is_woken_up(self):
+        handoff = FrameHandoff()
+        published = _frame(1)
+
+        def publish():
+            time.sleep(0.05)  # the waiter is most likely blocked by now
+            handoff.publish(published)
+
+        publisher = threading.Thread(target=publish)
+        publisher.start()
+        frame = handoff.take(timeout=5)  # None once timed out
+        publisher.join()
+
+        assert frame is published
+        assert handoff.take(timeout=0) is None
+
+    def test_published_snapshot_is_not_updated_afterwards(self):
+        vision = GrSimVision(CONFIG, logging.getLogger("test"))
+        packet = SSL_WrapperPacket.FromString(grsim_packet())
+        vision.update_detection(packet)
+        vision.publish_frame()
+        frame = vision.wait_frame(timeout=0)
+
+        packet.detection.t_capture = 2.0
+        packet.detection.robots_blue[0].x = 500
+        packet.detection.robots_blue.add(confidence=1, robot_id=15, x=0, y=0, pixel_x=0, pixel_y=0)
+        vision.update_detection(packet)
+
+        assert frame.entities.robots_blue[0].x == 0
+        assert 15 not in frame.entities.robots_blue
+        assert vision.get_last_frame() is frame.entities
@@ -0,0 +1,89 @@
+import logging
+import pytest
+
+from .fixture import CONFIG, grsim_packet, autoref_packet, referee_packet
+from neonfc_ssl.input_layer.sockets import GrSimVision, AutoRefVision
+from neonfc_ssl.input_layer.sockets.ssl_game_controller import SSLGameControllerReferee
+from neonfc_ssl.protocols.grSim.ssl_vision_wrapper_pb2 import SSL_WrapperPacket
+from neonfc_ssl.protocols.gc.ssl_vision_wrapper_tracked_pb2 import TrackerWrapperPacket
+from neonfc_ssl.protocols.gc.ssl_gc_referee_message_pb2 import Referee
+
+logger = logging.getLogger("test")
+
+
+@pytest.mark.unit
+class TestSockets:
+    def test_grsim_detection(self):
+        vision = GrSimVision(CONFIG, logger)
+        packet = SSL_WrapperPacket.FromString(grsim_packet())
+        packet.geometry.field.field_length, packet.geometry.field.field_width = 9000, 6000
+        packet.geometry.field.goal_width, packet.geometry.field.goal_depth = 1000, 180
+        packet.geometry.field.boundary_width = 300
+
+        assert vision.update_detection(packet)
+        robot = vision.raw_detection.robots_yellow[3]
+        assert (robot.x, robot.y, robot.theta) == pytest.approx((0.3, -0.15, 0.3))
+        assert (vision.raw_detection.ball.x, vision.raw_detection.ball.y) == pytest.approx((0.1, -0.2))
+        assert vision.last_t_capture == 1.0
+        assert vision.raw_geometry.field_length == 9
+        assert vision.raw_geometry.penalty_depth == 1  # default when vision doesn't send it
+
+    def test_grsim_packet_without_detection(self):
+        assert not GrSimVision(CONFIG, logger).update_detection(SSL_WrapperPacket())
+
+    def test_autoref_detection(self):
+        vision = AutoRefVision(CONFIG, logger)
+
+        assert vision.update_detection(TrackerWrapperPacket.FromString(autoref_packet()))
+        assert set(vision.raw_detection.robots_blue) == set(vision.raw_detection.robots_yellow) == set(range(11))
+        robot = vision.raw_detection.robots_blue[2]
+        assert (robot.x, robot.y, robot.vx) == pytest.approx((0.2, -0.1, 0.2))
+        assert vision.raw_detection.ball.vx == pytest.approx(1.0)
+
+    def test_referee(self):
+        referee = SSLGameControllerReferee(CONFIG, logger)
+        assert not referee.can_play()
+        assert referee.get_designated_position() is None
+
+        assert referee.update_referee(referee_packet())
+        data = referee.get_data()
+        assert data.can_play and data.state == 'DIRECT_FREE_BLUE' and data.team == 'blue'
+        assert data.designated_position == (1000, -500)
+
+    def test_referee_only_parses_new_commands(self):
+        referee = SSLGameControllerReferee(CONFIG, logger)
+        commands = []
+        referee.subscribe(commands.append)
+
+        packet = Referee.FromString(referee_packet())
+        assert referee.update_referee(packet.SerializeToString())
+        data = referee.get_data()
+
+        packet.packet_timestamp += 100_000
+        packet.command = Referee.STOP  # never sent without a new counter, proves the packet isn't parsed
+        assert not referee.update_referee(packet.SerializeToString())
+        assert referee.get_data() is data
+
+        packet.command_counter += 1
+        assert referee.update_referee(packet.SerializeToString())
+        assert referee.get_data().state == 'STOP' and referee.get_data().command_counter == 4
+
+        packet.packet_timestamp, packet.command = 0, Referee.HALT  # the game controller restarted
+        assert referee.update_referee(packet.SerializeToString())
+        assert [gc.state for gc in commands] == ['DIRECT_FREE_BLUE', 'STOP', 'HALT']
+
+    def test_grsim_geometry_version(self):
+        vision = GrSimVision(CONFIG, logger)
+        packet = SSL_WrapperPacket()
+        field = packet.geometry.field
+        field.field_length, field.field_width, field.goal_width, field.goal_depth = 9000, 6000, 1000, 180
+        field.boundary_width = 300
+
+        vision.update_detection(packet)
+        geometry = vision.get_geometry()
+        vision.update_detection(packet)
+        assert vision.get_geometry() is geometry and geometry.version == 0
+
+        field.field_length, field.field_width = 12000, 9000
+        vision.update_detection(packet)
+        assert vision.get_geometry().field_length == 12 and vision.get_geometry().version == 1
@@ -0,0 +1,108 @@
+import logging
+import socket
+import time
+from functools import partial
+import pytest
+
+from .fixture import CONFIG, grsim_packet
+from neonfc_ssl.input_layer import InputLayer
+from neonfc_ssl.input_layer.sockets import GrSimVision
+from neonfc_ssl.input_layer.sockets.datagram_receiver import DatagramReceiver
+from neonfc_ssl.input_layer.sockets.udp_capture import (UdpRecorder, UdpReplay, read_capture, CAPTURE_MAGIC,
+                                                        CAPTURE_RECORD, FEEDS)
+from neonfc_ssl.protocols.grSim.ssl_vision_wrapper_pb2 import SSL_WrapperPacket
+
+logger = logging.getLogger("test")
+
+
+def _capture(path, records):
+    with open(path, 'wb') as f:
+        f.write(CAPTURE_MAGIC)
+        for t, feed, data in records:
+            f.write(CAPTURE_RECORD.pack(t, FEEDS.index(feed), len(data)) + data)
+
+
+def _vision_packet(t_capture):
+    packet = SSL_WrapperPacket.FromString(grsim_packet())
+    packet.detection.t_capture = t_capture
+    return packet.SerializeToString()
+
+
+@pytest.mark.unit
+class TestUdpCapture:
+    def test_records_what_the_receiver_reads(self, tmp_path):
+        path = tmp_path / "match.udp"
+        reader, writer = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        receiver = DatagramReceiver(reader)
+
+        with UdpRecorder(path) as recorder:
+            receiver.tap = recorder.tap('referee')
+            for data in (b"a", b"bb", b"ccc"):
+                writer.send(data)
+            assert len(receiver.receive(key=lambda _: 0)) == 1  # older packets are dropped, but still recorded
+
+        records = list(read_capture(path))
+        assert [(feed, data) for _, feed, data in records] == [('referee', b"a"), ('referee', b"bb"),
+                                                               ('referee', b"ccc")]
+        assert records[0][0] <= records[1][0] <= records[2][0]
+
+    def test_input_layer_stop_flushes_the_capture(self, tmp_path):
+        path = tmp_path / "match.udp"
+        layer = InputLayer({**CONFIG, 'use_ref_vision': False}, None)
+        layer.recorder = UdpRecorder(path)
+        layer.recorder.tap('vision')(b"last")
+
+        layer.stop_inline()
+        layer.recorder.tap('vision')(b"after close")  # a receiver still running, ignored
+
+        assert [(feed, data) for _, feed, data in read_capture(path)] == [('vision', b"last")]
+        layer.close()
+
+    def test_truncated_record_is_ignored(self, tmp_path, caplog):
+        path = tmp_path / "match.udp"
+        _capture(path, [(0.0, 'vision', b"first"), (0.1, 'vision', b"second")])
+        with open(path, 'r+b') as f:
+            f.truncate(path.stat().st_size - 2)
+
+        with caplog.at_level(logging.WARNING):
+            assert [data for *_, data in read_capture(path, logger)] == [b"first"]
+        assert "truncated" in caplog.text
+
+    def test_not_a_capture(self, tmp_path):
+        path = tmp_path / "match.udp"
+        path.write_bytes(b"garbage")
+        with pytest.raises(ValueError):
+            list(read_capture(path))
+
+    def test_replay_as_fast_as_possible_into_the_vision(self, tmp_path):
+        path = tmp_path / "match.udp"
+        # recorded a second apart, replayed back to back
+        _capture(path, [(i, 'vision', _vision_packet(i + 1.0)) for i in range(5)])
+
+        replay = UdpReplay(path, speed=0)
+        vision = GrSimVision(CONFIG, logger)
+        vision.socket_factory = partial(replay.feed_socket, 'vision')
+        vision.open_socket()
+        replay.start()
+
+        captures = []
+        for _ in range(5):
+            vision.poll()  # one packet each, the next one is only sent once this one was read
+            captures.append(vision.wait_frame(timeout=1).t_capture)
+
+        assert captures == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert replay.done.wait(1) and replay.sent == 5
+
+    def test_replay_speed(self, tmp_path):
+        path = tmp_path / "match.udp"
+        _capture(path, [(0.0, 'referee', b"a"), (0.2, 'autoref', b"b"), (0.2, 'referee', b"c")])
+
+        replay = UdpReplay(path, speed=2, feeds=('referee',))
+        sock = replay.feed_socket('referee')
+        replay.start()
+
+        start = time.monotonic()
+        assert sock.recv(16) == b"a"
+        assert sock.recv(16) == b"c"  # the autoref isn't replayed
+        assert time.monotonic() - start == pytest.approx(0.1, abs=0.05)
+        replay.stop()
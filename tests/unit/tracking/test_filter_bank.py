@@ -0,0 +1,54 @@
+import math
+import numpy as np
+import pytest
+from neonfc_ssl.tracking_layer.filter_bank import KalmanBank
+
+DT = 1 / 60
+
+
+def _run(bank, frames, speed, observed=None, noise=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    observed = np.ones(bank.size, dtype=bool) if observed is None else observed
+    for i in range(frames):
+        truth = np.asarray(speed) * i * DT
+        bank.step(truth + rng.normal(0, noise, truth.shape), observed, DT)
+    return np.asarray(speed) * (frames - 1) * DT
+
+
+@pytest.mark.unit
+class TestKalmanBank:
+    def test_estimates_speeds_of_every_object(self):
+        bank = KalmanBank(3)
+        speed = np.array([[1.0, 0.0, 0.0], [0.0, -2.0, 1.0], [0.5, 0.5, -3.0]])
+        truth = _run(bank, 120, speed, noise=0.003)
+
+        assert np.allclose(bank.speeds, speed, atol=0.15)
+        assert np.allclose(bank.positions[:, :2], truth[:, :2], atol=0.01)
+
+    def test_missing_objects_are_predicted(self):
+        bank = KalmanBank(2)
+        _run(bank, 60, [[1.0, 0, 0], [1.0, 0, 0]])
+        before = bank.positions.copy()
+
+        bank.step(np.zeros((2, 3)), np.array([True, False]), DT)
+        assert bank.positions[1, 0] == pytest.approx(before[1, 0] + DT, abs=1e-3)  # kept moving
+        assert bank.positions[0, 0] < before[0, 0]  # pulled towards its (wrong) measurement
+
+    def test_restarts_after_being_lost(self):
+        bank = KalmanBank(1, reset_after=5)
+        _run(bank, 60, [[1.0, 0, 0]])
+        for _ in range(6):
+            bank.step(np.zeros((1, 3)), np.array([False]), DT)
+
+        bank.step(np.array([[3.0, 2.0, 1.0]]), np.array([True]), DT)
+        assert bank.positions[0].tolist() == [3.0, 2.0, 1.0]
+        assert bank.speeds[0].tolist() == [0, 0, 0]
+
+    def test_orientation_wraps_around(self):
+        bank = KalmanBank(1)
+        for i in range(60):
+            theta = (math.pi - 0.5 + 2.0 * i * DT + math.pi) % (2 * math.pi) - math.pi
+            bank.step(np.array([[0, 0, theta]]), np.array([True]), DT)
+
+        assert bank.speeds[0, 2] == pytest.approx(2.0, abs=0.1)
+        assert -math.pi <= bank.positions[0, 2] <= math.pi
@@ -0,0 +1,69 @@
+import pickle
+import pytest
+import numpy as np
+from neonfc_ssl.tracking_layer import data as tracking_data
+from neonfc_ssl.tracking_layer.frame_features import FEATURE_STATS
+
+
+def _robot(robot_id, color, x, y, missing=False):
+    return tracking_data.TrackedRobot(id=robot_id, color=color, x=x, y=y, theta=0, vx=0, vy=0, vtheta=0,
+                                      missing=missing)
+
+
+def _match_data():
+    return tracking_data.MatchData(
+        ball=tracking_data.TrackedBall(x=4.0, y=3.0, vx=0, vy=0),
+        possession=tracking_data.Possession(None, None, 'blue', 0, np.array([0., 0.])),
+        game_state=tracking_data.GameState(state=tracking_data.States.RUN),
+        field=tracking_data.Geometry(9, 6, 1, 1, 2),
+        robots=[_robot(0, 'blue', 1, 3), _robot(1, 'blue', 4, 4), _robot(2, 'blue', 4, 3.5, missing=True)],
+        opposites=[_robot(0, 'yellow', 7, 3), _robot(4, 'yellow', 4, 1)],
+        is_yellow=False
+    )
+
+
+@pytest.mark.unit
+def test_distances():
+    features = _match_data().features
+
+    assert features.distances.shape == (6, 6)
+    assert np.allclose(features.ball_distances('robots'), [3, 1, 0.5])
+    assert np.allclose(features.ball_distances('opposites'), [3, 2])
+    assert np.allclose(features.robot_opposite_distances[1], [np.sqrt(10), 3])
+
+
+@pytest.mark.unit
+def test_closest_to_ball_skips_inactive_robots():
+    features = _match_data().features
+
+    assert features.closest_to_ball('robots').id == 1
+    assert features.closest_to_ball('opposites').id == 4
+
+
+@pytest.mark.unit
+def test_times_to_ball():
+    data = _match_data()
+    times = data.features.times_to_ball('robots')
+
+    assert times[1] == pytest.approx(data.robots[1].time_to_ball(data.ball))
+    assert times[2] == np.inf
+
+
+@pytest.mark.unit
+def test_features_are_computed_once_per_frame():
+    data = _match_data()
+    FEATURE_STATS.reset()
+
+    data.features.closest_to_ball('opposites')  # and the distances to the ball it needs
+    assert (FEATURE_STATS.hits, FEATURE_STATS.misses) == (0, 2)
+
+    data.features.closest_to_ball('opposites')
+    data.features.ball_distances('opposites')
+    assert (FEATURE_STATS.hits, FEATURE_STATS.misses) == (2, 2)
+    assert 'features' not in pickle.loads(pickle.dumps(data)).__dict__
+
+
+@pytest.mark.unit
+def test_unknown_team():
+    with pytest.raises(ValueError):
+        _match_data().features.closest_to_ball('referees')
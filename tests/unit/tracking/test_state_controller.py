@@ -0,0 +1,31 @@
+import pytest
+from neonfc_ssl.input_layer.input_data import GameController
+from neonfc_ssl.tracking_layer.state_controller import StateController
+from neonfc_ssl.tracking_layer.tracking_data import TrackedBall, States
+
+
+def _ref(state, counter):
+    return GameController(can_play=True, state=state, designated_position=None, team='blue', command_counter=counter)
+
+
+@pytest.mark.unit
+class TestStateController:
+    def test_unchanged_command_is_skipped(self):
+        controller = StateController()
+        ball = TrackedBall(x=0, y=0, vx=0, vy=0)
+
+        data = controller.update(_ref('HALT', 1), ball, 'blue')
+        assert controller.update(_ref('HALT', 1), ball, 'blue') is data
+
+        assert controller.update(_ref('STOP', 2), ball, 'blue').state == States.STOP
+        assert controller.update(_ref('FORCE_START', 3), ball, 'blue').state == States.RUN
+
+    def test_states_left_on_their_own_are_always_updated(self):
+        controller = StateController()
+        ball = TrackedBall(x=0, y=0, vx=0, vy=0)
+        for counter, command in enumerate(('STOP', 'DIRECT_FREE_BLUE')):
+            controller.update(_ref(command, counter), ball, 'blue')
+        assert controller.update(_ref('DIRECT_FREE_BLUE', 1), ball, 'blue').state == States.FREE_KICK
+
+        # the ball moving lets the game run without a new command
+        assert controller.update(_ref('DIRECT_FREE_BLUE', 1), TrackedBall(x=1, y=0, vx=0, vy=0), 'blue').state == States.RUN
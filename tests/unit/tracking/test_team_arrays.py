@@ -0,0 +1,64 @@
+import pickle
+import pytest
+import numpy as np
+from neonfc_ssl.tracking_layer import tracking_data
+from neonfc_ssl.tracking_layer.tracking_data import TrackedRobot, TrackedBall, RobotList
+
+
+def _robot(robot_id, x, y, missing=False):
+    return TrackedRobot(id=robot_id, color='blue', x=x, y=y, theta=0.5, vx=1, vy=-1, vtheta=0, missing=missing)
+
+
+@pytest.mark.unit
+def test_team_arrays_match_the_robots():
+    robots = RobotList([_robot(3, 1, 2), _robot(5, 3, 4, missing=True)])
+    arrays = robots.arrays
+
+    assert arrays.positions.flags.c_contiguous and arrays.positions.dtype == np.float64
+    assert np.array_equal(arrays.positions, [[1, 2], [3, 4]])
+    assert np.array_equal(arrays.velocities, [[1, -1], [1, -1]])
+    assert np.array_equal(arrays.thetas, [0.5, 0.5])
+    assert np.array_equal(arrays.active, [True, False])
+    assert arrays.index == {3: 0, 5: 1}
+    assert np.allclose(arrays.sq_distances(TrackedBall(x=1, y=0, vx=0, vy=0)), [4, 20])
+    assert robots.arrays is arrays  # built once
+
+
+@pytest.mark.unit
+def test_team_arrays_empty_team():
+    arrays = RobotList([]).arrays
+    assert arrays.positions.shape == (0, 2)
+    assert arrays.sq_distances((0, 0)).shape == (0,)
+
+
+@pytest.mark.unit
+def test_team_arrays_are_not_pickled():
+    robots = RobotList([_robot(0, 1, 2)])
+    robots.arrays
+
+    restored = pickle.loads(pickle.dumps(robots))
+    assert 'arrays' not in restored.__dict__
+    assert np.array_equal(restored.arrays.positions, [[1, 2]])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('seed', range(5))
+def test_times_to_ball_match_time_to_ball(seed):
+    rng = np.random.default_rng(seed)
+    robots = RobotList([_robot(i, *rng.uniform((0, 0), (9, 6)), missing=rng.random() < 0.2) for i in range(16)])
+    ball = TrackedBall(*rng.uniform((0, 0), (9, 6)), vx=rng.normal(0, 3), vy=rng.normal(0, 3))
+
+    expected = [r.time_to_ball(ball) if not r.missing else np.inf for r in robots.robots]
+    assert np.allclose(robots.arrays.times_to_ball(ball), expected, rtol=0, atol=1e-9)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('scalar_tail', [0, tracking_data.INTERCEPT_SCALAR_TAIL])
+def test_times_to_ball_of_robots_that_never_converge(monkeypatch, scalar_tail):
+    monkeypatch.setattr(tracking_data, 'INTERCEPT_SCALAR_TAIL', scalar_tail)
+    # the ball stops short of the first robot, its times alternate between two values until the iteration limit
+    robots = RobotList([_robot(0, 7.18, 7.23), _robot(1, 1.0, 1.0), _robot(2, 5.0, 5.0)])
+    ball = TrackedBall(x=2.0, y=7.53, vx=2.88, vy=-0.77)
+
+    expected = [r.time_to_ball(ball) for r in robots.robots]
+    assert np.allclose(robots.arrays.times_to_ball(ball), expected, rtol=0, atol=1e-9)